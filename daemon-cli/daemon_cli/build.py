@@ -12,7 +12,7 @@ from daemon_cli.generators import (
 )
 from daemon_cli.models import BuildResult
 from daemon_cli.parsers import discover_annotated_exports
-from daemon_cli.schema import SchemaValidationError, validate_manifest_schema
+from daemon_cli.schema import DEFAULT_SCHEMA_PATH, SchemaValidationError, validate_manifest_schema
 
 
 class BuildError(RuntimeError):
@@ -41,6 +41,12 @@ def run_build(firmware_dir: Path) -> BuildResult:
 
     tokens = [c.token for c in commands]
     _validate_token_uniqueness(tokens)
+    # Validate before generated/ is cleared, so a bad annotation keeps the previous output.
+    manifest = build_manifest(firmware_dir, commands)
+    try:
+        validate_manifest_schema(manifest, DEFAULT_SCHEMA_PATH)
+    except SchemaValidationError as exc:
+        raise BuildError(str(exc)) from exc
 
     generated_dir = firmware_dir / "generated"
     generated_dir.mkdir(parents=True, exist_ok=True)
@@ -48,14 +54,6 @@ def run_build(firmware_dir: Path) -> BuildResult:
         if existing.is_file():
             existing.unlink()
 
-    manifest = build_manifest(firmware_dir, commands)
-    schema_path = Path(__file__).resolve().parent.parent / "schema" / "daemon.schema.v0_1.json"
-
-    try:
-        validate_manifest_schema(manifest, schema_path)
-    except SchemaValidationError as exc:
-        raise BuildError(str(exc)) from exc
-
     write_manifest_yaml(manifest, generated_dir / "DAEMON.yml")
     write_daemon_entry(generated_dir, commands)
 
@@ -144,18 +144,142 @@ void mc_tick_10ms(void) {
     }
 }
 """,
-        "raspberry_pi/vision_bridge.py": """import json
+        "raspberry_pi/vision_bridge.py": """\"\"\"
+Pi -> MCU vision detections over the shared serial port (see protocol/serial_protocol.md).
+
+emit_detection() batches binary records instead of writing each one: a record goes out only once 16 are
+queued, once a later emit finds the oldest one FLUSH_AFTER_S old, or when the caller runs flush(). Callers
+must call flush() after emitting a frame's detections (and before writing anything else to the port);
+otherwise the last detections of a burst stay queued. Anything still queued is flushed at interpreter exit.
+\"\"\"
+
+import atexit
+import json
+import struct
+import threading
 import time
 
-def emit_detection(serial_port, label, confidence, cx):
+# Binary detection record (see protocol/serial_protocol.md): magic, label index, confidence, centroid_x, ts_ms.
+# Framed by a magic byte that can never start a JSON line, so both share the serial stream.
+DETECTION_MAGIC = 0xD7
+_DETECTION = struct.Struct("<BHffQ")
+# Both ends must agree on this table; labels outside it are sent as a JSON line instead.
+LABELS = ("red object", "cube", "ring", "person", "obstacle")
+_LABEL_TO_IDX = {label: i for i, label in enumerate(LABELS)}
+# Records are buffered and written together once this many are queued or the oldest is FLUSH_AFTER_S old.
+FLUSH_RECORDS = 16
+FLUSH_AFTER_S = 0.05
+
+# Everything is written from the calling thread, never a background one, so the records can't interleave
+# with the caller's own writes (commands, JSON lines) to the same port. The caller must call flush() once
+# it has emitted a frame's detections, or before writing anything else to the port.
+_lock = threading.Lock()
+_pending = bytearray()
+_pending_port = None
+_pending_since = 0.0
+
+
+def _flush_locked():
+    global _pending_port
+    if _pending and _pending_port is not None:
+        _pending_port.write(bytes(_pending))
+    _pending.clear()
+    _pending_port = None
+
+
+def flush():
+    \"\"\"Write any buffered detection records; call after each frame and before closing the serial port.\"\"\"
+    with _lock:
+        _flush_locked()
+
+
+def _flush_at_exit():
+    try:
+        flush()
+    except (OSError, ValueError):
+        pass  # port already closed
+
+
+atexit.register(_flush_at_exit)
+
+
+def _json_line(label, confidence, cx, ts_ms):
     payload = {
         "event": "vision.detection",
         "label": label,
         "confidence": confidence,
         "centroid_x": cx,
-        "ts_ms": int(time.time() * 1000),
+        "ts_ms": ts_ms,
     }
-    serial_port.write((json.dumps(payload) + "\\n").encode("utf-8"))
+    return (json.dumps(payload) + "\\n").encode("utf-8")
+
+
+def emit_detection(serial_port, label, confidence, cx):
+    global _pending_port, _pending_since
+    ts_ms = time.time_ns() // 1_000_000
+    idx = _LABEL_TO_IDX.get(label)
+    record = None
+    if idx is not None:
+        try:
+            record = _DETECTION.pack(DETECTION_MAGIC, idx, confidence, cx, ts_ms)
+        except struct.error:
+            # None or non-numeric values can't be packed; the JSON line carries them as before.
+            record = None
+    with _lock:
+        if _pending_port is not None and _pending_port is not serial_port:
+            _flush_locked()
+        if record is None:
+            # Keep ordering: anything queued goes out before the JSON line.
+            _flush_locked()
+            serial_port.write(_json_line(label, confidence, cx, ts_ms))
+            return
+        now = time.monotonic()
+        if not _pending:
+            _pending_since = now
+        _pending.extend(record)
+        _pending_port = serial_port
+        if len(_pending) >= FLUSH_RECORDS * _DETECTION.size or now - _pending_since >= FLUSH_AFTER_S:
+            _flush_locked()
+
+
+def decode_detections(data):
+    \"\"\"
+    Inverse of emit_detection for a received byte stream: returns (detections, rest), where detections are
+    dicts shaped like the JSON line and rest is an incomplete trailing record or line to prepend to the next read.
+    Non-detection JSON lines and records with an unknown label index are skipped.
+    \"\"\"
+    detections = []
+    pos = 0
+    end = len(data)
+    while pos < end:
+        if data[pos] == DETECTION_MAGIC:
+            if end - pos < _DETECTION.size:
+                break
+            _magic, idx, confidence, cx, ts_ms = _DETECTION.unpack_from(data, pos)
+            pos += _DETECTION.size
+            if idx < len(LABELS):
+                detections.append(
+                    {
+                        "event": "vision.detection",
+                        "label": LABELS[idx],
+                        "confidence": confidence,
+                        "centroid_x": cx,
+                        "ts_ms": ts_ms,
+                    }
+                )
+            continue
+        newline = data.find(b"\\n", pos)
+        if newline < 0:
+            break
+        line = data[pos:newline]
+        pos = newline + 1
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(message, dict) and message.get("event") == "vision.detection":
+            detections.append(message)
+    return detections, bytes(data[pos:])
 """,
         "protocol/serial_protocol.md": """# Serial JSON Protocol
 
@@ -173,6 +297,27 @@ Telemetry:
 ```json
 {"event":"telemetry.state","battery_v":7.8,"speed_mps":1.2}
 ```
+
+Vision detections (Pi -> MCU) are binary records, not JSON lines, so the receiver
+must branch on the first byte: `0xD7` starts a 19-byte little-endian record, `{`
+starts a JSON line.
+
+| offset | type    | field                                      |
+|--------|---------|--------------------------------------------|
+| 0      | uint8   | magic `0xD7`                               |
+| 1      | uint16  | label index (`vision_bridge.LABELS`)       |
+| 3      | float32 | confidence                                 |
+| 7      | float32 | centroid_x                                 |
+| 11     | uint64  | ts_ms                                      |
+
+Records are batched (up to 16, or once the oldest is 50 ms old) and always written
+from the caller's thread; callers flush with `vision_bridge.flush()` after each
+frame. `vision_bridge.decode_detections()` is the receiving side's reference
+decoder. A label missing from the table, or a value that can't be packed (e.g.
+`null` confidence), is sent as a JSON line instead:
+```json
+{"event":"vision.detection","label":"cone","confidence":0.61,"centroid_x":0.42,"ts_ms":1739512345678}
+```
 """,
     },
     "greenhouse_node": {
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ModuleNotFoundError:  # optional: pip install "daemon-cli[fast]"
+    orjson = None
+
+
+# Resolved once at import; the validator cache below is keyed on this path.
+DEFAULT_SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schema" / "daemon.schema.v0_1.json"
 
 
 class SchemaValidationError(RuntimeError):
@@ -9,21 +20,97 @@ class SchemaValidationError(RuntimeError):
 
 
 def load_schema(schema_path: Path) -> dict:
+    # orjson parses the raw bytes directly; stdlib json needs them decoded to str first.
+    if orjson is not None:
+        return orjson.loads(schema_path.read_bytes())
     return json.loads(schema_path.read_text(encoding="utf-8"))
 
 
-def validate_manifest_schema(manifest: dict, schema_path: Path) -> None:
+def _rs_checker(schema: dict, schema_path: str) -> Callable[[dict], None]:
+    import jsonschema_rs
+
     try:
-        from jsonschema import Draft202012Validator
+        validator = jsonschema_rs.Draft202012Validator(schema)
+    except ValueError as exc:
+        raise SchemaValidationError(f"Invalid schema {schema_path}: {exc}") from exc
+
+    def check(manifest: dict) -> None:
+        try:
+            validator.validate(manifest)
+        except jsonschema_rs.ValidationError as exc:
+            location = ".".join(str(p) for p in exc.instance_path) or "root"
+            raise SchemaValidationError(f"Schema validation failed at {location}: {exc.message}") from exc
+
+    return check
+
+
+def _fast_checker(schema: dict, schema_path: str) -> Callable[[dict], None]:
+    import fastjsonschema
+
+    try:
+        validator = fastjsonschema.compile(schema)
+    except fastjsonschema.JsonSchemaDefinitionException as exc:
+        raise SchemaValidationError(f"Invalid schema {schema_path}: {exc}") from exc
+
+    def check(manifest: dict) -> None:
+        try:
+            validator(manifest)
+        except fastjsonschema.JsonSchemaValueException as exc:
+            # exc.path starts with the root name ("data"); report the rest like a dotted manifest path.
+            location = ".".join(str(p) for p in exc.path[1:]) or "root"
+            raise SchemaValidationError(f"Schema validation failed at {location}: {exc.message}") from exc
+
+    return check
+
+
+def _compile(schema: dict, source: str) -> Callable[[dict], None]:
+    # jsonschema-rs (optional, pip install "daemon-cli[fast]") validates natively against draft 2020-12.
+    # Otherwise fastjsonschema generates a Python function specialised to the schema; it implements up to
+    # draft-07, which covers every keyword the v0.1 schema uses.
+    try:
+        return _rs_checker(schema, source)
+    except ModuleNotFoundError:
+        pass
+    try:
+        return _fast_checker(schema, source)
     except ModuleNotFoundError as exc:
         raise SchemaValidationError(
-            "Missing dependency 'jsonschema'. Install with: pip install jsonschema"
+            "Missing dependency 'fastjsonschema'. Install with: pip install fastjsonschema"
         ) from exc
 
-    schema = load_schema(schema_path)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(manifest), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join([str(p) for p in first.path]) or "root"
-        raise SchemaValidationError(f"Schema validation failed at {location}: {first.message}")
+
+@lru_cache(maxsize=32)
+def _compiled_validator(schema_path: str, mtime_ns: int) -> Callable[[dict], None]:
+    # Keyed on mtime so an edited schema file is re-read; otherwise compilation happens once per process.
+    return _compile(load_schema(Path(schema_path)), schema_path)
+
+
+@lru_cache(maxsize=32)
+def _compiled_validator_for_doc(canonical: str) -> Callable[[dict], None]:
+    return _compile(json.loads(canonical), "<schema dict>")
+
+
+def _checker(schema: Path | dict) -> Callable[[dict], None]:
+    if isinstance(schema, dict):
+        # An already-parsed schema skips the file read; key the compile cache on its canonical JSON.
+        return _compiled_validator_for_doc(json.dumps(schema, sort_keys=True, separators=(",", ":")))
+    return _compiled_validator(str(schema), schema.stat().st_mtime_ns)
+
+
+def validate_manifest_schema(manifest: dict, schema_path: Path | dict = DEFAULT_SCHEMA_PATH) -> None:
+    """Validate against a schema file path, or a schema dict the caller has already loaded."""
+    _checker(schema_path)(manifest)
+
+
+def validate_manifests_batch(
+    manifests: Iterable[dict], schema_path: Path | dict = DEFAULT_SCHEMA_PATH
+) -> Iterator[Optional[SchemaValidationError]]:
+    """Yield None or the SchemaValidationError for each manifest, looking up the validator once."""
+    check = _checker(schema_path)
+    for manifest in manifests:
+        try:
+            check(manifest)
+        except SchemaValidationError as exc:
+            yield exc
+        else:
+            yield None
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Optional AOT build of vision_policy.py with mypyc.
+
+    pip install mypy
+    python3 build_vision_policy.py build_ext --inplace
+
+pi_vision_brain_server.py imports whichever vision_policy is found first, so the compiled
+extension is picked up automatically and the plain .py stays the fallback.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(name="vision_policy", ext_modules=mypycify(["vision_policy.py"]))
@@ -49,8 +49,13 @@ def _resolve_pin_factory(preferred: str | None):
     return None
 
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
+# Uptime and the watchdog are durations, so they use the coarse monotonic clock: a VDSO read at
+# jiffy (ms-level) resolution that an NTP step at boot cannot push forward or back.
+_MONO_CLOCK = getattr(time, "CLOCK_MONOTONIC_COARSE", time.CLOCK_MONOTONIC)
+
+
+def _mono_ms() -> int:
+    return time.clock_gettime_ns(_MONO_CLOCK) // 1_000_000
 
 
 DEFAULT_MANIFEST = {
@@ -185,7 +190,7 @@ def telemetry_loop(state: ClientState, claw: Claw) -> None:
         if not state.telemetry_enabled:
             time.sleep(0.1)
             continue
-        uptime = _now_ms() - state.started_ms
+        uptime = _mono_ms() - state.started_ms
         try:
             send_line(
                 state.conn,
@@ -207,20 +212,20 @@ class Watchdog:
         self._claw = claw
         self._watchdog_ms = max(150, int(watchdog_ms))
         self._lock = threading.Lock()
-        self._last_cmd_ms = _now_ms()
+        self._last_cmd_ms = _mono_ms()
         # Only enforce the watchdog after we've seen an "active" command (RUN).
         self._armed = False
 
     def bump(self, active: bool) -> None:
         with self._lock:
-            self._last_cmd_ms = _now_ms()
+            self._last_cmd_ms = _mono_ms()
             self._armed = bool(active)
 
     def loop(self) -> None:
         while True:
             time.sleep(0.15)
             with self._lock:
-                dt = _now_ms() - self._last_cmd_ms
+                dt = _mono_ms() - self._last_cmd_ms
                 armed = self._armed
             if armed and dt > self._watchdog_ms:
                 self._claw.stop_safe()
@@ -270,7 +275,7 @@ def bind_server(listen: str, port: int) -> socket.socket:
 
 
 def client_loop(conn: socket.socket, addr, manifest: dict, claw: Claw, watchdog: Watchdog) -> None:
-    state = ClientState(conn=conn, started_ms=_now_ms())
+    state = ClientState(conn=conn, started_ms=_mono_ms())
     t_thread = threading.Thread(target=telemetry_loop, args=(state, claw), daemon=True)
     t_thread.start()
     m_line = manifest_line(manifest)
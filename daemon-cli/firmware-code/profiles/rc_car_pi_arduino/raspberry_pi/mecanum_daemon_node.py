@@ -30,17 +30,24 @@ from __future__ import annotations
 import argparse
 import glob
 import json
+import selectors
 import socket
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import serial  # pyserial
 from serial.serialutil import SerialException
 
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
+# Uptime and the watchdog are durations, so they use the coarse monotonic clock: a VDSO read at
+# jiffy (ms-level) resolution that an NTP step at boot cannot push forward or back.
+_MONO_CLOCK = getattr(time, "CLOCK_MONOTONIC_COARSE", time.CLOCK_MONOTONIC)
+
+
+def _mono_ms() -> int:
+    return time.clock_gettime_ns(_MONO_CLOCK) // 1_000_000
 
 
 DEFAULT_MANIFEST = {
@@ -92,6 +99,7 @@ DEFAULT_MANIFEST = {
             {"name": "uptime_ms", "type": "int", "unit": "ms"},
             {"name": "last_token", "type": "string"},
             {"name": "serial_ok", "type": "bool"},
+            {"name": "serial_errors", "type": "int"},
         ]
     },
     "transport": {"type": "serial-line-v1"},
@@ -116,6 +124,9 @@ class MecanumSerial:
         self._lock = threading.Lock()
         self._ser: serial.Serial | None = None
         self._serial_ok = False
+        self._err_count = 0
+        self._needs_reopen = threading.Event()
+        threading.Thread(target=self._reopen_loop, daemon=True).start()
 
     def _candidate_ports(self) -> list[str]:
         explicit = self._port.strip()
@@ -132,54 +143,85 @@ class MecanumSerial:
                 seen.add(item)
         return deduped
 
-    def _open(self) -> None:
-        if self._ser:
-            try:
-                self._ser.close()
-            except Exception:
-                pass
-            self._ser = None
-
+    def _open_fast(self) -> None:
+        """Open the first working candidate port. Does not wait for the Arduino boot reset."""
         last_exc: Exception | None = None
         for candidate in self._candidate_ports():
             try:
-                self._ser = serial.Serial(candidate, self._baud, timeout=1)
-                # Most Arduino boards reset on open.
-                time.sleep(2.0)
-                self._port = candidate
-                self._serial_ok = True
-                return
+                ser = serial.Serial(candidate, self._baud, timeout=1)
             except Exception as exc:
                 last_exc = exc
-                self._serial_ok = False
-                self._ser = None
+                continue
+            with self._lock:
+                old, self._ser = self._ser, ser
+                self._port = candidate
+            if old:
+                try:
+                    old.close()
+                except Exception:
+                    pass
+            return
         raise RuntimeError(f"Failed to open serial on any candidate port: {last_exc}")
 
+    def _open(self) -> None:
+        with self._lock:
+            self._serial_ok = False
+        try:
+            self._open_fast()
+        except Exception:
+            self._needs_reopen.set()
+            raise
+        # Most Arduino boards reset on open. Writes keep failing fast until the board is up.
+        time.sleep(2.0)
+        with self._lock:
+            self._serial_ok = True
+
+    def _reopen_loop(self) -> None:
+        # Reopen off the request path so a USB glitch never holds _lock through the boot-reset wait.
+        backoff_s = 0.5
+        while True:
+            self._needs_reopen.wait()
+            try:
+                self._open()
+            except Exception as exc:
+                print(f"warning: serial reopen failed (retry in {backoff_s:.1f}s): {exc}", flush=True)
+                time.sleep(backoff_s)
+                backoff_s = min(backoff_s * 2.0, 8.0)
+                continue
+            backoff_s = 0.5
+            self._needs_reopen.clear()
+
     def serial_ok(self) -> bool:
         return bool(self._serial_ok and self._ser and self._ser.is_open)
 
+    def error_count(self) -> int:
+        # Write failures since start; reported in TELEMETRY so a flapping USB link shows up remotely.
+        return self._err_count
+
     def send_primitive(self, cmd: str) -> None:
         cmd_u = cmd.strip().upper()
         if cmd_u not in ALLOWED_PRIMITIVES:
             raise ValueError("unsupported primitive")
+        self.write_primitive(cmd_u.encode("ascii"))
 
+    def write_primitive(self, payload: bytes) -> None:
+        """Write a primitive byte the caller already knows is valid (b"F", b"S", ...); no strip/upper/set check."""
         with self._lock:
+            if not self._serial_ok or not self._ser or not self._ser.is_open:
+                self._needs_reopen.set()
+                raise SerialException("serial not ready")
             try:
-                if not self._ser or not self._ser.is_open:
-                    self._open()
-                assert self._ser is not None
-                self._ser.write(cmd_u.encode("ascii"))
+                self._ser.write(payload)
                 self._ser.flush()
             except Exception:
-                # One reopen + retry to smooth over transient USB resets.
+                # Fail fast and let the reopen thread recover the port with back-off.
                 self._serial_ok = False
-                self._open()
-                assert self._ser is not None
-                self._ser.write(cmd_u.encode("ascii"))
-                self._ser.flush()
+                self._err_count += 1
+                self._needs_reopen.set()
+                raise
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientState:
     conn: socket.socket
     running: bool = True
@@ -188,25 +230,47 @@ class ClientState:
     last_token: str = "NONE"
 
 
+def telemetry_line(state: ClientState, serial_dev: MecanumSerial) -> str:
+    uptime = _mono_ms() - state.started_ms
+    return (
+        f"TELEMETRY uptime_ms={uptime} last_token={state.last_token} serial_ok={int(serial_dev.serial_ok())}"
+        f" serial_errors={serial_dev.error_count()}"
+    )
+
+
 def telemetry_loop(state: ClientState, serial_dev: MecanumSerial) -> None:
     while state.running:
         if not state.telemetry_enabled:
             time.sleep(0.1)
             continue
-        uptime = _now_ms() - state.started_ms
-        last_token = state.last_token
-        serial_ok = serial_dev.serial_ok()
         try:
-            send_line(state.conn, f"TELEMETRY uptime_ms={uptime} last_token={last_token} serial_ok={int(serial_ok)}")
+            send_line(state.conn, telemetry_line(state, serial_dev))
         except OSError:
             break
         time.sleep(0.5)
 
 
-def parse_run(parts: list[str]) -> tuple[str | None, list[str]]:
-    if len(parts) < 2:
+def _first_word(text: str) -> tuple[str, str]:
+    # Splits on any run of whitespace (spaces or tabs), like the old split(), but stops after the first word.
+    parts = text.split(None, 1)
+    if not parts:
+        return "", ""
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+def _is_zero(arg: str) -> bool:
+    try:
+        return float(arg) == 0.0
+    except ValueError:
+        return False
+
+
+def parse_run(rest: str) -> tuple[str | None, list[str]]:
+    token, argstr = _first_word(rest)
+    if not token:
         return None, []
-    return parts[1], parts[2:]
+    # Only RUN lines with positional args pay for a split.
+    return token, argstr.split() if argstr else []
 
 
 def handle_run(serial_dev: MecanumSerial, token: str, args: list[str]) -> str:
@@ -218,14 +282,14 @@ def handle_run(serial_dev: MecanumSerial, token: str, args: list[str]) -> str:
                 return "ERR BAD_ARGS wrong_count"
             # speed is kept for interface stability; firmware uses fixed speed.
             float(args[0])
-            serial_dev.send_primitive("F")
+            serial_dev.write_primitive(b"F")
             return "OK"
 
         if t == "BWD":
             if len(args) != 1:
                 return "ERR BAD_ARGS wrong_count"
             float(args[0])
-            serial_dev.send_primitive("B")
+            serial_dev.write_primitive(b"B")
             return "OK"
 
         if t == "STRAFE":
@@ -234,10 +298,10 @@ def handle_run(serial_dev: MecanumSerial, token: str, args: list[str]) -> str:
             direction = args[0].strip().upper()
             float(args[1])
             if direction == "L":
-                serial_dev.send_primitive("L")
+                serial_dev.write_primitive(b"L")
                 return "OK"
             if direction == "R":
-                serial_dev.send_primitive("R")
+                serial_dev.write_primitive(b"R")
                 return "OK"
             return "ERR RANGE enum"
 
@@ -246,9 +310,9 @@ def handle_run(serial_dev: MecanumSerial, token: str, args: list[str]) -> str:
                 return "ERR BAD_ARGS wrong_count"
             deg = int(float(args[0]))
             if deg < 0:
-                serial_dev.send_primitive("Q")
+                serial_dev.write_primitive(b"Q")
             elif deg > 0:
-                serial_dev.send_primitive("E")
+                serial_dev.write_primitive(b"E")
             else:
                 # no-op
                 pass
@@ -272,93 +336,246 @@ def handle_run(serial_dev: MecanumSerial, token: str, args: list[str]) -> str:
         return f"ERR INTERNAL {exc}"
 
 
+def handle_line(
+    line: str, state: ClientState, m_line: str, serial_dev: MecanumSerial, watchdog: "Watchdog"
+) -> str:
+    cmd, rest = _first_word(line)
+    cmd = cmd.upper()
+
+    if cmd == "HELLO":
+        return m_line
+    if cmd == "READ_MANIFEST":
+        return m_line
+    if cmd == "SUB" and _first_word(rest)[0].upper() == "TELEMETRY":
+        state.telemetry_enabled = True
+        return "OK"
+    if cmd == "UNSUB" and _first_word(rest)[0].upper() == "TELEMETRY":
+        state.telemetry_enabled = False
+        return "OK"
+
+    if cmd == "STOP":
+        watchdog.bump("STOP")
+        try:
+            serial_dev.write_primitive(b"S")
+            state.last_token = "STOP"
+            return "OK"
+        except Exception as exc:
+            return f"ERR SERIAL {exc}"
+
+    if cmd == "RUN":
+        token, run_args = parse_run(rest)
+        if not token:
+            return "ERR BAD_ARGS missing_token"
+        token_u = token.upper()
+        if token_u == "TURN" and len(run_args) == 1 and _is_zero(run_args[0]):
+            # TURN 0 (in any spelling: 0.00, -0, 0e0) is a no-op; answer without entering handle_run.
+            watchdog.bump(token)
+            state.last_token = token_u
+            return "OK"
+        watchdog.bump(token)
+        resp = handle_run(serial_dev, token, run_args)
+        if resp == "OK":
+            state.last_token = token.upper()
+        return resp
+
+    return "ERR BAD_REQUEST unsupported"
+
+
+def drain_lines(
+    buf: bytearray, state: ClientState, m_line: str, serial_dev: MecanumSerial, watchdog: "Watchdog"
+) -> bytearray:
+    # Pipelined requests (e.g. "RUN FWD 0.5\nRUN TURN 30\nSTOP\n") arrive in one recv;
+    # answer them in order with a single sendall instead of one syscall per reply.
+    out = bytearray()
+    while True:
+        nl = buf.find(b"\n")
+        if nl < 0:
+            break
+        line = buf[:nl].decode("utf-8", errors="replace").strip()
+        del buf[: nl + 1]
+        if not line:
+            continue
+        out += handle_line(line, state, m_line, serial_dev, watchdog).encode("utf-8")
+        out += b"\n"
+    return out
+
+
 def client_loop(conn: socket.socket, addr, manifest: dict, serial_dev: MecanumSerial, watchdog: "Watchdog") -> None:
-    state = ClientState(conn=conn, started_ms=_now_ms())
+    state = ClientState(conn=conn, started_ms=_mono_ms())
     t_thread = threading.Thread(target=telemetry_loop, args=(state, serial_dev), daemon=True)
     t_thread.start()
     m_line = manifest_line(manifest)
 
     try:
         with conn:
-            file = conn.makefile("r", encoding="utf-8", newline="\n")
-            for raw_line in file:
-                line = raw_line.strip()
-                if not line:
-                    continue
-                parts = line.split()
-                cmd = parts[0].upper()
-
-                if cmd == "HELLO":
-                    send_line(conn, m_line)
-                    continue
-                if cmd == "READ_MANIFEST":
-                    send_line(conn, m_line)
-                    continue
-                if cmd == "SUB" and len(parts) >= 2 and parts[1].upper() == "TELEMETRY":
-                    state.telemetry_enabled = True
-                    send_line(conn, "OK")
-                    continue
-                if cmd == "UNSUB" and len(parts) >= 2 and parts[1].upper() == "TELEMETRY":
-                    state.telemetry_enabled = False
-                    send_line(conn, "OK")
-                    continue
-
-                if cmd == "STOP":
-                    watchdog.bump("STOP")
-                    try:
-                        serial_dev.send_primitive("S")
-                        state.last_token = "STOP"
-                        send_line(conn, "OK")
-                    except Exception as exc:
-                        send_line(conn, f"ERR SERIAL {exc}")
-                    continue
-
-                if cmd == "RUN":
-                    token, run_args = parse_run(parts)
-                    if not token:
-                        send_line(conn, "ERR BAD_ARGS missing_token")
-                        continue
-                    watchdog.bump(token)
-                    resp = handle_run(serial_dev, token, run_args)
-                    if resp == "OK":
-                        state.last_token = token.upper()
-                    send_line(conn, resp)
-                    continue
-
-                send_line(conn, "ERR BAD_REQUEST unsupported")
+            buf = bytearray()
+            eof = False
+            while not eof:
+                chunk = conn.recv(4096)
+                if chunk:
+                    buf += chunk
+                else:
+                    # Treat a trailing unterminated line as complete, like file iteration did.
+                    eof = True
+                    if buf:
+                        buf += b"\n"
+
+                out = drain_lines(buf, state, m_line, serial_dev, watchdog)
+                if out:
+                    conn.sendall(out)
     finally:
         state.running = False
         t_thread.join(timeout=1.0)
         # Deadman: ensure stop on disconnect.
         try:
-            serial_dev.send_primitive("S")
+            serial_dev.write_primitive(b"S")
         except Exception:
             pass
         print(f"client disconnected: {addr}", flush=True)
 
 
+# A selectors client whose unsent replies/telemetry pass this is not reading; it is dropped rather than
+# letting its backlog grow without bound.
+MAX_PENDING_OUT = 64 * 1024
+
+
+class _SelectorClient:
+    __slots__ = ("state", "inbuf", "out", "addr", "closing")
+
+    def __init__(self, conn: socket.socket, addr) -> None:
+        self.state = ClientState(conn=conn, started_ms=_mono_ms())
+        self.inbuf = bytearray()
+        self.out = bytearray()
+        self.addr = addr
+        self.closing = False
+
+
+def serve_selectors(
+    srv: socket.socket, manifest: dict, serial_dev: MecanumSerial, watchdog: "Watchdog", max_clients: int
+) -> None:
+    """
+    Single-threaded backend: one epoll/kqueue wait covers accept, every client read,
+    and the telemetry tick, instead of two blocking threads per client.
+    Client sockets stay non-blocking and each has its own output buffer, written when the socket is
+    writable, so a client that stops reading can never stall STOP replies to anyone else.
+    """
+    m_line = manifest_line(manifest)
+    sel = selectors.DefaultSelector()
+    srv.setblocking(False)
+    sel.register(srv, selectors.EVENT_READ, None)
+    clients: dict[socket.socket, _SelectorClient] = {}
+
+    def drop(conn: socket.socket, reason: str = "") -> None:
+        c = clients.pop(conn)
+        sel.unregister(conn)
+        try:
+            conn.close()
+        except OSError:
+            pass
+        # Deadman: ensure stop on disconnect.
+        try:
+            serial_dev.write_primitive(b"S")
+        except Exception:
+            pass
+        print(f"client disconnected: {c.addr}{reason}", flush=True)
+
+    def flush(conn: socket.socket, c: _SelectorClient) -> None:
+        try:
+            while c.out:
+                sent = conn.send(c.out)
+                del c.out[:sent]
+        except BlockingIOError:
+            pass
+        except OSError:
+            drop(conn)
+            return
+        if not c.out and c.closing:
+            drop(conn)
+            return
+        if len(c.out) > MAX_PENDING_OUT:
+            drop(conn, " (not reading; output backlog full)")
+            return
+        events = selectors.EVENT_WRITE if c.closing else selectors.EVENT_READ
+        if c.out:
+            events |= selectors.EVENT_WRITE
+        if sel.get_key(conn).events != events:
+            sel.modify(conn, events, conn)
+
+    next_telemetry = time.monotonic() + 0.5
+    while True:
+        for key, events in sel.select(timeout=max(0.0, next_telemetry - time.monotonic())):
+            if key.data is None:
+                try:
+                    conn, addr = srv.accept()
+                except BlockingIOError:
+                    continue
+                if len(clients) >= max_clients:
+                    print(f"client rejected (busy): {addr}", flush=True)
+                    try:
+                        conn.sendall(b"ERR BUSY overloaded\n")
+                    except OSError:
+                        pass
+                    conn.close()
+                    continue
+                conn.setblocking(False)
+                print(f"client connected: {addr}", flush=True)
+                clients[conn] = _SelectorClient(conn, addr)
+                sel.register(conn, selectors.EVENT_READ, conn)
+                continue
+
+            conn = key.data
+            c = clients.get(conn)
+            if c is None:
+                continue
+            if events & selectors.EVENT_READ and not c.closing:
+                try:
+                    chunk = conn.recv(4096)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b""
+                if chunk:
+                    c.inbuf += chunk
+                else:
+                    # Answer a trailing unterminated line, then close once the replies are out.
+                    c.closing = True
+                    if c.inbuf:
+                        c.inbuf += b"\n"
+                c.out += drain_lines(c.inbuf, c.state, m_line, serial_dev, watchdog)
+            flush(conn, c)
+
+        if time.monotonic() >= next_telemetry:
+            next_telemetry = time.monotonic() + 0.5
+            for conn, c in list(clients.items()):
+                # A client still behind on earlier output skips this tick instead of growing its backlog.
+                if not c.state.telemetry_enabled or c.closing or c.out:
+                    continue
+                c.out += (telemetry_line(c.state, serial_dev) + "\n").encode("utf-8")
+                flush(conn, c)
+
+
 class Watchdog:
     def __init__(self, serial_dev: MecanumSerial, watchdog_ms: int):
         self._serial = serial_dev
         self._watchdog_ms = max(100, int(watchdog_ms))
         self._lock = threading.Lock()
-        self._last_cmd_ms = _now_ms()
+        self._last_cmd_ms = _mono_ms()
         self._last_motion_active = False
 
     def bump(self, token: str) -> None:
         with self._lock:
-            self._last_cmd_ms = _now_ms()
+            self._last_cmd_ms = _mono_ms()
             self._last_motion_active = token.strip().upper() not in {"STOP"}
 
     def loop(self) -> None:
         while True:
             time.sleep(0.1)
             with self._lock:
-                dt = _now_ms() - self._last_cmd_ms
+                dt = _mono_ms() - self._last_cmd_ms
                 active = self._last_motion_active
             if active and dt > self._watchdog_ms:
                 try:
-                    self._serial.send_primitive("S")
+                    self._serial.write_primitive(b"S")
                 except Exception:
                     pass
                 with self._lock:
@@ -404,6 +621,13 @@ def main() -> None:
     ap.add_argument("--node-id", default="base", help="Manifest device.node_id")
     ap.add_argument("--name", default="rc-car-mecanum", help="Manifest device.name")
     ap.add_argument("--watchdog-ms", type=int, default=1200, help="Deadman STOP if no commands within this window")
+    ap.add_argument(
+        "--io-backend",
+        choices=("threads", "selectors"),
+        default="threads",
+        help="threads: two threads per client; selectors: single epoll loop for many subscribers (default: threads)",
+    )
+    ap.add_argument("--max-clients", type=int, default=16, help="Max concurrent client connections (default: 16)")
     args = ap.parse_args()
 
     manifest = dict(DEFAULT_MANIFEST)
@@ -421,21 +645,46 @@ def main() -> None:
     threading.Thread(target=watchdog.loop, daemon=True).start()
 
     srv = bind_server(args.listen, args.port)
-    srv.listen(16)
+    srv.listen(args.max_clients)
     print(
         f"rc_car_pi_arduino node listening on {args.listen}:{args.port} -> {args.serial}@{args.baud} "
         f"(node_id={args.node_id})",
         flush=True,
     )
 
+    if args.io_backend == "selectors":
+        serve_selectors(srv, manifest, serial_dev, watchdog, args.max_clients)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=args.max_clients, thread_name_prefix="daemon-client")
+    active_lock = threading.Lock()
+    active = 0
+
+    def run_client(conn: socket.socket, addr) -> None:
+        nonlocal active
+        try:
+            client_loop(conn, addr, manifest, serial_dev, watchdog)
+        finally:
+            with active_lock:
+                active -= 1
+
     while True:
         conn, addr = srv.accept()
+        with active_lock:
+            busy = active >= args.max_clients
+            if not busy:
+                active += 1
+        if busy:
+            # Reject instead of queueing behind a full pool (or spawning unbounded threads).
+            print(f"client rejected (busy): {addr}", flush=True)
+            try:
+                conn.sendall(b"ERR BUSY overloaded\n")
+            except OSError:
+                pass
+            conn.close()
+            continue
         print(f"client connected: {addr}", flush=True)
-        threading.Thread(
-            target=client_loop,
-            args=(conn, addr, manifest, serial_dev, watchdog),
-            daemon=True,
-        ).start()
+        pool.submit(run_client, conn, addr)
 
 
 if __name__ == "__main__":
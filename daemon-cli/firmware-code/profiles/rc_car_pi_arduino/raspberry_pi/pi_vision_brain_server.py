@@ -16,6 +16,13 @@ Endpoints
 
 Install prerequisites on the Pi
 - sudo apt-get install -y python3-opencv python3-numpy python3-requests
+- optional: pip install orjson (faster request/response JSON; stdlib json is used otherwise)
+
+HOG person detection (--enable-person) is the heaviest stage. It uses cv2.cuda HOG automatically when
+OpenCV was built with -DWITH_CUDA=ON and a device is present. On a Pi, an OpenCV built with
+-DCPU_BASELINE=NEON (or -DENABLE_NEON=ON) vectorizes the CPU path.
+
+Instruction parsing and plan building live in vision_policy.py (optionally mypyc-compiled; see that file).
 """
 
 from __future__ import annotations
@@ -25,13 +32,27 @@ import json
 import math
 import re
 import socket
+import threading
 import time
-from dataclasses import dataclass
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import requests
 
+from vision_policy import (
+    DetectedObject,
+    build_allowed_tokens,
+    build_plan_and_state,
+    normalize_state,
+    parse_actions,
+    pick_target,
+    reset_for_instruction,
+)
+
 try:
     import cv2  # type: ignore
     import numpy as np  # type: ignore
@@ -39,34 +60,76 @@ except Exception:  # pragma: no cover
     cv2 = None  # type: ignore
     np = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
-def _fnv1a_32(text: str) -> str:
-    data = text.encode("utf-8")
-    h = 0x811C9DC5
-    for b in data:
-        h ^= b
-        h = (h * 0x01000193) & 0xFFFFFFFF
-    return f"{h:08x}"
+def _instruction_hash(text: str) -> str:
+    # Only used to detect instruction changes, so CRC32 (one C call, hardware-assisted) is enough.
+    return f"{zlib.crc32(text.encode('utf-8')) & 0xFFFFFFFF:08x}"
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
     return min(hi, max(lo, x))
 
 
+_RE_WHITESPACE = re.compile(r"\s+")
+
+
 def _json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
     return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
 
 
-@dataclass
-class DetectedObject:
-    label: str
-    confidence: float
-    bbox: dict[str, float]  # x,y,w,h in normalized [0,1]
-    attributes: list[str]
+def _json_loads(raw: bytes) -> Any:
+    # orjson parses bytes directly; stdlib json needs the decode round trip.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+PERSON_DETECT_WIDTH = 320
+# Working width for VisionBrain.perceive; enough for robot targeting and 4-16x fewer pixels than camera frames.
+VISION_WIDTH = 320
+# Default per-frame budget for the detector fan-out (--detect-timeout-ms); a detector still running past it
+# (usually HOG) is dropped. HOG alone can take most of a second on a Pi 4, so this leaves it some headroom.
+DETECT_TIMEOUT_S = 2.5
+# Concurrent vision_step jobs on the aiohttp backend. Each fans out to at most DETECTOR_KINDS detectors, so the
+# detector pool is sized for all of them at once and no step's detectors queue behind another step's.
+VISION_STEP_WORKERS = 4
+DETECTOR_KINDS = 4
+# Step interval recommended to closed-loop tasks (move-if-clear, pick-object); others get a slower one.
+CLOSED_LOOP_INTERVAL_MS = 140
+# Reuse the previous frame's detections when fewer than this many of the 64 hash bits changed,
+# but never for longer than SCENE_CACHE_MAX_AGE_S (an 8x8 hash can miss a small object entering the frame).
+# Kept under one closed-loop step so an approach never steers on a previous step's bbox/area.
+SCENE_HASH_MAX_BITS = 5
+SCENE_CACHE_MAX_AGE_S = 0.8 * CLOSED_LOOP_INTERVAL_MS / 1000.0
+SNAPSHOT_TIMEOUT_S = 1.8
+# Task types that never look at the camera.
+MOTION_ONLY_TASKS = ("move-pattern", "stop")
+# Perception for motion-only tasks; shared read-only (the planner only reads it, then it is serialized).
+_PERCEPTION_BYPASSED: dict[str, Any] = {
+    "objects": [],
+    "selected_target": None,
+    "summary": "perception bypassed (motion-only)",
+    "found": False,
+    "bbox": None,
+    "area": 0.0,
+    "offset_x": 0.0,
+    "center_offset_x": 0.0,
+    "confidence": 0.0,
+    "distance_norm": 0.0,
+}
+# The background perception producer stops capturing once /vision_step has been quiet this long.
+PRODUCER_IDLE_S = 2.0
 
 
 def _largest_contour(mask: "np.ndarray") -> Optional[tuple[float, tuple[int, int, int, int]]]:
@@ -82,22 +145,27 @@ def _largest_contour(mask: "np.ndarray") -> Optional[tuple[float, tuple[int, int
     return area, (int(x), int(y), int(w), int(h))
 
 
+if np is not None:
+    # Constant kernels/tables built once at import rather than per detector call.
+    _KERNEL_3 = np.ones((3, 3), dtype=np.uint8)
+    _RED_HUE_ROTATE_LUT = np.stack(
+        [(np.arange(256) + 10) % 180, np.arange(256), np.arange(256)], axis=-1
+    ).astype(np.uint8).reshape(1, 256, 3)
+    _RED_LOWER = np.array([0, 90, 60], dtype=np.uint8)
+    _RED_UPPER = np.array([22, 255, 255], dtype=np.uint8)
+
+
 def detect_red(frame_bgr: "np.ndarray") -> Optional[DetectedObject]:
     h, w = frame_bgr.shape[:2]
     hsv = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
 
-    # Two ranges to cover red across hue wrap-around.
-    lower1 = np.array([0, 90, 60], dtype=np.uint8)
-    upper1 = np.array([12, 255, 255], dtype=np.uint8)
-    lower2 = np.array([170, 90, 60], dtype=np.uint8)
-    upper2 = np.array([180, 255, 255], dtype=np.uint8)
-    mask1 = cv2.inRange(hsv, lower1, upper1)
-    mask2 = cv2.inRange(hsv, lower2, upper2)
-    mask = cv2.bitwise_or(mask1, mask2)
+    # Red wraps around hue 0 ([170,180) and [0,12]). Rotating hue by +10 makes it one
+    # contiguous band [0,22], so a single inRange replaces two inRange + bitwise_or passes.
+    mask = cv2.inRange(cv2.LUT(hsv, _RED_HUE_ROTATE_LUT), _RED_LOWER, _RED_UPPER)
 
     # Clean up noise a bit.
     mask = cv2.medianBlur(mask, 5)
-    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, np.ones((3, 3), dtype=np.uint8), iterations=1)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _KERNEL_3, iterations=1)
 
     found = _largest_contour(mask)
     if not found:
@@ -120,23 +188,27 @@ def detect_red(frame_bgr: "np.ndarray") -> Optional[DetectedObject]:
     )
 
 
-def detect_cube_like(frame_bgr: "np.ndarray") -> Optional[DetectedObject]:
+def detect_cube_like(
+    frame_bgr: "np.ndarray", gray_blur5: Optional["np.ndarray"] = None, scale: float = 1.0
+) -> Optional[DetectedObject]:
     # Very rough: find largest 4-vertex contour that is close to square.
+    # `scale` is this frame's width over the camera frame's; the pixel thresholds are in camera-frame pixels.
     h, w = frame_bgr.shape[:2]
-    gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
-    gray = cv2.GaussianBlur(gray, (5, 5), 0)
-    edges = cv2.Canny(gray, 80, 160)
-    edges = cv2.dilate(edges, np.ones((3, 3), dtype=np.uint8), iterations=1)
+    if gray_blur5 is None:
+        gray_blur5 = cv2.GaussianBlur(cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY), (5, 5), 0)
+    edges = cv2.Canny(gray_blur5, 80, 160)
+    edges = cv2.dilate(edges, _KERNEL_3, iterations=1)
     contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     if not contours:
         return None
 
+    # Area-gate every contour in one pass; only the few survivors pay for arcLength/approxPolyDP.
+    areas = np.fromiter(map(cv2.contourArea, contours), dtype=np.float64, count=len(contours))
     best_score = 0.0
     best_bbox: Optional[tuple[int, int, int, int]] = None
-    for c in contours:
-        area = float(cv2.contourArea(c))
-        if area < 250:
-            continue
+    for i in np.flatnonzero(areas >= 250 * scale * scale):
+        c = contours[i]
+        area = float(areas[i])
         peri = cv2.arcLength(c, True)
         approx = cv2.approxPolyDP(c, 0.03 * peri, True)
         if len(approx) != 4:
@@ -167,12 +239,27 @@ def detect_cube_like(frame_bgr: "np.ndarray") -> Optional[DetectedObject]:
     )
 
 
-def detect_ring_like(frame_bgr: "np.ndarray") -> Optional[DetectedObject]:
+def detect_ring_like(
+    frame_bgr: "np.ndarray", gray_blur7: Optional["np.ndarray"] = None, scale: float = 1.0
+) -> Optional[DetectedObject]:
     # Rough circle detection (for a "ring" prompt). This is not robust but works for high-contrast rings.
+    # Distances/radii below are camera-frame pixels; `scale` maps them onto a downscaled frame.
+    # HoughCircles stays: on the 320px working frame it costs ~0.3-0.7ms, and SimpleBlobDetector
+    # (circularity >= 0.8) was both slower (0.5-1.2ms) and reported blurred squares as circles.
     h, w = frame_bgr.shape[:2]
-    gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
-    gray = cv2.GaussianBlur(gray, (7, 7), 0)
-    circles = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT, dp=1.2, minDist=40, param1=120, param2=30, minRadius=12, maxRadius=120)
+    if gray_blur7 is None:
+        gray_blur7 = cv2.GaussianBlur(cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY), (7, 7), 0)
+    circles = cv2.HoughCircles(
+        gray_blur7,
+        cv2.HOUGH_GRADIENT,
+        dp=1.2,
+        minDist=40 * scale,
+        param1=120,
+        # Accumulator votes grow with the circle's circumference, so the vote threshold scales too.
+        param2=max(1, round(30 * scale)),
+        minRadius=max(1, round(12 * scale)),
+        maxRadius=max(2, round(120 * scale)),
+    )
     if circles is None or len(circles) == 0:
         return None
     c = circles[0][0]
@@ -191,460 +278,261 @@ def detect_ring_like(frame_bgr: "np.ndarray") -> Optional[DetectedObject]:
     )
 
 
-def detect_person_like(frame_bgr: "np.ndarray") -> Optional[DetectedObject]:
-    # HOG people detector; can be slow. Use low-res frames.
-    h, w = frame_bgr.shape[:2]
+def _cuda_available() -> bool:
+    try:
+        return hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except Exception:
+        return False
+
+
+class _CudaPeopleHog:
+    """cv2.cuda HOG behind the CPU HOGDescriptor.detectMultiScale call shape."""
+
+    def __init__(self) -> None:
+        self._hog = cv2.cuda.HOG_create()
+        self._hog.setSVMDetector(self._hog.getDefaultPeopleDetector())
+        self._hog.setWinStride((8, 8))
+        self._hog.setScaleFactor(1.05)
+        # Confidences are only reported when grouping is disabled.
+        self._hog.setGroupThreshold(0)
+
+    def detectMultiScale(self, img: "np.ndarray", **_kwargs: Any) -> tuple[Any, Any]:  # noqa: N802
+        gpu = cv2.cuda_GpuMat()
+        gpu.upload(cv2.cvtColor(img, cv2.COLOR_BGR2BGRA))
+        found = self._hog.detectMultiScale(gpu)
+        if isinstance(found, tuple):
+            return found[0], (found[1] if len(found) > 1 else None)
+        return found, None
+
+
+@lru_cache(maxsize=1)
+def _people_hog() -> Any:
+    # Building the descriptor and loading the default SVM is costly; do it once per process.
+    if _cuda_available():
+        try:
+            return _CudaPeopleHog()
+        except Exception:
+            pass
     hog = cv2.HOGDescriptor()
     hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
-    small = cv2.resize(frame_bgr, (min(320, w), int(min(320, w) * (h / float(w)))))
-    rects, weights = hog.detectMultiScale(small, winStride=(8, 8), padding=(8, 8), scale=1.05)
+    return hog
+
+
+def detect_person_like(frame_bgr: "np.ndarray", hog: Any = None) -> Optional[DetectedObject]:
+    # HOG people detector; can be slow. Use low-res frames.
+    h, w = frame_bgr.shape[:2]
+    if hog is None:
+        hog = _people_hog()
+    small_w = min(PERSON_DETECT_WIDTH, w)
+    small = cv2.resize(frame_bgr, (small_w, int(small_w * (h / float(w)))), interpolation=cv2.INTER_AREA)
+    # Plain non-max grouping (the default) rather than the much slower Python-visible meanshift path.
+    rects, weights = hog.detectMultiScale(small, winStride=(8, 8), padding=(8, 8), scale=1.05, useMeanshiftGrouping=False)
     if rects is None or len(rects) == 0:
         return None
     # Pick the highest-weight box.
-    best_i = int(np.argmax(weights))
-    x, y, bw, bh = rects[best_i]
+    best_i = int(np.argmax(weights)) if weights is not None and len(weights) > 0 else 0
     weight = float(weights[best_i]) if weights is not None and len(weights) > best_i else 0.4
-    # Map back to original coords.
-    sx = w / float(small.shape[1])
-    sy = h / float(small.shape[0])
-    x0 = int(x * sx)
-    y0 = int(y * sy)
-    bw0 = int(bw * sx)
-    bh0 = int(bh * sy)
+    # Map every box back to original coords in one op, then normalize the chosen one.
+    scale = np.array([w / float(small.shape[1]), h / float(small.shape[0])] * 2)
+    orig = (np.asarray(rects, dtype=np.float64).reshape(-1, 4) * scale).astype(np.int64)
+    norm = orig[best_i] / np.array([w, h, w, h], dtype=np.float64)
     conf = _clamp(0.25 + weight * 0.15, 0.0, 0.9)
+    x, y, bw, bh = norm.tolist()
     return DetectedObject(
         label="person",
         confidence=conf,
-        bbox={"x": x0 / float(w), "y": y0 / float(h), "w": bw0 / float(w), "h": bh0 / float(h)},
+        bbox={"x": x, "y": y, "w": bw, "h": bh},
         attributes=["hog"],
     )
 
 
 def compose_perception(objects: list[DetectedObject], target: Optional[DetectedObject], summary: str) -> dict[str, Any]:
-    found = target is not None
-    bbox = target.bbox if target else None
-    area = float(bbox["w"] * bbox["h"]) if bbox else 0.0
-    center_x = (bbox["x"] + bbox["w"] / 2.0) if bbox else 0.5
-    offset_x = float(center_x - 0.5)
-    # Rough distance proxy: larger area => closer.
-    distance_norm = float(_clamp(1.0 / math.sqrt(max(1e-6, area)), 1.0, 25.0)) if bbox else 0.0
+    # Detectors already produce Python floats/lists and the result is only read then serialized,
+    # so fields pass through without float()/list() copies (cached detections are never mutated).
+    selected = None
+    bbox = None
+    area = 0.0
+    offset_x = 0.0
+    confidence = 0.0
+    distance_norm = 0.0
+    if target is not None:
+        bbox = target.bbox
+        confidence = target.confidence
+        selected = {"label": target.label, "confidence": confidence, "bbox": bbox, "attributes": target.attributes or []}
+        area = bbox["w"] * bbox["h"]
+        offset_x = bbox["x"] + bbox["w"] / 2.0 - 0.5
+        # Rough distance proxy: larger area => closer.
+        distance_norm = _clamp(1.0 / math.sqrt(max(1e-6, area)), 1.0, 25.0)
     return {
-        "objects": [
-            {"label": o.label, "confidence": float(o.confidence), "bbox": o.bbox, "attributes": list(o.attributes or [])} for o in objects
-        ],
-        "selected_target": {"label": target.label, "confidence": float(target.confidence), "bbox": target.bbox, "attributes": list(target.attributes or [])}
-        if target
-        else None,
+        "objects": [{"label": o.label, "confidence": o.confidence, "bbox": o.bbox, "attributes": o.attributes or []} for o in objects],
+        "selected_target": selected,
         "summary": summary,
-        "found": bool(found),
+        "found": target is not None,
         "bbox": bbox,
-        "area": float(area),
-        "offset_x": float(offset_x),
-        "center_offset_x": float(offset_x),
-        "confidence": float(target.confidence) if target else 0.0,
+        "area": area,
+        "offset_x": offset_x,
+        "center_offset_x": offset_x,
+        "confidence": confidence,
         "distance_norm": distance_norm,
     }
 
 
-def parse_target(text: str) -> dict[str, Optional[str]]:
-    # Very small target extractor (label + color).
-    color = None
-    if re.search(r"\bred\b", text):
-        color = "red"
-    if re.search(r"\bblue\b", text):
-        color = "blue"
-    if re.search(r"\bgreen\b", text):
-        color = "green"
-    if re.search(r"\byellow\b", text):
-        color = "yellow"
-
-    label = None
-    for candidate in ["ring", "cube", "person", "obstacle", "object", "block"]:
-        if re.search(rf"\b{re.escape(candidate)}\b", text):
-            label = candidate
-            break
-    if label == "block":
-        label = "cube"
-    if label in ("object", "obstacle") and color:
-        label = "obstacle"
-    return {"label": label, "color": color}
-
-
-def parse_actions(text: str) -> tuple[str, list[dict[str, Any]], dict[str, Optional[str]]]:
-    """
-    Returns (task_type, canonical_actions, target)
-    task_type: stop | move-pattern | move-if-clear | pick-object | unknown
-    """
-    t = text.lower().strip()
-    t = re.sub(r"\s+", " ", t)
-
-    target = parse_target(t)
-
-    if re.search(r"(emergency stop|e-stop|estop|abort|halt|\bstop\b)", t):
-        return "stop", [{"type": "STOP"}], target
-
-    # Conditional forward steps based on visual absence/presence of a colored obstacle.
-    has_if_no = bool(re.search(r"\bif\b", t) and re.search(r"\b(no|not|can't|cannot|dont|don't)\b", t) and target.get("color"))
-    has_until = bool(re.search(r"\buntil\b", t) and target.get("color"))
-    wants_forward = bool(re.search(r"\b(forward|ahead|straight)\b", t))
-    if (has_if_no or has_until) and wants_forward:
-        return "move-if-clear", [{"type": "MOVE", "direction": "forward", "distance_m": 1.0, "speed": 0.55}], target
-
-    # Motion-only multi-step parsing.
-    motion_trigger = bool(
-        re.search(r"\b(move|go|drive|head|strafe|slide|shift)\b", t)
-        or re.search(r"\b(turn|rotate)\b", t)
-        or re.search(r"\b(reverse|back up)\b", t)
-    )
-    if motion_trigger:
-        clauses = [c.strip() for c in re.split(r"\b(?:and then|then|after that|afterwards|next)\b|,|;", t) if c.strip()]
-        if len(clauses) <= 1:
-            dir_mentions = len(re.findall(r"\b(forward|backward|backwards|back|behind|left|right)\b", t))
-            if dir_mentions >= 2 and " and " in t:
-                clauses = [c.strip() for c in re.split(r"\band\b", t) if c.strip()]
-
-        actions: list[dict[str, Any]] = []
-        for clause in clauses if clauses else [t]:
-            if re.search(r"\b(turn (to )?(the )?left|rotate left|counterclockwise)\b", clause):
-                actions.append({"type": "TURN", "direction": "left", "angle_deg": 90, "speed": 0.55})
-                continue
-            if re.search(r"\b(turn (to )?(the )?right|rotate right|clockwise)\b", clause):
-                actions.append({"type": "TURN", "direction": "right", "angle_deg": 90, "speed": 0.55})
-                continue
-            if re.search(r"\b(backward|backwards|back up|move back|go back|reverse|behind)\b", clause):
-                actions.append({"type": "MOVE", "direction": "backward", "distance_m": 1.0, "speed": 0.55})
-                continue
-            if re.search(r"\b(strafe left|slide left)\b|\bleft\b", clause):
-                actions.append({"type": "MOVE", "direction": "left", "distance_m": 1.0, "speed": 0.55})
-                continue
-            if re.search(r"\b(strafe right|slide right)\b|\bright\b", clause):
-                actions.append({"type": "MOVE", "direction": "right", "distance_m": 1.0, "speed": 0.55})
-                continue
-            if re.search(r"\b(move forward|go forward|drive forward|forward|ahead|straight)\b", clause):
-                actions.append({"type": "MOVE", "direction": "forward", "distance_m": 1.0, "speed": 0.55})
-                continue
-
-        if actions:
-            return "move-pattern", actions, target
-
-    if re.search(r"\b(pick up|pickup|grab)\b", t):
-        return "pick-object", [], target
-
-    return "unknown", [], target
-
-
-def build_allowed_tokens(system_manifest: Any) -> dict[str, set[str]]:
-    out: dict[str, set[str]] = {}
-    if not isinstance(system_manifest, dict):
-        return out
-    nodes = system_manifest.get("nodes")
-    if not isinstance(nodes, list):
-        return out
-    for n in nodes:
-        if not isinstance(n, dict):
-            continue
-        name = n.get("name")
-        if not isinstance(name, str) or not name.strip():
-            continue
-        toks: set[str] = set()
-        commands = n.get("commands")
-        if isinstance(commands, list):
-            for c in commands:
-                if isinstance(c, dict) and isinstance(c.get("token"), str):
-                    toks.add(str(c.get("token")).upper())
-        out[name.strip()] = toks
-        # Also allow node_id / display_name keys if present.
-        for k in ["node_id", "display_name"]:
-            if isinstance(n.get(k), str) and n.get(k).strip():
-                out[n.get(k).strip()] = toks
-    return out
-
-
-def map_move_to_step(caps: dict[str, Any], allowed: dict[str, set[str]], action: dict[str, Any]) -> list[dict[str, Any]]:
-    target = str(caps.get("base_target", "base"))
-    fwd = str(caps.get("base_fwd_token", "FWD"))
-    turn = str(caps.get("base_turn_token", "TURN"))
-    strafe = str(caps.get("base_strafe_token", "STRAFE"))
-    speed = float(action.get("speed") or 0.55)
-
-    tokens = allowed.get(target, set())
-    token_ok = lambda tok: (not allowed) or (tok.upper() in tokens)
-
-    steps: list[dict[str, Any]] = []
-    typ = action.get("type")
-    if typ == "TURN":
-        ang = float(abs(action.get("angle_deg") or 90.0))
-        signed = -ang if action.get("direction") == "left" else ang
-        tok = turn if token_ok(turn) else ("MECANUM" if token_ok("MECANUM") else None)
-        if tok is None:
-            return []
-        args = [signed] if tok == turn else (["Q"] if signed < 0 else ["E"])
-        steps.append({"type": "RUN", "target": target, "token": tok, "args": args, "duration_ms": 360})
-        return steps
-
-    if typ != "MOVE":
-        return steps
-
-    direction = action.get("direction")
-    distance_m = float(action.get("distance_m") or 1.0)
-    duration = int(_clamp(round(distance_m * 1800.0), 250, 8000))
-    if direction == "forward":
-        if not token_ok(fwd):
-            return []
-        steps.append({"type": "RUN", "target": target, "token": fwd, "args": [speed], "duration_ms": duration})
-        return steps
-    if direction == "backward":
-        tok = "BWD" if token_ok("BWD") else ("MECANUM" if token_ok("MECANUM") else None)
-        if tok is None:
-            return []
-        args = [speed] if tok == "BWD" else ["B"]
-        steps.append({"type": "RUN", "target": target, "token": tok, "args": args, "duration_ms": duration})
-        return steps
-    if direction in ("left", "right"):
-        dir_token = "L" if direction == "left" else "R"
-        if token_ok(strafe):
-            steps.append({"type": "RUN", "target": target, "token": strafe, "args": [dir_token, speed], "duration_ms": duration})
-            return steps
-        if token_ok("MECANUM"):
-            steps.append({"type": "RUN", "target": target, "token": "MECANUM", "args": [dir_token], "duration_ms": duration})
-            return steps
-        # Fallback: approximate strafe with a turn.
-        if token_ok(turn):
-            steps.append({"type": "RUN", "target": target, "token": turn, "args": [-90 if direction == "left" else 90], "duration_ms": 360})
-            return steps
-        return []
-    return steps
-
-
-def normalize_state(input_state: Any) -> dict[str, Any]:
-    default_caps = {
-        "base_target": "base",
-        "arm_target": "arm",
-        "base_turn_token": "TURN",
-        "base_fwd_token": "FWD",
-        "base_strafe_token": "STRAFE",
-        "arm_grip_token": "GRIP",
-    }
-    if not isinstance(input_state, dict):
-        return {
-            "stage": "SEARCH",
-            "scan_dir": 1,
-            "scan_ticks": 0,
-            "capabilities": dict(default_caps),
-            "instruction_ctx": {"hash": ""},
-            "motion_ctx": {"consumed": False, "step_idx": 0, "total_steps": 0},
-            "target_lock_ctx": None,
-            "perf_ctx": {"recommended_interval_ms": 180},
-        }
-    caps_in = input_state.get("capabilities") if isinstance(input_state.get("capabilities"), dict) else {}
-    return {
-        "stage": str(input_state.get("stage") or "SEARCH").upper(),
-        "scan_dir": 1 if float(input_state.get("scan_dir") or 1) >= 0 else -1,
-        "scan_ticks": int(max(0, float(input_state.get("scan_ticks") or 0))),
-        "capabilities": {
-            "base_target": str(caps_in.get("base_target") or default_caps["base_target"]),
-            "arm_target": str(caps_in.get("arm_target") or default_caps["arm_target"]),
-            "base_turn_token": str(caps_in.get("base_turn_token") or default_caps["base_turn_token"]),
-            "base_fwd_token": str(caps_in.get("base_fwd_token") or default_caps["base_fwd_token"]),
-            "base_strafe_token": str(caps_in.get("base_strafe_token") or default_caps["base_strafe_token"]),
-            "arm_grip_token": str(caps_in.get("arm_grip_token") or default_caps["arm_grip_token"]),
-        },
-        "instruction_ctx": {
-            "hash": str((input_state.get("instruction_ctx") or {}).get("hash") or ""),
-        },
-        "motion_ctx": {
-            "consumed": bool((input_state.get("motion_ctx") or {}).get("consumed") or False),
-            "step_idx": int(max(0, float((input_state.get("motion_ctx") or {}).get("step_idx") or 0))),
-            "total_steps": int(max(0, float((input_state.get("motion_ctx") or {}).get("total_steps") or 0))),
-        },
-        "target_lock_ctx": None,
-        "perf_ctx": {"recommended_interval_ms": int(max(80, min(600, float((input_state.get("perf_ctx") or {}).get("recommended_interval_ms") or 180))))},
-    }
-
-
-def reset_for_instruction(state: dict[str, Any], new_hash: str) -> dict[str, Any]:
-    out = dict(state)
-    out["stage"] = "SEARCH"
-    out["scan_dir"] = 1
-    out["scan_ticks"] = 0
-    out["instruction_ctx"] = {"hash": new_hash}
-    out["motion_ctx"] = {"consumed": False, "step_idx": 0, "total_steps": 0}
-    return out
+ALL_DETECTORS = frozenset({"red", "cube", "ring", "person"})
 
 
-def pick_target(objects: list[DetectedObject], target_spec: dict[str, Optional[str]]) -> Optional[DetectedObject]:
+def wanted_detectors(target_spec: dict[str, Optional[str]]) -> frozenset[str]:
+    """Detectors whose result pick_target could select for target_spec (all of them when no target is named)."""
     want_label = (target_spec.get("label") or "").strip().lower()
     want_color = (target_spec.get("color") or "").strip().lower()
-    if not objects:
-        return None
     if not want_label and not want_color:
-        # Nothing requested; pick best.
-        return max(objects, key=lambda o: o.confidence)
-
-    def matches(o: DetectedObject) -> bool:
-        label = o.label.lower()
-        attrs = [a.lower() for a in (o.attributes or [])]
-        if want_label and want_label in label:
-            return True
-        if want_color and (want_color in label or any(want_color in a for a in attrs)):
-            return True
-        return False
-
-    candidates = [o for o in objects if matches(o)]
-    if not candidates:
-        return None
-    return max(candidates, key=lambda o: o.confidence)
-
-
-def build_plan_and_state(
-    state: dict[str, Any],
-    task_type: str,
-    actions: list[dict[str, Any]],
-    target_spec: dict[str, Optional[str]],
-    perception: dict[str, Any],
-    allowed: dict[str, set[str]],
-) -> tuple[list[dict[str, Any]], dict[str, Any], list[str], str]:
-    caps = state.get("capabilities") if isinstance(state.get("capabilities"), dict) else {}
-    notes: list[str] = []
-
-    if task_type == "stop":
-        return [{"type": "STOP"}], {**state, "stage": "DONE"}, ["Stop requested"], "STOP"
-
-    if task_type == "move-if-clear":
-        # If the target (color) is present "in path", stop; else emit a short forward step.
-        target = perception.get("selected_target") if isinstance(perception, dict) else None
-        in_path = False
-        if isinstance(target, dict):
-            area = float(perception.get("area") or 0.0)
-            off = float(perception.get("offset_x") or 0.0)
-            conf = float(perception.get("confidence") or 0.0)
-            in_path = conf >= 0.25 and area >= 0.02 and abs(off) <= 0.28
-        if in_path:
-            notes.append("Obstacle detected in path; stopping")
-            return [{"type": "STOP"}], {**state, "stage": "DONE"}, notes, "MOVE/IF_CLEAR"
-        notes.append("Path appears clear; stepping forward")
-        return (
-            [{"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_fwd_token", "FWD")), "args": [0.45], "duration_ms": 240}, {"type": "STOP"}],
-            {**state, "stage": "SEARCH"},
-            notes,
-            "MOVE/IF_CLEAR",
-        )
-
-    if task_type == "move-pattern":
-        # Emit the full macro once per instruction.
-        mc = state.get("motion_ctx") if isinstance(state.get("motion_ctx"), dict) else {"step_idx": 0, "total_steps": 0, "consumed": False}
-        if mc.get("consumed"):
-            return [{"type": "STOP"}], {**state, "stage": "MOTION_ONLY"}, ["motion macro already emitted for current instruction"], "MOVE/PATTERN"
-        steps: list[dict[str, Any]] = []
-        for act in actions:
-            steps.extend(map_move_to_step(caps, allowed, act))
-        if not steps:
-            steps = [{"type": "STOP"}]
-        else:
-            steps.append({"type": "STOP"})
-        next_state = dict(state)
-        next_state["stage"] = "MOTION_ONLY"
-        next_state["motion_ctx"] = {"consumed": True, "step_idx": len(steps), "total_steps": len(steps)}
-        notes.append(f"motion macro emitted {max(0, len(steps)-1)} steps ({len(steps)} total)")
-        return steps, next_state, notes, "MOVE/PATTERN"
-
-    if task_type == "pick-object":
-        # Very simple closed-loop behavior:
-        # - if target found: align by turning until centered, then approach until close, then close claw
-        # - else: small scan turn
-        stage = str(state.get("stage") or "SEARCH").upper()
-        target = perception.get("selected_target") if isinstance(perception, dict) else None
-        if stage == "DONE":
-            stage = "SEARCH"
-        if not isinstance(target, dict):
-            # scan
-            scan_dir = int(state.get("scan_dir") or 1)
-            scan_ticks = int(state.get("scan_ticks") or 0) + 1
-            if scan_ticks % 5 == 0:
-                scan_dir *= -1
-            next_state = dict(state)
-            next_state["scan_dir"] = scan_dir
-            next_state["scan_ticks"] = scan_ticks
-            next_state["stage"] = "SEARCH"
-            notes.append("No target found; scanning")
-            plan = [
-                {"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_turn_token", "TURN")), "args": [12 * scan_dir], "duration_ms": 220},
-                {"type": "STOP"},
-            ]
-            return plan, next_state, notes, "PICK/SEARCH"
-
-        off = float(perception.get("offset_x") or 0.0)
-        area = float(perception.get("area") or 0.0)
-        if abs(off) > 0.07:
-            turn_deg = _clamp(off * 55.0, -20.0, 20.0)
-            notes.append("Turning to center target")
-            next_state = dict(state)
-            next_state["stage"] = "ALIGN"
-            plan = [
-                {"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_turn_token", "TURN")), "args": [round(turn_deg, 2)], "duration_ms": 220},
-                {"type": "STOP"},
-            ]
-            return plan, next_state, notes, "PICK/ALIGN"
-
-        if area < 0.10:
-            notes.append("Approaching target")
-            next_state = dict(state)
-            next_state["stage"] = "APPROACH"
-            plan = [
-                {"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_fwd_token", "FWD")), "args": [0.45], "duration_ms": 240},
-                {"type": "STOP"},
-            ]
-            return plan, next_state, notes, "PICK/APPROACH"
-
-        # close claw
-        notes.append("Close enough; closing claw")
-        next_state = dict(state)
-        next_state["stage"] = "DONE"
-        plan = [
-            {"type": "RUN", "target": str(caps.get("arm_target", "arm")), "token": str(caps.get("arm_grip_token", "GRIP")), "args": ["close"]},
-            {"type": "STOP"},
-        ]
-        return plan, next_state, notes, "PICK/GRAB"
-
-    return [{"type": "STOP"}], {**state, "stage": "DONE"}, ["Unknown task; stopping"], "UNKNOWN"
+        return ALL_DETECTORS
+    wanted = set()
+    # detect_red reports label "red object" with a "red" attribute; the shape detectors only match by label.
+    if want_color == "red" or (want_label and want_label in "red object"):
+        wanted.add("red")
+    for name in ("cube", "ring", "person"):
+        if want_label and want_label in name:
+            wanted.add(name)
+    return frozenset(wanted)
 
 
 class VisionBrain:
-    def __init__(self, snapshot_url: str, enable_person: bool):
+    def __init__(self, snapshot_url: str, enable_person: bool, detect_timeout_s: float = DETECT_TIMEOUT_S):
         self.snapshot_url = snapshot_url
         self.enable_person = enable_person
+        self.detect_timeout_s = max(0.05, float(detect_timeout_s))
+        self._hog = _people_hog() if enable_person and cv2 is not None else None
+        self._pool = ThreadPoolExecutor(
+            max_workers=VISION_STEP_WORKERS * DETECTOR_KINDS, thread_name_prefix="vision-detect"
+        )
+        # Detector futures that overran the budget and are still occupying a worker, keyed by detector.
+        # While one is running that detector is skipped, so timed-out jobs can't pile up in the pool.
+        self._overrun_lock = threading.Lock()
+        self._overrun: dict[str, Future] = {}
+        self._scene_lock = threading.Lock()
+        # (average hash, monotonic time, detectors run, detections) for the last analysed frame.
+        self._scene_cache: Optional[tuple[int, float, frozenset[str], tuple[DetectedObject, ...]]] = None
+        # Perception dicts composed from those detections, keyed by (label, color); dropped with the scene.
+        self._scene_perceptions: dict[tuple[Any, Any], dict[str, Any]] = {}
+        # Keep-alive connection(s) to the camera node instead of a new TCP handshake per frame.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Set by main() when --perceive-fps enables the background producer.
+        self.perception_cache: Optional[PerceptionCache] = None
+
+    def fetch_snapshot(self, timeout_s: float = 1.5) -> bytes:
+        resp = self._session.get(self.snapshot_url, timeout=timeout_s)
+        if resp.status_code != 200:
+            raise RuntimeError(f"snapshot fetch failed: HTTP {resp.status_code}")
+        return resp.content
 
-    def capture_frame(self, timeout_s: float = 1.5) -> "np.ndarray":
+    def decode_frame(self, raw: bytes) -> "np.ndarray":
         if cv2 is None or np is None:
             raise RuntimeError("OpenCV unavailable (install python3-opencv + python3-numpy)")
-        resp = requests.get(self.snapshot_url, timeout=timeout_s)
-        if resp.status_code != 200:
-            raise RuntimeError(f"snapshot fetch failed: HTTP {resp.status_code}")
-        raw = resp.content
         arr = np.frombuffer(raw, dtype=np.uint8)
         frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
         if frame is None:
             raise RuntimeError("snapshot decode failed")
         return frame
 
+    def capture_frame(self, timeout_s: float = 1.5) -> "np.ndarray":
+        if cv2 is None or np is None:
+            raise RuntimeError("OpenCV unavailable (install python3-opencv + python3-numpy)")
+        return self.decode_frame(self.fetch_snapshot(timeout_s=timeout_s))
+
     def perceive(self, frame_bgr: "np.ndarray", target_spec: dict[str, Optional[str]]) -> tuple[dict[str, Any], list[str]]:
         notes: list[str] = []
         objects: list[DetectedObject] = []
-        # Always run red + simple shapes; optionally run person.
-        red = detect_red(frame_bgr)
-        if red:
-            objects.append(red)
-        cube = detect_cube_like(frame_bgr)
-        if cube:
-            objects.append(cube)
-        ring = detect_ring_like(frame_bgr)
-        if ring:
-            objects.append(ring)
-        if self.enable_person:
-            person = detect_person_like(frame_bgr)
-            if person:
-                objects.append(person)
-
+        # Every detector is O(pixels) and reports normalized bboxes, so run them all on one downscaled copy.
+        h, w = frame_bgr.shape[:2]
+        # The cube/ring pixel thresholds were tuned on camera frames; they are scaled by this factor.
+        scale = 1.0
+        if w > VISION_WIDTH:
+            scale = VISION_WIDTH / float(w)
+            frame_bgr = cv2.resize(frame_bgr, (VISION_WIDTH, int(VISION_WIDTH * (h / float(w)))), interpolation=cv2.INTER_AREA)
+        # Shape detectors share one grayscale conversion.
+        gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
+
+        # Scene-change early exit: a robot holding position sees near-identical frames between polls.
+        # Compare an 8x8 average hash against the last frame and reuse its detections when it barely moved.
+        thumb = cv2.resize(gray, (8, 8), interpolation=cv2.INTER_AREA)
+        scene_hash = int.from_bytes(np.packbits(thumb > thumb.mean()).tobytes(), "little")
+        wanted = wanted_detectors(target_spec)
+        if not self.enable_person:
+            wanted = wanted - {"person"}
+        now = time.monotonic()
+        with self._scene_lock:
+            cached = self._scene_cache
+        if (
+            cached is not None
+            and now - cached[1] <= SCENE_CACHE_MAX_AGE_S
+            and wanted <= cached[2]
+            and bin(scene_hash ^ cached[0]).count("1") < SCENE_HASH_MAX_BITS
+        ):
+            notes.append("perception_cache=hit")
+            # Same detections and same target give the same perception, so reuse the composed dict.
+            key = (target_spec.get("label"), target_spec.get("color"))
+            with self._scene_lock:
+                perception = self._scene_perceptions.get(key) if self._scene_cache is cached else None
+            if perception is not None:
+                notes.append("perception_source=local_cv")
+                return perception, notes
+            perception, notes = self._finish_perception(list(cached[3]), target_spec, notes)
+            with self._scene_lock:
+                if self._scene_cache is cached:
+                    self._scene_perceptions[key] = perception
+            return perception, notes
+
+        # Only the detectors whose output pick_target could select for this target.
+        jobs: list[tuple[Any, tuple[Any, ...]]] = []
+        if "red" in wanted:
+            jobs.append((detect_red, (frame_bgr,)))
+        if "cube" in wanted:
+            jobs.append((detect_cube_like, (frame_bgr, cv2.GaussianBlur(gray, (5, 5), 0), scale)))
+        if "ring" in wanted:
+            jobs.append((detect_ring_like, (frame_bgr, cv2.GaussianBlur(gray, (7, 7), 0), scale)))
+        if "person" in wanted:
+            jobs.append((detect_person_like, (frame_bgr, self._hog)))
+        # OpenCV releases the GIL, so the detectors overlap across cores. Results are collected in
+        # submission order to keep object ordering (and pick_target ties) deterministic.
+        futures: list[Optional[Future]] = []
+        with self._overrun_lock:
+            for fn, fn_args in jobs:
+                overrun = self._overrun.get(fn.__name__)
+                if overrun is not None and not overrun.done():
+                    futures.append(None)
+                    continue
+                self._overrun.pop(fn.__name__, None)
+                futures.append(self._pool.submit(fn, *fn_args))
+        deadline = time.monotonic() + self.detect_timeout_s
+        incomplete = False
+        for (fn, _), fut in zip(jobs, futures):
+            if fut is None:
+                notes.append(f"detector_busy={fn.__name__}")
+                incomplete = True
+                continue
+            try:
+                obj = fut.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                notes.append(f"detector_timeout={fn.__name__}")
+                incomplete = True
+                with self._overrun_lock:
+                    self._overrun[fn.__name__] = fut
+                continue
+            if obj:
+                objects.append(obj)
+
+        if not incomplete:
+            with self._scene_lock:
+                self._scene_cache = (scene_hash, now, wanted, tuple(objects))
+                self._scene_perceptions = {}
+        return self._finish_perception(objects, target_spec, notes)
+
+    def _finish_perception(
+        self, objects: list[DetectedObject], target_spec: dict[str, Optional[str]], notes: list[str]
+    ) -> tuple[dict[str, Any], list[str]]:
         selected = pick_target(objects, target_spec)
         summary = f"local_cv: {len(objects)} objects"
         if selected:
@@ -656,6 +544,187 @@ class VisionBrain:
         return perception, notes
 
 
+class PerceptionCache:
+    """
+    Background perception producer. While /vision_step keeps asking, it captures and perceives for the
+    most recently requested target at perceive_fps, so a request is normally answered from a result
+    at most max_age_ms old instead of fetching and decoding a snapshot inline.
+    """
+
+    def __init__(self, brain: VisionBrain, fps: float, max_age_ms: int):
+        self._brain = brain
+        self._period = 1.0 / max(0.5, float(fps))
+        self._max_age_s = max(0, int(max_age_ms)) / 1000.0
+        self._cv = threading.Condition()
+        self._spec: Optional[dict[str, Optional[str]]] = None
+        self._last_request = 0.0
+        self._refresh = False
+        # (frame time, target key, perception, notes, error) of the newest producer run.
+        self._result: Optional[tuple[float, tuple[Any, Any], Optional[dict[str, Any]], list[str], Optional[str]]] = None
+        threading.Thread(target=self._run, name="perception-producer", daemon=True).start()
+
+    @staticmethod
+    def _key(target_spec: dict[str, Optional[str]]) -> tuple[Any, Any]:
+        return target_spec.get("label"), target_spec.get("color")
+
+    def _fresh(self, key: tuple[Any, Any], since: float) -> bool:
+        r = self._result
+        return r is not None and r[1] == key and r[0] >= since
+
+    def get(self, target_spec: dict[str, Optional[str]], timeout_s: float) -> tuple[dict[str, Any], list[str], int]:
+        """(perception, notes, frame age ms) for target_spec, waiting up to timeout_s for a fresh enough run."""
+        key = self._key(target_spec)
+        with self._cv:
+            now = time.monotonic()
+            self._last_request = now
+            if self._spec is None or self._key(self._spec) != key:
+                self._spec = dict(target_spec)
+            since = now - self._max_age_s
+            if not self._fresh(key, since):
+                self._refresh = True
+            # Also wakes an idle producer.
+            self._cv.notify_all()
+            if not self._cv.wait_for(lambda: self._fresh(key, since), timeout_s):
+                raise TimeoutError("perception producer timed out")
+            frame_ts, _, perception, notes, error = self._result  # type: ignore[misc]
+        if error is not None or perception is None:
+            raise RuntimeError(error or "perception failed")
+        return perception, list(notes), int((time.monotonic() - frame_ts) * 1000)
+
+    def _run(self) -> None:
+        next_run = 0.0
+        while True:
+            with self._cv:
+                while True:
+                    now = time.monotonic()
+                    active = self._spec is not None and now - self._last_request < PRODUCER_IDLE_S
+                    if active and (self._refresh or now >= next_run):
+                        break
+                    self._cv.wait(timeout=max(0.0, next_run - now) if active else None)
+                self._refresh = False
+                spec = dict(self._spec or {})
+            frame_ts = time.monotonic()
+            next_run = frame_ts + self._period
+            perception: Optional[dict[str, Any]] = None
+            notes: list[str] = []
+            error: Optional[str] = None
+            try:
+                frame = self._brain.decode_frame(self._brain.fetch_snapshot(timeout_s=SNAPSHOT_TIMEOUT_S))
+                perception, notes = self._brain.perceive(frame, spec)
+            except Exception as exc:
+                error = str(exc)
+            with self._cv:
+                self._result = (frame_ts, self._key(spec), perception, notes, error)
+                self._cv.notify_all()
+
+
+@lru_cache(maxsize=64)
+def _parse_instruction(
+    instruction: str,
+) -> tuple[str, list[dict[str, Any]], dict[str, Optional[str]], str, dict[str, Any]]:
+    # The desktop app repeats one instruction for hundreds of steps; parse and hash it once.
+    # Callers must treat the returned actions/target as read-only since they are shared.
+    task_type, actions, target_spec = parse_actions(instruction)
+    normalized = _RE_WHITESPACE.sub(" ", instruction.lower()).strip()
+    # debug.parsed_instruction depends only on the instruction, so it is built here once as well.
+    parsed = {
+        "task_type": task_type,
+        "canonical_actions": actions if actions else None,
+        "target": {"label": target_spec.get("label"), "color": target_spec.get("color"), "query": None},
+    }
+    return task_type, actions, target_spec, _instruction_hash(normalized), parsed
+
+
+def frame_needed(instruction: str) -> bool:
+    return _parse_instruction(instruction)[0] not in MOTION_ONLY_TASKS
+
+
+def handle_vision_step(
+    brain: VisionBrain, body: Any, header_correlation_id: str, fetch_snapshot: Callable[[], bytes]
+) -> tuple[int, dict[str, Any]]:
+    """Transport-independent /vision_step: returns (status, payload). fetch_snapshot is only called when perceiving."""
+    if not isinstance(body, dict):
+        return 400, {"error": "BAD_REQUEST", "message": "Body must be a JSON object"}
+    instruction = str(body.get("instruction") or "").strip()
+    if not instruction:
+        return 400, {"error": "BAD_REQUEST", "message": "instruction is required"}
+    correlation_id = (
+        (str(body.get("correlation_id") or "").strip())
+        or header_correlation_id.strip()
+        or f"pi-{_now_ms()}"
+    )
+
+    t0 = time.monotonic()
+    try:
+        task_type, actions, target_spec, ihash, parsed_instruction = _parse_instruction(instruction)
+        state = normalize_state(body.get("state"))
+        notes: list[str] = []
+        if state.get("instruction_ctx", {}).get("hash") != ihash:
+            state = reset_for_instruction(state, ihash)
+            notes.append("instruction hash changed; state reset")
+
+        # Only the motion macro checks tokens against the manifest, and only on the step that emits it;
+        # once motion_ctx is consumed the planner answers STOP without looking. Other branches use fixed tokens.
+        emits_macro = task_type == "move-pattern" and not state["motion_ctx"]["consumed"]
+        allowed = build_allowed_tokens(body.get("system_manifest")) if emits_macro else {}
+        camera_meta: dict[str, Any] = {"source": "pi_internal", "snapshot_url": brain.snapshot_url}
+
+        # Perception is local; capture a frame unless motion-only/stop.
+        if task_type in MOTION_ONLY_TASKS:
+            perception = _PERCEPTION_BYPASSED
+            perception_notes = ["perception_source=none"]
+            perception_source = "none"
+        elif brain.perception_cache is not None:
+            perception, perception_notes, frame_age_ms = brain.perception_cache.get(
+                target_spec, timeout_s=SNAPSHOT_TIMEOUT_S + brain.detect_timeout_s
+            )
+            camera_meta["age_ms"] = frame_age_ms
+            perception_source = "local_cv"
+        else:
+            frame = brain.decode_frame(fetch_snapshot())
+            perception, perception_notes = brain.perceive(frame, target_spec)
+            perception_source = "local_cv"
+        notes.extend(perception_notes)
+
+        plan, next_state, policy_notes, policy_branch = build_plan_and_state(
+            state,
+            task_type,
+            actions,
+            target_spec,
+            perception,
+            allowed,
+        )
+        notes.extend(policy_notes)
+
+        total_ms = int((time.monotonic() - t0) * 1000)
+        # Recommend a faster loop for conditional motion.
+        rec_ms = CLOSED_LOOP_INTERVAL_MS if task_type in ("move-if-clear", "pick-object") else 220
+        next_state["perf_ctx"] = {"recommended_interval_ms": int(_clamp(rec_ms, 80, 600))}
+
+        return (
+            200,
+            {
+                "correlation_id": correlation_id,
+                "state": next_state,
+                "perception": perception,
+                "plan": plan,
+                "debug": {
+                    "correlation_id": correlation_id,
+                    "applied_instruction": instruction,
+                    "instruction_hash": ihash,
+                    "policy_branch": policy_branch,
+                    "perception_source": perception_source,
+                    "parsed_instruction": parsed_instruction,
+                    "camera_meta": camera_meta,
+                    "notes": notes,
+                    "timings_ms": {"total": total_ms},
+                },
+            },
+        )
+    except Exception as exc:
+        return 400, {"error": "VISION_ERROR", "message": str(exc), "correlation_id": correlation_id}
+
+
 def run_server(*, listen: str, port: int, brain: VisionBrain) -> None:
     class DualStackServer(ThreadingHTTPServer):
         # Bind an IPv6 socket with dual-stack enabled so `.local` can resolve to either v4 or v6.
@@ -670,6 +739,10 @@ def run_server(*, listen: str, port: int, brain: VisionBrain) -> None:
             super().server_bind()
 
     class Handler(BaseHTTPRequestHandler):
+        # Buffer the response so headers + JSON body leave in one send when the handler flushes,
+        # instead of one unbuffered write for the headers and another for the body.
+        wbufsize = 64 * 1024
+
         def _write(self, code: int, payload: dict[str, Any]) -> None:
             raw = _json(payload)
             self.send_response(code)
@@ -702,99 +775,18 @@ def run_server(*, listen: str, port: int, brain: VisionBrain) -> None:
             try:
                 size = int(self.headers.get("Content-Length", "0") or "0")
                 raw = self.rfile.read(size) if size > 0 else b"{}"
-                body = json.loads(raw.decode("utf-8")) if raw else {}
-                if not isinstance(body, dict):
-                    raise RuntimeError("Body must be a JSON object")
+                body = _json_loads(raw) if raw else {}
             except Exception as exc:
                 self._write(400, {"error": "BAD_REQUEST", "message": str(exc)})
                 return
 
-            instruction = str(body.get("instruction") or "").strip()
-            if not instruction:
-                self._write(400, {"error": "BAD_REQUEST", "message": "instruction is required"})
-                return
-            correlation_id = (
-                (str(body.get("correlation_id") or "").strip())
-                or (self.headers.get("X-Correlation-Id") or "").strip()
-                or f"pi-{_now_ms()}"
+            code, payload = handle_vision_step(
+                brain,
+                body,
+                self.headers.get("X-Correlation-Id") or "",
+                lambda: brain.fetch_snapshot(timeout_s=SNAPSHOT_TIMEOUT_S),
             )
-
-            t0 = time.time()
-            try:
-                state = normalize_state(body.get("state"))
-                normalized = re.sub(r"\s+", " ", instruction.lower()).strip()
-                ihash = _fnv1a_32(normalized)
-                notes: list[str] = []
-                if state.get("instruction_ctx", {}).get("hash") != ihash:
-                    state = reset_for_instruction(state, ihash)
-                    notes.append("instruction hash changed; state reset")
-
-                task_type, actions, target_spec = parse_actions(instruction)
-                allowed = build_allowed_tokens(body.get("system_manifest"))
-
-                # Perception is local; capture a frame unless motion-only/stop.
-                if task_type in ("move-pattern", "stop"):
-                    perception = {
-                        "objects": [],
-                        "selected_target": None,
-                        "summary": "perception bypassed (motion-only)",
-                        "found": False,
-                        "bbox": None,
-                        "area": 0.0,
-                        "offset_x": 0.0,
-                        "center_offset_x": 0.0,
-                        "confidence": 0.0,
-                        "distance_norm": 0.0,
-                    }
-                    perception_notes = ["perception_source=none"]
-                    perception_source = "none"
-                else:
-                    frame = brain.capture_frame(timeout_s=1.8)
-                    perception, perception_notes = brain.perceive(frame, target_spec)
-                    perception_source = "local_cv"
-                notes.extend(perception_notes)
-
-                plan, next_state, policy_notes, policy_branch = build_plan_and_state(
-                    state,
-                    task_type,
-                    actions,
-                    target_spec,
-                    perception,
-                    allowed,
-                )
-                notes.extend(policy_notes)
-
-                total_ms = int((time.time() - t0) * 1000)
-                # Recommend a faster loop for conditional motion.
-                rec_ms = 140 if task_type in ("move-if-clear", "pick-object") else 220
-                next_state["perf_ctx"] = {"recommended_interval_ms": int(_clamp(rec_ms, 80, 600))}
-
-                self._write(
-                    200,
-                    {
-                        "correlation_id": correlation_id,
-                        "state": next_state,
-                        "perception": perception,
-                        "plan": plan,
-                        "debug": {
-                            "correlation_id": correlation_id,
-                            "applied_instruction": instruction,
-                            "instruction_hash": ihash,
-                            "policy_branch": policy_branch,
-                            "perception_source": perception_source,
-                            "parsed_instruction": {
-                                "task_type": task_type,
-                                "canonical_actions": actions if actions else None,
-                                "target": {"label": target_spec.get("label"), "color": target_spec.get("color"), "query": None},
-                            },
-                            "camera_meta": {"source": "pi_internal", "snapshot_url": brain.snapshot_url},
-                            "notes": notes,
-                            "timings_ms": {"total": total_ms},
-                        },
-                    },
-                )
-            except Exception as exc:
-                self._write(400, {"error": "VISION_ERROR", "message": str(exc), "correlation_id": correlation_id})
+            self._write(code, payload)
 
         def log_message(self, _format: str, *_args: Any) -> None:
             return
@@ -807,16 +799,133 @@ def run_server(*, listen: str, port: int, brain: VisionBrain) -> None:
     httpd.serve_forever()
 
 
+def run_server_aiohttp(*, listen: str, port: int, brain: VisionBrain) -> None:
+    """
+    asyncio backend: one event loop serves all connections, the snapshot fetch reuses a pooled
+    aiohttp ClientSession, and the CPU-bound decode/perceive/plan work runs on a bounded executor.
+    """
+    try:
+        import asyncio
+
+        from aiohttp import ClientSession, ClientTimeout, web  # type: ignore
+    except ImportError as exc:
+        raise SystemExit("--http-backend aiohttp requires aiohttp (sudo apt-get install -y python3-aiohttp)") from exc
+
+    cors = {
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+        "Access-Control-Allow-Headers": "Content-Type, X-Correlation-Id",
+    }
+    # Separate from brain._pool: a vision_step job blocks on detector futures submitted there.
+    executor = ThreadPoolExecutor(max_workers=VISION_STEP_WORKERS, thread_name_prefix="vision-step")
+
+    def respond(code: int, payload: dict[str, Any]) -> "web.Response":
+        return web.Response(
+            status=code,
+            body=_json(payload),
+            content_type="application/json",
+            headers={"Cache-Control": "no-store", **cors},
+        )
+
+    async def health(_request: "web.Request") -> "web.Response":
+        return respond(200, {"ok": True, "ts_ms": _now_ms()})
+
+    async def options(_request: "web.Request") -> "web.Response":
+        return web.Response(status=204, headers=cors)
+
+    async def not_found(_request: "web.Request") -> "web.Response":
+        return respond(404, {"ok": False, "error": "not_found"})
+
+    async def vision_step(request: "web.Request") -> "web.Response":
+        try:
+            raw = await request.read()
+            body = _json_loads(raw) if raw else {}
+        except Exception as exc:
+            return respond(400, {"error": "BAD_REQUEST", "message": str(exc)})
+
+        snapshot: Optional[bytes] = None
+        fetch_error: Optional[Exception] = None
+        if brain.perception_cache is None and isinstance(body, dict) and frame_needed(str(body.get("instruction") or "")):
+            try:
+                async with request.app["snapshot_session"].get(brain.snapshot_url) as resp:
+                    if resp.status != 200:
+                        raise RuntimeError(f"snapshot fetch failed: HTTP {resp.status}")
+                    snapshot = await resp.read()
+            except Exception as exc:
+                fetch_error = exc
+
+        def fetch_snapshot() -> bytes:
+            if snapshot is None:
+                raise fetch_error or RuntimeError("snapshot fetch failed")
+            return snapshot
+
+        code, payload = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            handle_vision_step,
+            brain,
+            body,
+            request.headers.get("X-Correlation-Id") or "",
+            fetch_snapshot,
+        )
+        return respond(code, payload)
+
+    async def snapshot_session(app: "web.Application") -> Any:
+        # One keep-alive session for the whole process instead of a new TCP connection per frame.
+        async with ClientSession(timeout=ClientTimeout(total=SNAPSHOT_TIMEOUT_S)) as session:
+            app["snapshot_session"] = session
+            yield
+
+    app = web.Application()
+    app.cleanup_ctx.append(snapshot_session)
+    app.router.add_get("/health", health)
+    app.router.add_post("/vision_step", vision_step)
+    app.router.add_route("OPTIONS", "/{tail:.*}", options)
+    app.router.add_route("*", "/{tail:.*}", not_found)
+    print(f"pi_vision_brain (aiohttp) listening on http://{listen}:{port}")
+    web.run_app(app, host=None if listen in {"::", ""} else listen, port=int(port), print=None)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--listen", default="::")
     ap.add_argument("--port", type=int, default=8090)
     ap.add_argument("--snapshot-url", default="http://127.0.0.1:8081/snapshot.jpg")
     ap.add_argument("--enable-person", action="store_true", help="Enable HOG person detector (slower).")
+    ap.add_argument(
+        "--http-backend",
+        choices=("threading", "aiohttp"),
+        default="threading",
+        help="threading: stdlib ThreadingHTTPServer (default); aiohttp: asyncio server with pooled snapshot fetches.",
+    )
+    ap.add_argument(
+        "--perceive-fps",
+        type=float,
+        default=0.0,
+        help="Run capture + perception in a background producer at this rate while requests arrive; 0 perceives inline per request (default: 0)",
+    )
+    ap.add_argument(
+        "--max-perception-age-ms",
+        type=int,
+        default=120,
+        help="With --perceive-fps, answer from a producer result at most this old, else wait for the next (default: 120)",
+    )
+    ap.add_argument(
+        "--detect-timeout-ms",
+        type=int,
+        default=int(DETECT_TIMEOUT_S * 1000),
+        help=f"Per-frame budget for the local detectors; slower ones are dropped for that frame (default: {int(DETECT_TIMEOUT_S * 1000)})",
+    )
     args = ap.parse_args()
 
-    brain = VisionBrain(snapshot_url=str(args.snapshot_url), enable_person=bool(args.enable_person))
-    run_server(listen=str(args.listen), port=int(args.port), brain=brain)
+    brain = VisionBrain(
+        snapshot_url=str(args.snapshot_url),
+        enable_person=bool(args.enable_person),
+        detect_timeout_s=args.detect_timeout_ms / 1000.0,
+    )
+    if args.perceive_fps > 0:
+        brain.perception_cache = PerceptionCache(brain, fps=float(args.perceive_fps), max_age_ms=int(args.max_perception_age_ms))
+    serve = run_server_aiohttp if args.http_backend == "aiohttp" else run_server
+    serve(listen=str(args.listen), port=int(args.port), brain=brain)
     return 0
 
 
@@ -12,28 +12,51 @@ Transport
 - HTTP: GET /snapshot.jpg and GET /stream.mjpg
 
 Implementation details
-- Capture uses `fswebcam` (usb webcam via V4L2). We keep a background thread that refreshes the
-  latest JPEG and serves it from memory to avoid spawning `fswebcam` on every HTTP request.
+- Capture reads MJPEG frames straight from the V4L2 driver through memory-mapped buffers (no exec, no
+  temp file). If the device cannot be set up that way, it falls back to spawning `fswebcam` per frame.
+  Either way a background thread refreshes the latest JPEG and HTTP requests are served from memory.
+- optional: pip install orjson (faster /health and MANIFEST encoding; stdlib json is used otherwise)
 """
 
 from __future__ import annotations
 
 import argparse
+import ctypes
+import fcntl
 import json
+import mmap
+import os
+import select
+import selectors
 import socket
 import subprocess
 import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+# Durations (uptime, watchdogs) use the coarse monotonic clock: a VDSO read with no NTP steps, at
+# jiffy (ms-level) resolution. Wall-clock _now_ms() is only for timestamps sent to other machines.
+_MONO_CLOCK = getattr(time, "CLOCK_MONOTONIC_COARSE", time.CLOCK_MONOTONIC)
+
+
+def _mono_ms() -> int:
+    return time.clock_gettime_ns(_MONO_CLOCK) // 1_000_000
+
+
 DEFAULT_MANIFEST = {
     "daemon_version": "0.1",
     "device": {"name": "rc-car-camera", "version": "0.1.0", "node_id": "cam"},
@@ -67,12 +90,227 @@ DEFAULT_MANIFEST = {
 }
 
 
-def send_line(conn: socket.socket, line: str) -> None:
-    conn.sendall((line + "\n").encode("utf-8"))
+def _json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+
+
+def send_buffers(conn: socket.socket, buffers: "list[bytes | memoryview]") -> None:
+    # sendmsg is writev: several buffers leave in one syscall without being concatenated first.
+    views = [memoryview(b) for b in buffers if b]
+    while views:
+        sent = conn.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views.pop(0))
+        if sent:
+            views[0] = views[0][sent:]
 
 
 def manifest_line(manifest: dict) -> str:
-    return f"MANIFEST {json.dumps(manifest, separators=(',', ':'))}"
+    return "MANIFEST " + _json(manifest).decode("utf-8")
+
+
+# V4L2 ABI subset (linux/videodev2.h) for memory-mapped capture. ctypes reproduces the native struct
+# layout, so the ioctl numbers (which encode sizeof) are right on both 32-bit and 64-bit Pi OS.
+V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+V4L2_MEMORY_MMAP = 1
+V4L2_FIELD_ANY = 0
+V4L2_PIX_FMT_MJPEG = int.from_bytes(b"MJPG", "little")
+V4L2_BUF_FLAG_TIMESTAMP_MASK = 0xE000
+V4L2_BUF_FLAG_TIMESTAMP_MONOTONIC = 0x2000
+
+
+class _V4L2PixFormat(ctypes.Structure):
+    _fields_ = [
+        (name, ctypes.c_uint32)
+        for name in (
+            "width",
+            "height",
+            "pixelformat",
+            "field",
+            "bytesperline",
+            "sizeimage",
+            "colorspace",
+            "priv",
+            "flags",
+            "ycbcr_enc",
+            "quantization",
+            "xfer_func",
+        )
+    ]
+
+
+class _V4L2FormatUnion(ctypes.Union):
+    # raw_data fixes the union size; the pointer member gives it the kernel's alignment (v4l2_window holds pointers).
+    _fields_ = [("pix", _V4L2PixFormat), ("raw_data", ctypes.c_uint8 * 200), ("_align", ctypes.c_void_p)]
+
+
+class _V4L2Format(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_uint32), ("fmt", _V4L2FormatUnion)]
+
+
+class _V4L2RequestBuffers(ctypes.Structure):
+    _fields_ = [
+        ("count", ctypes.c_uint32),
+        ("type", ctypes.c_uint32),
+        ("memory", ctypes.c_uint32),
+        ("capabilities", ctypes.c_uint32),
+        ("flags", ctypes.c_uint8),
+        ("reserved", ctypes.c_uint8 * 3),
+    ]
+
+
+class _V4L2Timecode(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("frames", ctypes.c_uint8),
+        ("seconds", ctypes.c_uint8),
+        ("minutes", ctypes.c_uint8),
+        ("hours", ctypes.c_uint8),
+        ("userbits", ctypes.c_uint8 * 4),
+    ]
+
+
+class _Timeval(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_usec", ctypes.c_long)]
+
+
+class _V4L2BufferM(ctypes.Union):
+    _fields_ = [("offset", ctypes.c_uint32), ("userptr", ctypes.c_ulong), ("planes", ctypes.c_void_p), ("fd", ctypes.c_int32)]
+
+
+class _V4L2Buffer(ctypes.Structure):
+    _fields_ = [
+        ("index", ctypes.c_uint32),
+        ("type", ctypes.c_uint32),
+        ("bytesused", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("field", ctypes.c_uint32),
+        ("timestamp", _Timeval),
+        ("timecode", _V4L2Timecode),
+        ("sequence", ctypes.c_uint32),
+        ("memory", ctypes.c_uint32),
+        ("m", _V4L2BufferM),
+        ("length", ctypes.c_uint32),
+        ("reserved2", ctypes.c_uint32),
+        ("request_fd", ctypes.c_int32),
+    ]
+
+
+def _vidioc(direction: int, nr: int, size: int) -> int:
+    # _IOC(dir, 'V', nr, size); dir: 1 = write, 3 = read/write.
+    return (direction << 30) | (size << 16) | (ord("V") << 8) | nr
+
+
+VIDIOC_S_FMT = _vidioc(3, 5, ctypes.sizeof(_V4L2Format))
+VIDIOC_REQBUFS = _vidioc(3, 8, ctypes.sizeof(_V4L2RequestBuffers))
+VIDIOC_QUERYBUF = _vidioc(3, 9, ctypes.sizeof(_V4L2Buffer))
+VIDIOC_QBUF = _vidioc(3, 15, ctypes.sizeof(_V4L2Buffer))
+VIDIOC_DQBUF = _vidioc(3, 17, ctypes.sizeof(_V4L2Buffer))
+VIDIOC_STREAMON = _vidioc(1, 18, ctypes.sizeof(ctypes.c_int))
+VIDIOC_STREAMOFF = _vidioc(1, 19, ctypes.sizeof(ctypes.c_int))
+
+
+class V4L2MjpegReader:
+    """Reads MJPEG frames from a V4L2 device through a small ring of driver-owned mmap buffers."""
+
+    def __init__(self, device: str, width: int, height: int, buffer_count: int = 2):
+        self._fd = os.open(device, os.O_RDWR | os.O_NONBLOCK)
+        self._maps: list[mmap.mmap] = []
+        self._streaming = False
+        try:
+            fmt = _V4L2Format(type=V4L2_BUF_TYPE_VIDEO_CAPTURE)
+            fmt.fmt.pix.width = int(width)
+            fmt.fmt.pix.height = int(height)
+            fmt.fmt.pix.pixelformat = V4L2_PIX_FMT_MJPEG
+            fmt.fmt.pix.field = V4L2_FIELD_ANY
+            fcntl.ioctl(self._fd, VIDIOC_S_FMT, fmt)
+            if fmt.fmt.pix.pixelformat != V4L2_PIX_FMT_MJPEG:
+                raise RuntimeError("device does not offer MJPEG")
+
+            req = _V4L2RequestBuffers(count=int(buffer_count), type=V4L2_BUF_TYPE_VIDEO_CAPTURE, memory=V4L2_MEMORY_MMAP)
+            fcntl.ioctl(self._fd, VIDIOC_REQBUFS, req)
+            if req.count < 1:
+                raise RuntimeError("driver allocated no capture buffers")
+            for index in range(req.count):
+                buf = self._buffer(index)
+                fcntl.ioctl(self._fd, VIDIOC_QUERYBUF, buf)
+                self._maps.append(
+                    mmap.mmap(self._fd, buf.length, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE, offset=buf.m.offset)
+                )
+                fcntl.ioctl(self._fd, VIDIOC_QBUF, buf)
+
+            fcntl.ioctl(self._fd, VIDIOC_STREAMON, ctypes.c_int(V4L2_BUF_TYPE_VIDEO_CAPTURE))
+            self._streaming = True
+        except Exception:
+            self.close()
+            raise
+
+    @staticmethod
+    def _buffer(index: int) -> _V4L2Buffer:
+        return _V4L2Buffer(index=index, type=V4L2_BUF_TYPE_VIDEO_CAPTURE, memory=V4L2_MEMORY_MMAP)
+
+    def _dequeue_newest(self) -> Optional[_V4L2Buffer]:
+        # Drain every filled buffer (non-blocking fd, so DQBUF raises EAGAIN when empty) and requeue
+        # all but the newest: frames that sat in the driver queue are stale by buffer_count / fps.
+        newest: Optional[_V4L2Buffer] = None
+        while True:
+            buf = self._buffer(0)
+            try:
+                fcntl.ioctl(self._fd, VIDIOC_DQBUF, buf)
+            except BlockingIOError:
+                return newest
+            if newest is not None:
+                fcntl.ioctl(self._fd, VIDIOC_QBUF, newest)
+            newest = buf
+
+    @staticmethod
+    def _age_s(buf: _V4L2Buffer) -> float:
+        # Only monotonic driver timestamps are comparable with time.monotonic(); treat others as fresh.
+        if buf.flags & V4L2_BUF_FLAG_TIMESTAMP_MASK != V4L2_BUF_FLAG_TIMESTAMP_MONOTONIC:
+            return 0.0
+        return time.monotonic() - (buf.timestamp.tv_sec + buf.timestamp.tv_usec / 1e6)
+
+    def read(self, consume: Callable[[memoryview], None], timeout_s: float, max_age_s: float = 0.0) -> None:
+        """Wait for a frame and pass it to consume() while its driver buffer is dequeued; consume must copy it out."""
+        deadline = time.monotonic() + timeout_s
+        while True:
+            buf = self._dequeue_newest()
+            if buf is None:
+                ready, _, _ = select.select([self._fd], [], [], max(0.0, deadline - time.monotonic()))
+                if not ready:
+                    raise TimeoutError("no frame from V4L2 device")
+                continue
+            try:
+                if max_age_s > 0 and self._age_s(buf) > max_age_s and time.monotonic() < deadline:
+                    continue  # requeued below; wait for the next frame
+                # The only copy is consume()'s, straight out of the mapping; the buffer is requeued below.
+                with memoryview(self._maps[buf.index]) as mapped:
+                    consume(mapped[: buf.bytesused])
+                return
+            finally:
+                fcntl.ioctl(self._fd, VIDIOC_QBUF, buf)
+
+    def close(self) -> None:
+        if self._streaming:
+            try:
+                fcntl.ioctl(self._fd, VIDIOC_STREAMOFF, ctypes.c_int(V4L2_BUF_TYPE_VIDEO_CAPTURE))
+            except OSError:
+                pass
+            self._streaming = False
+        for m in self._maps:
+            m.close()
+        self._maps = []
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+# Published JPEGs live in a ring of preallocated slots that readers lease as memoryviews.
+FRAME_SLOTS = 4
+FRAME_SLOT_BYTES = 256 * 1024
 
 
 class CameraCapture:
@@ -86,6 +324,8 @@ class CameraCapture:
         skip_frames: int,
         warmup_captures: int,
         tmp_dir: str,
+        backend: str = "v4l2",
+        max_frame_age_ms: int = 0,
     ):
         self._device = device
         self._width = int(width)
@@ -97,24 +337,87 @@ class CameraCapture:
         self._tmp_dir = Path(tmp_dir)
         self._tmp_dir.mkdir(parents=True, exist_ok=True)
         self._tmp_path = self._tmp_dir / "daemon_latest.jpg"
+        # fswebcam writes the JPEG to stdout ("-") so no file is written and read back per frame;
+        # cleared the first time a build hands back nothing, after which the temp file is used.
+        self._fswebcam_stdout = True
+        self._backend = backend
+        self._max_age_s = max(0, int(max_frame_age_ms)) / 1000.0
+        self._v4l2: Optional[V4L2MjpegReader] = None
+        # RUN SNAP may capture from a client thread while the background loop does too.
+        self._capture_lock = threading.Lock()
 
         self._lock = threading.Lock()
-        self._latest: Optional[bytes] = None
+        # Stream clients block on this until the capture loop publishes a frame with a new sequence number.
+        self._frame_cv = threading.Condition(self._lock)
+        self._seq = 0
+        self._frame_listeners: list[Callable[[], None]] = []
+        # Frame ring: acquire_frame() leases the newest slot and release_frame() returns it. The capture
+        # only refills slots nobody holds, so a slow client never sends a half-overwritten JPEG.
+        self._slots = [bytearray(FRAME_SLOT_BYTES) for _ in range(FRAME_SLOTS)]
+        self._slot_len = [0] * FRAME_SLOTS
+        self._slot_readers = [0] * FRAME_SLOTS
+        self._head = -1
         self._last_capture_ms = 0
+        self._latest_mono = 0.0
         self._ok = False
         self._stop = threading.Event()
         self._thread = threading.Thread(target=self._loop, daemon=True)
 
     def start(self) -> None:
+        if self._backend == "v4l2":
+            try:
+                self._v4l2 = V4L2MjpegReader(self._device, self._width, self._height)
+            except Exception as exc:
+                print(f"V4L2 MJPEG capture unavailable ({exc}); falling back to fswebcam", flush=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._stop.set()
         self._thread.join(timeout=1.5)
+        with self._capture_lock:
+            if self._v4l2 is not None:
+                self._v4l2.close()
+                self._v4l2 = None
+
+    def _lease_locked(self) -> Optional[memoryview]:
+        if self._head < 0:
+            return None
+        self._slot_readers[self._head] += 1
+        return memoryview(self._slots[self._head])[: self._slot_len[self._head]]
+
+    def acquire_frame(self) -> tuple[Optional[memoryview], int]:
+        """Lease the newest frame as (view, seq); hand the view to release_frame() once it has been sent."""
+        with self._lock:
+            return self._lease_locked(), self._seq
 
-    def snapshot_bytes(self) -> Optional[bytes]:
+    def release_frame(self, view: memoryview) -> None:
         with self._lock:
-            return self._latest
+            for i, slot in enumerate(self._slots):
+                if slot is view.obj:
+                    self._slot_readers[i] -= 1
+                    break
+
+    def latest_seq(self) -> int:
+        return self._seq
+
+    def on_frame(self, callback: Callable[[], None]) -> None:
+        """Register a non-blocking callback run (outside the lock) after each published frame."""
+        self._frame_listeners.append(callback)
+
+    def wait_for_frame(self, last_seq: int, timeout: float) -> tuple[Optional[memoryview], int]:
+        """Block until a frame newer than last_seq is published and lease it; (None, seq) on timeout."""
+        with self._frame_cv:
+            if not self._frame_cv.wait_for(lambda: self._seq != last_seq and self._head >= 0, timeout):
+                return None, self._seq
+            return self._lease_locked(), self._seq
+
+    def acquire_fresh_frame(self) -> Optional[memoryview]:
+        """Lease the latest frame, re-capturing first if there is none yet or it is older than max_frame_age_ms."""
+        with self._lock:
+            stale = self._head < 0 or (self._max_age_s > 0 and time.monotonic() - self._latest_mono > self._max_age_s)
+        if stale:
+            self._capture_into_latest()
+        return self.acquire_frame()[0]
 
     def status(self) -> tuple[bool, int]:
         with self._lock:
@@ -124,7 +427,7 @@ class CameraCapture:
         # Called from RUN SNAP as best-effort synchronous refresh.
         self._capture_into_latest()
 
-    def _fswebcam_cmd(self) -> list[str]:
+    def _fswebcam_cmd(self, output: str) -> list[str]:
         cmd = [
             "fswebcam",
             "--no-banner",
@@ -138,37 +441,69 @@ class CameraCapture:
         ]
         if self._skip > 0:
             cmd.extend(["-S", str(self._skip)])
-        cmd.append(str(self._tmp_path))
+        cmd.append(output)
         return cmd
 
+    def _fswebcam_capture(self) -> bytes:
+        if self._fswebcam_stdout:
+            proc = subprocess.run(self._fswebcam_cmd("-"), check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            if proc.stdout:
+                return proc.stdout
+            self._fswebcam_stdout = False
+            print("fswebcam wrote nothing to stdout; using the temp file instead", flush=True)
+        subprocess.run(self._fswebcam_cmd(str(self._tmp_path)), check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return self._tmp_path.read_bytes()
+
+    def _publish(self, frame: "bytes | memoryview") -> None:
+        n = len(frame)
+        with self._lock:
+            free = [j % FRAME_SLOTS for j in range(self._head + 1, self._head + 1 + FRAME_SLOTS) if not self._slot_readers[j % FRAME_SLOTS]]
+            if free:
+                i = free[0]
+                if len(self._slots[i]) < n:
+                    self._slots[i] = bytearray(n)
+            else:
+                # Every slot is still being sent somewhere: leave the oldest buffer to its readers.
+                i = (self._head + 1) % FRAME_SLOTS
+                self._slots[i] = bytearray(max(FRAME_SLOT_BYTES, n))
+                self._slot_readers[i] = 0
+            self._slots[i][:n] = frame
+            self._slot_len[i] = n
+            self._head = i
+            self._ok = True
+            self._last_capture_ms = _now_ms()
+            self._latest_mono = time.monotonic()
+            self._seq += 1
+            self._frame_cv.notify_all()
+
     def _capture_into_latest(self) -> None:
         try:
-            subprocess.run(self._fswebcam_cmd(), check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            raw = self._tmp_path.read_bytes()
+            with self._capture_lock:
+                if self._v4l2 is not None:
+                    self._v4l2.read(self._publish, timeout_s=2.0, max_age_s=self._max_age_s)
+                else:
+                    self._publish(self._fswebcam_capture())
         except Exception:
             with self._lock:
                 self._ok = False
             return
-
-        with self._lock:
-            self._latest = raw
-            self._ok = True
-            self._last_capture_ms = _now_ms()
+        for callback in self._frame_listeners:
+            callback()
 
     def _loop(self) -> None:
         # Warmup to avoid the first frame being stale/dark.
         for _ in range(self._warmup):
-            if self._stop.is_set():
-                return
             self._capture_into_latest()
-            time.sleep(0.08)
+            if self._stop.wait(0.08):
+                return
 
         period = 1.0 / self._fps
         while not self._stop.is_set():
-            t0 = time.time()
+            t0 = time.monotonic()
             self._capture_into_latest()
-            dt = time.time() - t0
-            time.sleep(max(0.0, period - dt))
+            dt = time.monotonic() - t0
+            # Waiting on the stop event instead of sleeping lets stop() interrupt the pacing delay.
+            self._stop.wait(max(0.0, period - dt))
 
 
 def run_http_server(
@@ -179,14 +514,38 @@ def run_http_server(
     mjpeg_fps: float,
 ) -> ThreadingHTTPServer:
     boundary = "frame"
+    # Only Content-Length varies between MJPEG parts, so the rest of the part framing is encoded once.
+    part_prefix = f"--{boundary}\r\nContent-Type: image/jpeg\r\nContent-Length: ".encode("ascii")
 
     class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps the connection open between requests, so the vision server's pooled
+        # session polls /snapshot.jpg over one socket instead of a new handshake per frame.
+        # Every fixed response carries Content-Length (204 has no body); the MJPEG stream sends Connection: close.
+        protocol_version = "HTTP/1.1"
+        # Close a kept-alive connection after 30 s without a request (or a stream client that stops reading),
+        # so idle clients don't pin handler threads forever.
+        timeout = 30
+
         def _set_common_headers(self, content_type: str) -> None:
             self.send_header("Content-Type", content_type)
             self.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
             self.send_header("Pragma", "no-cache")
             self.send_header("Access-Control-Allow-Origin", "*")
 
+        def _end_headers_with(self, *body: "bytes | memoryview") -> None:
+            # end_headers() would flush the header block as its own send; append the blank line here
+            # and let it go out together with the body in a single sendmsg.
+            self._headers_buffer.append(b"\r\n")
+            head = b"".join(self._headers_buffer)
+            self._headers_buffer = []
+            send_buffers(self.connection, [head, *body])
+
+        def _send(self, code: int, content_type: str, body: "bytes | memoryview") -> None:
+            self.send_response(code)
+            self._set_common_headers(content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self._end_headers_with(body)
+
         def do_OPTIONS(self) -> None:  # noqa: N802
             self.send_response(204)
             self.send_header("Access-Control-Allow-Origin", "*")
@@ -197,61 +556,48 @@ def run_http_server(
         def do_GET(self) -> None:  # noqa: N802
             if self.path.startswith("/health"):
                 ok, last_ms = capture.status()
-                payload = json.dumps({"ok": ok, "last_capture_ms": last_ms}).encode("utf-8")
-                self.send_response(200)
-                self._set_common_headers("application/json")
-                self.send_header("Content-Length", str(len(payload)))
-                self.end_headers()
-                self.wfile.write(payload)
+                payload = _json({"ok": ok, "last_capture_ms": last_ms})
+                self._send(200, "application/json", payload)
                 return
 
             if self.path.startswith("/snapshot.jpg"):
-                raw = capture.snapshot_bytes()
-                if raw is None:
-                    # Best-effort immediate capture if we have nothing yet.
-                    capture.capture_once()
-                    raw = capture.snapshot_bytes()
-                if raw is None:
-                    self.send_response(503)
-                    self._set_common_headers("text/plain")
-                    self.end_headers()
-                    self.wfile.write(b"camera_unavailable")
+                view = capture.acquire_fresh_frame()
+                if view is None:
+                    self._send(503, "text/plain", b"camera_unavailable")
                     return
-
-                self.send_response(200)
-                self._set_common_headers("image/jpeg")
-                self.send_header("Content-Length", str(len(raw)))
-                self.end_headers()
-                self.wfile.write(raw)
+                try:
+                    self._send(200, "image/jpeg", view)
+                finally:
+                    capture.release_frame(view)
                 return
 
             if self.path.startswith("/stream.mjpg") or self.path.startswith("/stream.mjpeg"):
                 self.send_response(200)
                 self._set_common_headers(f"multipart/x-mixed-replace; boundary={boundary}")
+                self.send_header("Connection", "close")
                 self.end_headers()
+                self.close_connection = True
 
                 period = 1.0 / max(0.5, float(mjpeg_fps))
+                last_seq = -1
                 while True:
-                    raw = capture.snapshot_bytes()
-                    if raw is None:
-                        time.sleep(0.1)
+                    view, seq = capture.wait_for_frame(last_seq, timeout=1.0)
+                    if view is None:
                         continue
+                    last_seq = seq
+                    sent_at = time.monotonic()
                     try:
-                        self.wfile.write(f"--{boundary}\r\n".encode("ascii"))
-                        self.wfile.write(b"Content-Type: image/jpeg\r\n")
-                        self.wfile.write(f"Content-Length: {len(raw)}\r\n\r\n".encode("ascii"))
-                        self.wfile.write(raw)
-                        self.wfile.write(b"\r\n")
-                        self.wfile.flush()
+                        # One sendmsg per part, straight from the frame slot.
+                        send_buffers(self.connection, [part_prefix, b"%d\r\n\r\n" % len(view), view, b"\r\n"])
                     except Exception:
                         break
-                    time.sleep(period)
+                    finally:
+                        capture.release_frame(view)
+                    # Cap the stream at --mjpeg-fps when the capture loop runs faster.
+                    time.sleep(max(0.0, period - (time.monotonic() - sent_at)))
                 return
 
-            self.send_response(404)
-            self._set_common_headers("text/plain")
-            self.end_headers()
-            self.wfile.write(b"not_found")
+            self._send(404, "text/plain", b"not_found")
 
         def log_message(self, format: str, *args) -> None:  # noqa: A002
             return
@@ -262,31 +608,320 @@ def run_http_server(
     return httpd
 
 
-@dataclass
+_HTTP_REASONS = {200: "OK", 204: "No Content", 404: "Not Found", 503: "Service Unavailable"}
+
+
+def _http_head(code: int, content_type: Optional[str], length: Optional[int] = None, extra: tuple[str, ...] = ()) -> bytes:
+    lines = [f"HTTP/1.0 {code} {_HTTP_REASONS[code]}"]
+    if content_type:
+        lines += [
+            f"Content-Type: {content_type}",
+            "Cache-Control: no-store, no-cache, must-revalidate, max-age=0",
+            "Pragma: no-cache",
+        ]
+    lines.append("Access-Control-Allow-Origin: *")
+    lines.extend(extra)
+    if length is not None:
+        lines.append(f"Content-Length: {length}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("ascii")
+
+
+class _HttpConn:
+    __slots__ = ("sock", "inbuf", "out", "close_after", "streaming", "last_seq", "next_due", "lease")
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.out: list[memoryview] = []
+        self.close_after = False
+        self.streaming = False
+        self.last_seq = -1
+        self.next_due = 0.0
+        self.lease: Optional[memoryview] = None
+
+
+# Per-send bound for /snapshot.jpg on the selectors backend; a client that stops reading is dropped after it.
+SNAPSHOT_SEND_TIMEOUT_S = 5.0
+
+
+def run_http_server_selectors(capture: CameraCapture, *, listen: str, port: int, mjpeg_fps: float) -> threading.Thread:
+    """
+    Single-threaded HTTP backend: one epoll loop accepts, parses requests and fans every new frame
+    out to all MJPEG clients with non-blocking sendmsg, instead of one blocked thread per client.
+    A client still draining the previous part simply skips frames. Snapshot requests, which may
+    have to capture first, run on a small worker pool.
+    """
+    boundary = "frame"
+    part_prefix = f"--{boundary}\r\nContent-Type: image/jpeg\r\nContent-Length: ".encode("ascii")
+    stream_head = _http_head(200, f"multipart/x-mixed-replace; boundary={boundary}")
+    options_head = _http_head(
+        204, None, extra=("Access-Control-Allow-Methods: GET, OPTIONS", "Access-Control-Allow-Headers: Content-Type")
+    )
+    period = 1.0 / max(0.5, float(mjpeg_fps))
+
+    srv = socket.create_server((listen, int(port)), family=socket.AF_INET6 if ":" in listen else socket.AF_INET)
+    srv.setblocking(False)
+    wake_r, wake_w = socket.socketpair()
+    wake_r.setblocking(False)
+    wake_w.setblocking(False)
+
+    def wake() -> None:
+        try:
+            wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # a wakeup is already pending
+
+    capture.on_frame(wake)
+    sel = selectors.DefaultSelector()
+    sel.register(srv, selectors.EVENT_READ, None)
+    sel.register(wake_r, selectors.EVENT_READ, wake_r)
+    conns: dict[socket.socket, _HttpConn] = {}
+    snapshot_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="camera-snapshot")
+
+    def release(c: _HttpConn) -> None:
+        if c.lease is not None:
+            capture.release_frame(c.lease)
+            c.lease = None
+
+    def close(c: _HttpConn) -> None:
+        c.out.clear()
+        release(c)
+        conns.pop(c.sock, None)
+        sel.unregister(c.sock)
+        c.sock.close()
+
+    def flush(c: _HttpConn) -> None:
+        try:
+            while c.out:
+                sent = c.sock.sendmsg(c.out)
+                while c.out and sent >= len(c.out[0]):
+                    sent -= len(c.out.pop(0))
+                if sent:
+                    c.out[0] = c.out[0][sent:]
+        except BlockingIOError:
+            sel.modify(c.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, c)
+            return
+        except OSError:
+            close(c)
+            return
+        release(c)
+        if c.close_after:
+            close(c)
+        else:
+            sel.modify(c.sock, selectors.EVENT_READ, c)
+
+    def queue(c: _HttpConn, *buffers: "bytes | memoryview") -> None:
+        c.out.extend(memoryview(b) for b in buffers if b)
+        flush(c)
+
+    def serve_snapshot(sock: socket.socket) -> None:
+        try:
+            # Blocking sends on a 2-thread pool: bound them so stalled clients can't hold every worker.
+            sock.settimeout(SNAPSHOT_SEND_TIMEOUT_S)
+            view = capture.acquire_fresh_frame()
+            if view is None:
+                send_buffers(sock, [_http_head(503, "text/plain", 18), b"camera_unavailable"])
+                return
+            try:
+                send_buffers(sock, [_http_head(200, "image/jpeg", len(view)), view])
+            finally:
+                capture.release_frame(view)
+        except OSError:
+            pass
+        finally:
+            sock.close()
+
+    def handle_request(c: _HttpConn) -> None:
+        request_line = bytes(c.inbuf.split(b"\r\n", 1)[0]).decode("latin-1")
+        parts = request_line.split()
+        method = parts[0] if parts else ""
+        path = parts[1] if len(parts) > 1 else ""
+        c.close_after = True
+        if method == "OPTIONS":
+            queue(c, options_head)
+        elif path.startswith("/health"):
+            ok, last_ms = capture.status()
+            payload = _json({"ok": ok, "last_capture_ms": last_ms})
+            queue(c, _http_head(200, "application/json", len(payload)), payload)
+        elif path.startswith("/snapshot.jpg"):
+            conns.pop(c.sock)
+            sel.unregister(c.sock)
+            snapshot_pool.submit(serve_snapshot, c.sock)
+        elif path.startswith("/stream.mjpg") or path.startswith("/stream.mjpeg"):
+            c.close_after = False
+            c.streaming = True
+            queue(c, stream_head)
+        else:
+            queue(c, _http_head(404, "text/plain", 9), b"not_found")
+
+    def fan_out() -> Optional[float]:
+        # Lease the newest frame to every idle stream client that is due; return the next due time, if any.
+        seq = capture.latest_seq()
+        now = time.monotonic()
+        next_due: Optional[float] = None
+        for c in list(conns.values()):
+            if not c.streaming or c.out or c.last_seq == seq:
+                continue
+            if now < c.next_due:
+                next_due = c.next_due if next_due is None else min(next_due, c.next_due)
+                continue
+            view, c.last_seq = capture.acquire_frame()
+            if view is None:
+                continue
+            c.lease = view
+            c.next_due = now + period
+            queue(c, part_prefix, b"%d\r\n\r\n" % len(view), view, b"\r\n")
+        return next_due
+
+    def loop() -> None:
+        next_due: Optional[float] = None
+        while True:
+            timeout = 1.0 if next_due is None else max(0.0, next_due - time.monotonic())
+            for key, events in sel.select(timeout=timeout):
+                if key.data is None:
+                    try:
+                        sock, _ = srv.accept()
+                    except BlockingIOError:
+                        continue
+                    sock.setblocking(False)
+                    conns[sock] = _HttpConn(sock)
+                    sel.register(sock, selectors.EVENT_READ, conns[sock])
+                    continue
+                if key.data is wake_r:
+                    try:
+                        while wake_r.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                c = key.data
+                if c.sock not in conns:
+                    continue
+                if events & selectors.EVENT_WRITE:
+                    flush(c)
+                    if c.sock not in conns:
+                        continue
+                if events & selectors.EVENT_READ:
+                    try:
+                        chunk = c.sock.recv(4096)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        chunk = b""
+                    if not chunk:
+                        close(c)
+                        continue
+                    if c.streaming or c.close_after:
+                        continue  # request already answered; ignore trailing input
+                    c.inbuf += chunk
+                    if b"\r\n\r\n" in c.inbuf or len(c.inbuf) > 16384:
+                        handle_request(c)
+            next_due = fan_out()
+
+    t = threading.Thread(target=loop, daemon=True)
+    t.start()
+    return t
+
+
+@dataclass(eq=False)
 class ClientState:
     conn: socket.socket
-    running: bool = True
-    telemetry_enabled: bool = False
     started_ms: int = 0
     last_token: str = "NONE"
+    # Serializes writes to conn between the client's handler thread and the telemetry broadcaster.
+    send_lock: threading.Lock = field(default_factory=threading.Lock)
+    # Unsent tail of a TELEMETRY line; written out before anything else so lines are never torn.
+    pending: bytearray = field(default_factory=bytearray)
+
+    def send_reply(self, data: bytes) -> None:
+        # Called from the handler thread, which may block: finish any partial telemetry line first.
+        with self.send_lock:
+            if self.pending:
+                self.conn.sendall(self.pending)
+                self.pending.clear()
+            self.conn.sendall(data)
+
+
+class TelemetryBroadcaster:
+    """One thread pushes TELEMETRY to every subscribed client instead of one sleeping thread per client."""
+
+    def __init__(self, capture: CameraCapture, http_port: int, period_s: float = 0.6):
+        self._capture = capture
+        self._period_s = period_s
+        # http_port never changes, so it is baked into the shared tail template.
+        self._tail = b" capture_ok=%d last_capture_ms=%d http_port=" + b"%d\n" % http_port
+        self._lock = threading.Lock()
+        self._clients: set[ClientState] = set()
+        # Set while anyone is subscribed, so an idle node has no telemetry wakeups at all.
+        self._active = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
 
+    def start(self) -> None:
+        self._thread.start()
 
-def telemetry_loop(state: ClientState, capture: CameraCapture, http_port: int) -> None:
-    while state.running:
-        if not state.telemetry_enabled:
-            time.sleep(0.1)
-            continue
-        uptime = _now_ms() - state.started_ms
-        ok, last_ms = capture.status()
-        try:
-            send_line(
-                state.conn,
-                f"TELEMETRY uptime_ms={uptime} last_token={state.last_token} capture_ok={int(ok)} last_capture_ms={last_ms} http_port={http_port}",
-            )
-        except OSError:
-            break
-        time.sleep(0.6)
+    def stop(self) -> None:
+        self._stop.set()
+        self._active.set()
+        self._thread.join(timeout=1.0)
+
+    def add(self, state: ClientState) -> None:
+        with self._lock:
+            self._clients.add(state)
+            self._active.set()
 
+    def remove(self, state: ClientState) -> None:
+        with self._lock:
+            self._clients.discard(state)
+            if not self._clients:
+                self._active.clear()
+
+    def _loop(self) -> None:
+        while True:
+            self._active.wait()
+            if self._stop.wait(self._period_s):
+                return
+            with self._lock:
+                clients = list(self._clients)
+            if not clients:
+                continue
+            # Capture status and the shared tail are built once per tick; only the per-client head varies.
+            ok, last_ms = self._capture.status()
+            tail = self._tail % (int(ok), last_ms)
+            now = _mono_ms()
+            for state in clients:
+                # Skip a client whose handler thread is mid-reply; it gets the next tick.
+                if not state.send_lock.acquire(blocking=False):
+                    continue
+                try:
+                    self._push(state, now, tail)
+                except OSError:
+                    # The connection is gone; the handler thread sees the same error and cleans up.
+                    self.remove(state)
+                finally:
+                    state.send_lock.release()
+
+    @staticmethod
+    def _push(state: ClientState, now: int, tail: bytes) -> None:
+        # MSG_DONTWAIT makes only these sends non-blocking (the handler thread keeps its blocking socket), so
+        # a subscriber that stops reading never stalls telemetry for everyone else. Its backlog is at most
+        # one line: while an earlier line is still unsent, newer samples are skipped rather than queued,
+        # and it stays subscribed, catching up as soon as it reads again.
+        if state.pending:
+            try:
+                sent = state.conn.send(state.pending, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                return
+            del state.pending[:sent]
+            if state.pending:
+                return
+        head = b"TELEMETRY uptime_ms=%d last_token=%s" % (now - state.started_ms, state.last_token.encode("utf-8"))
+        try:
+            sent = state.conn.sendmsg([head, tail], [], socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            return
+        if sent < len(head) + len(tail):
+            state.pending += (head + tail)[sent:]
 
 def parse_run(parts: list[str]) -> tuple[str | None, list[str]]:
     if len(parts) < 2:
@@ -307,7 +942,7 @@ def handle_run(capture: CameraCapture, token: str, args: list[str]) -> str:
         return f"ERR INTERNAL {exc}"
 
 
-def bind_server(listen: str, port: int) -> socket.socket:
+def bind_server(listen: str, port: int, reuse_port: bool = False) -> socket.socket:
     last_error: Exception | None = None
     for family, sockaddr in (
         (socket.AF_INET6, (listen, port, 0, 0)),
@@ -316,6 +951,10 @@ def bind_server(listen: str, port: int) -> socket.socket:
         try:
             srv = socket.socket(family, socket.SOCK_STREAM)
             srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                # Every accept worker binds its own listener on the port; the kernel spreads new
+                # connections across them. Raises where SO_REUSEPORT is missing (caller falls back).
+                srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             if family == socket.AF_INET6:
                 try:
                     srv.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
@@ -332,62 +971,87 @@ def bind_server(listen: str, port: int) -> socket.socket:
     raise RuntimeError(f"Failed to bind server socket: {last_error}")
 
 
-def client_loop(conn: socket.socket, addr, manifest: dict, capture: CameraCapture, http_port: int) -> None:
-    state = ClientState(conn=conn, started_ms=_now_ms())
-    t_thread = threading.Thread(target=telemetry_loop, args=(state, capture, http_port), daemon=True)
-    t_thread.start()
-    m_line = manifest_line(manifest)
+def client_loop(conn: socket.socket, addr, m_line_bytes: bytes, capture: CameraCapture, telemetry: TelemetryBroadcaster) -> None:
+    state = ClientState(conn=conn, started_ms=_mono_ms())
+
+    def on_manifest(parts: list[bytes]) -> bytes:
+        return m_line_bytes
+
+    def on_sub(parts: list[bytes]) -> bytes:
+        if len(parts) < 2 or parts[1].upper() != b"TELEMETRY":
+            return b"ERR BAD_REQUEST unsupported\n"
+        telemetry.add(state)
+        return b"OK\n"
+
+    def on_unsub(parts: list[bytes]) -> bytes:
+        if len(parts) < 2 or parts[1].upper() != b"TELEMETRY":
+            return b"ERR BAD_REQUEST unsupported\n"
+        telemetry.remove(state)
+        return b"OK\n"
+
+    def on_stop(parts: list[bytes]) -> bytes:
+        state.last_token = "STOP"
+        return b"OK\n"
+
+    def on_run(parts: list[bytes]) -> bytes:
+        token, run_args = parse_run([p.decode("utf-8", errors="replace") for p in parts])
+        if not token:
+            return b"ERR BAD_ARGS missing_token\n"
+        resp = handle_run(capture, token, run_args)
+        if resp == "OK":
+            state.last_token = token.upper()
+        return (resp + "\n").encode("utf-8")
+
+    dispatch: dict[bytes, Callable[[list[bytes]], bytes]] = {
+        b"HELLO": on_manifest,
+        b"READ_MANIFEST": on_manifest,
+        b"SUB": on_sub,
+        b"UNSUB": on_unsub,
+        b"STOP": on_stop,
+        b"RUN": on_run,
+    }
+
+    def reply(line: bytes) -> bytes:
+        parts = line.split()
+        handler = dispatch.get(parts[0].upper())
+        return handler(parts) if handler is not None else b"ERR BAD_REQUEST unsupported\n"
 
     try:
         with conn:
-            file = conn.makefile("r", encoding="utf-8", newline="\n")
-            for raw_line in file:
-                line = raw_line.strip()
-                if not line:
-                    continue
-                parts = line.split()
-                cmd = parts[0].upper()
-
-                if cmd == "HELLO":
-                    send_line(conn, m_line)
-                    continue
-                if cmd == "READ_MANIFEST":
-                    send_line(conn, m_line)
-                    continue
-                if cmd == "SUB" and len(parts) >= 2 and parts[1].upper() == "TELEMETRY":
-                    state.telemetry_enabled = True
-                    send_line(conn, "OK")
-                    continue
-                if cmd == "UNSUB" and len(parts) >= 2 and parts[1].upper() == "TELEMETRY":
-                    state.telemetry_enabled = False
-                    send_line(conn, "OK")
-                    continue
-
-                if cmd == "STOP":
-                    state.last_token = "STOP"
-                    send_line(conn, "OK")
-                    continue
-
-                if cmd == "RUN":
-                    token, run_args = parse_run(parts)
-                    if not token:
-                        send_line(conn, "ERR BAD_ARGS missing_token")
-                        continue
-                    resp = handle_run(capture, token, run_args)
-                    if resp == "OK":
-                        state.last_token = token.upper()
-                    send_line(conn, resp)
-                    continue
-
-                send_line(conn, "ERR BAD_REQUEST unsupported")
+            # Commands are parsed as bytes straight out of one reusable receive buffer: no text codec,
+            # no makefile layer. Pipelined commands from one recv are answered with a single sendall.
+            buf = bytearray(4096)
+            filled = 0
+            while True:
+                if filled == len(buf):
+                    buf.extend(bytes(len(buf)))
+                n = conn.recv_into(memoryview(buf)[filled:])
+                if not n:
+                    # Treat a trailing unterminated line as complete, like file iteration did.
+                    line = bytes(buf[:filled]).strip()
+                    if line:
+                        state.send_reply(reply(line))
+                    break
+                filled += n
+                out = bytearray()
+                start = 0
+                while (nl := buf.find(b"\n", start, filled)) >= 0:
+                    line = bytes(buf[start:nl]).strip()
+                    start = nl + 1
+                    if line:
+                        out += reply(line)
+                if start:
+                    buf[: filled - start] = buf[start:filled]
+                    filled -= start
+                if out:
+                    state.send_reply(out)
     finally:
-        state.running = False
-        t_thread.join(timeout=1.0)
+        telemetry.remove(state)
         print(f"client disconnected: {addr}", flush=True)
 
 
 def main() -> None:
-    ap = argparse.ArgumentParser(description="DAEMON node + HTTP server for Pi USB camera (fswebcam)")
+    ap = argparse.ArgumentParser(description="DAEMON node + HTTP server for Pi USB camera (V4L2 MJPEG / fswebcam)")
     ap.add_argument("--listen", default="::", help="Bind address for TCP node (default: :: for dual-stack)")
     ap.add_argument("--port", type=int, default=8768, help="TCP port for DAEMON node (default: 8768)")
     ap.add_argument("--node-id", default="cam", help="Manifest device.node_id (default: cam)")
@@ -395,16 +1059,41 @@ def main() -> None:
 
     ap.add_argument("--http-listen", default="0.0.0.0", help="Bind address for HTTP server (default: 0.0.0.0)")
     ap.add_argument("--http-port", type=int, default=8081, help="HTTP port for snapshot/MJPEG (default: 8081)")
+    ap.add_argument(
+        "--http-backend",
+        choices=("threads", "selectors"),
+        default="threads",
+        help="threads: one thread per HTTP client; selectors: single epoll loop fanning frames out to all streams (default: threads)",
+    )
 
     ap.add_argument("--device", default="/dev/video0", help="V4L2 device path (default: /dev/video0)")
+    ap.add_argument(
+        "--capture-backend",
+        choices=("v4l2", "fswebcam"),
+        default="v4l2",
+        help="v4l2: mmap MJPEG straight from the driver, falling back to fswebcam if setup fails (default: v4l2)",
+    )
     ap.add_argument("--width", type=int, default=640, help="Capture width (default: 640)")
     ap.add_argument("--height", type=int, default=480, help="Capture height (default: 480)")
     ap.add_argument("--jpeg-quality", type=int, default=70, help="JPEG quality 1..95 (default: 70)")
     ap.add_argument("--fps", type=float, default=8.0, help="Background capture FPS (default: 8.0)")
     ap.add_argument("--mjpeg-fps", type=float, default=8.0, help="MJPEG stream FPS (default: 8.0)")
+    ap.add_argument(
+        "--max-frame-age-ms",
+        type=int,
+        default=0,
+        help="Re-capture for /snapshot.jpg when the latest frame is older than this; 0 serves the latest as-is (default: 0)",
+    )
     ap.add_argument("--skip-frames", type=int, default=2, help="fswebcam skip frames (default: 2)")
     ap.add_argument("--warmup-captures", type=int, default=2, help="Warmup captures on boot (default: 2)")
-    ap.add_argument("--tmp-dir", default="/tmp", help="Temp directory for fswebcam output (default: /tmp)")
+    ap.add_argument("--tmp-dir", default="/tmp", help="Temp directory for fswebcam output when it cannot write to stdout (default: /tmp)")
+    ap.add_argument("--max-clients", type=int, default=16, help="Max concurrent DAEMON node clients (default: 16)")
+    ap.add_argument(
+        "--accept-workers",
+        type=int,
+        default=1,
+        help="Threads accepting DAEMON node connections, each on its own SO_REUSEPORT listener (default: 1)",
+    )
     args = ap.parse_args()
 
     manifest = dict(DEFAULT_MANIFEST)
@@ -416,6 +1105,8 @@ def main() -> None:
     if isinstance(manifest["services"].get("camera"), dict):
         manifest["services"]["camera"] = dict(manifest["services"]["camera"])
         manifest["services"]["camera"]["http_port"] = int(args.http_port)
+    # The manifest is immutable from here on; encode it once so HELLO/READ_MANIFEST is a plain sendall.
+    m_line_bytes = (manifest_line(manifest) + "\n").encode("utf-8")
 
     capture = CameraCapture(
         device=args.device,
@@ -426,33 +1117,88 @@ def main() -> None:
         skip_frames=args.skip_frames,
         warmup_captures=args.warmup_captures,
         tmp_dir=args.tmp_dir,
+        backend=args.capture_backend,
+        max_frame_age_ms=args.max_frame_age_ms,
     )
     capture.start()
 
-    httpd = run_http_server(capture, listen=args.http_listen, port=args.http_port, mjpeg_fps=args.mjpeg_fps)
+    httpd: Optional[ThreadingHTTPServer] = None
+    if args.http_backend == "selectors":
+        run_http_server_selectors(capture, listen=args.http_listen, port=args.http_port, mjpeg_fps=args.mjpeg_fps)
+    else:
+        httpd = run_http_server(capture, listen=args.http_listen, port=args.http_port, mjpeg_fps=args.mjpeg_fps)
     print(
         f"camera HTTP listening on http://{args.http_listen}:{args.http_port} "
         f"(snapshot=/snapshot.jpg stream=/stream.mjpg)",
         flush=True,
     )
 
-    srv = bind_server(args.listen, args.port)
-    srv.listen(16)
+    telemetry = TelemetryBroadcaster(capture, int(args.http_port))
+    telemetry.start()
+
+    workers = max(1, int(args.accept_workers))
+    listeners: list[socket.socket] = []
+    if workers > 1:
+        try:
+            listeners = [bind_server(args.listen, args.port, reuse_port=True) for _ in range(workers)]
+        except Exception as exc:
+            for lsock in listeners:
+                lsock.close()
+            listeners = []
+            print(f"SO_REUSEPORT unavailable ({exc}); accept workers share one listener", flush=True)
+    if not listeners:
+        listeners = [bind_server(args.listen, args.port)]
+    for lsock in listeners:
+        lsock.listen(args.max_clients)
     print(
         f"camera DAEMON node listening on {args.listen}:{args.port} (node_id={args.node_id}) device={args.device}",
         flush=True,
     )
 
-    try:
+    pool = ThreadPoolExecutor(max_workers=args.max_clients, thread_name_prefix="daemon-client")
+    active_lock = threading.Lock()
+    active = 0
+
+    def run_client(conn: socket.socket, addr) -> None:
+        nonlocal active
+        try:
+            client_loop(conn, addr, m_line_bytes, capture, telemetry)
+        finally:
+            with active_lock:
+                active -= 1
+
+    def accept_loop(srv: socket.socket) -> None:
+        nonlocal active
         while True:
             conn, addr = srv.accept()
+            with active_lock:
+                busy = active >= args.max_clients
+                if not busy:
+                    active += 1
+            if busy:
+                # Reject instead of queueing behind a full pool (or spawning unbounded threads).
+                print(f"client rejected (busy): {addr}", flush=True)
+                try:
+                    conn.sendall(b"ERR BUSY overloaded\n")
+                except OSError:
+                    pass
+                conn.close()
+                continue
             print(f"client connected: {addr}", flush=True)
-            threading.Thread(target=client_loop, args=(conn, addr, manifest, capture, int(args.http_port)), daemon=True).start()
+            pool.submit(run_client, conn, addr)
+
+    try:
+        # Extra workers accept on their own listener, or on the shared one when SO_REUSEPORT is missing.
+        for i in range(1, workers):
+            threading.Thread(target=accept_loop, args=(listeners[i % len(listeners)],), daemon=True).start()
+        accept_loop(listeners[0])
     finally:
         try:
-            httpd.shutdown()
+            if httpd is not None:
+                httpd.shutdown()
         except Exception:
             pass
+        telemetry.stop()
         capture.stop()
 
 
@@ -0,0 +1,412 @@
+"""
+Vision brain policy: instruction parsing, state normalization and plan building.
+
+Pure-Python dict/regex work on the /vision_step critical path, split out of
+pi_vision_brain_server.py so it can optionally be compiled ahead of time with mypyc:
+
+    pip install mypy
+    python3 build_vision_policy.py build_ext --inplace
+
+That leaves a vision_policy.*.so next to this file, which Python imports in preference
+to the .py. Without it (or after deleting it) the plain module is used unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+def _clamp(x: float, lo: float, hi: float) -> float:
+    return min(hi, max(lo, x))
+
+
+@dataclass
+class DetectedObject:
+    label: str
+    confidence: float
+    bbox: dict[str, float]  # x,y,w,h in normalized [0,1]
+    attributes: list[str]
+
+
+_RE_WHITESPACE = re.compile(r"\s+")
+# Candidates in priority order; one alternation scan finds every keyword, then the highest-priority hit wins.
+_COLOR_PRIORITY = ("yellow", "green", "blue", "red")
+_LABEL_PRIORITY = ("ring", "cube", "person", "obstacle", "object", "block")
+_RE_TARGET_WORD = re.compile(
+    r"\b(?:(?P<color>red|blue|green|yellow)|(?P<label>ring|cube|person|obstacle|object|block))\b"
+)
+_RE_STOP = re.compile(r"(emergency stop|e-stop|estop|abort|halt|\bstop\b)")
+_RE_IF = re.compile(r"\bif\b")
+_RE_NEGATION = re.compile(r"\b(no|not|can't|cannot|dont|don't)\b")
+_RE_UNTIL = re.compile(r"\buntil\b")
+_RE_WANTS_FORWARD = re.compile(r"\b(forward|ahead|straight)\b")
+_RE_MOTION_VERB = re.compile(r"\b(move|go|drive|head|strafe|slide|shift)\b")
+_RE_TURN_VERB = re.compile(r"\b(turn|rotate)\b")
+_RE_REVERSE_VERB = re.compile(r"\b(reverse|back up)\b")
+_RE_CLAUSE_SPLIT = re.compile(r"\b(?:and then|then|after that|afterwards|next)\b|,|;")
+_RE_DIRECTION = re.compile(r"\b(forward|backward|backwards|back|behind|left|right)\b")
+_RE_AND = re.compile(r"\band\b")
+_RE_TURN_LEFT = re.compile(r"\b(turn (to )?(the )?left|rotate left|counterclockwise)\b")
+_RE_TURN_RIGHT = re.compile(r"\b(turn (to )?(the )?right|rotate right|clockwise)\b")
+_RE_BACKWARD = re.compile(r"\b(backward|backwards|back up|move back|go back|reverse|behind)\b")
+_RE_LEFT = re.compile(r"\b(strafe left|slide left)\b|\bleft\b")
+_RE_RIGHT = re.compile(r"\b(strafe right|slide right)\b|\bright\b")
+_RE_FORWARD = re.compile(r"\b(move forward|go forward|drive forward|forward|ahead|straight)\b")
+_RE_PICK = re.compile(r"\b(pick up|pickup|grab)\b")
+# First matching rule wins per clause; bound .search methods skip a global + attribute lookup per test.
+_CLAUSE_ACTIONS: tuple[tuple[Callable[[str], Any], dict[str, Any]], ...] = (
+    (_RE_TURN_LEFT.search, {"type": "TURN", "direction": "left", "angle_deg": 90, "speed": 0.55}),
+    (_RE_TURN_RIGHT.search, {"type": "TURN", "direction": "right", "angle_deg": 90, "speed": 0.55}),
+    (_RE_BACKWARD.search, {"type": "MOVE", "direction": "backward", "distance_m": 1.0, "speed": 0.55}),
+    (_RE_LEFT.search, {"type": "MOVE", "direction": "left", "distance_m": 1.0, "speed": 0.55}),
+    (_RE_RIGHT.search, {"type": "MOVE", "direction": "right", "distance_m": 1.0, "speed": 0.55}),
+    (_RE_FORWARD.search, {"type": "MOVE", "direction": "forward", "distance_m": 1.0, "speed": 0.55}),
+)
+
+
+def parse_target(text: str) -> dict[str, Optional[str]]:
+    # Very small target extractor (label + color).
+    colors: set[str] = set()
+    labels: set[str] = set()
+    for m in _RE_TARGET_WORD.finditer(text):
+        if m.group("color"):
+            colors.add(m.group("color"))
+        else:
+            labels.add(m.group("label"))
+    color = next((c for c in _COLOR_PRIORITY if c in colors), None)
+    label = next((c for c in _LABEL_PRIORITY if c in labels), None)
+    if label == "block":
+        label = "cube"
+    if label in ("object", "obstacle") and color:
+        label = "obstacle"
+    return {"label": label, "color": color}
+
+
+def parse_actions(text: str) -> tuple[str, list[dict[str, Any]], dict[str, Optional[str]]]:
+    """
+    Returns (task_type, canonical_actions, target)
+    task_type: stop | move-pattern | move-if-clear | pick-object | unknown
+    """
+    t = text.lower().strip()
+    t = _RE_WHITESPACE.sub(" ", t)
+
+    target = parse_target(t)
+
+    if _RE_STOP.search(t):
+        return "stop", [{"type": "STOP"}], target
+
+    # Conditional forward steps based on visual absence/presence of a colored obstacle.
+    has_if_no = bool(_RE_IF.search(t) and _RE_NEGATION.search(t) and target.get("color"))
+    has_until = bool(_RE_UNTIL.search(t) and target.get("color"))
+    wants_forward = bool(_RE_WANTS_FORWARD.search(t))
+    if (has_if_no or has_until) and wants_forward:
+        return "move-if-clear", [{"type": "MOVE", "direction": "forward", "distance_m": 1.0, "speed": 0.55}], target
+
+    # Motion-only multi-step parsing.
+    motion_trigger = bool(_RE_MOTION_VERB.search(t) or _RE_TURN_VERB.search(t) or _RE_REVERSE_VERB.search(t))
+    if motion_trigger:
+        clauses = [c.strip() for c in _RE_CLAUSE_SPLIT.split(t) if c.strip()]
+        if len(clauses) <= 1:
+            dir_mentions = len(_RE_DIRECTION.findall(t))
+            if dir_mentions >= 2 and " and " in t:
+                clauses = [c.strip() for c in _RE_AND.split(t) if c.strip()]
+
+        actions: list[dict[str, Any]] = []
+        for clause in clauses if clauses else [t]:
+            for search, action in _CLAUSE_ACTIONS:
+                if search(clause):
+                    actions.append(dict(action))
+                    break
+
+        if actions:
+            return "move-pattern", actions, target
+
+    if _RE_PICK.search(t):
+        return "pick-object", [], target
+
+    return "unknown", [], target
+
+
+def build_allowed_tokens(system_manifest: Any) -> dict[str, set[str]]:
+    out: dict[str, set[str]] = {}
+    if not isinstance(system_manifest, dict):
+        return out
+    nodes = system_manifest.get("nodes")
+    if not isinstance(nodes, list):
+        return out
+    for n in nodes:
+        if not isinstance(n, dict):
+            continue
+        name = n.get("name")
+        if not isinstance(name, str) or not name.strip():
+            continue
+        toks: set[str] = set()
+        commands = n.get("commands")
+        if isinstance(commands, list):
+            for c in commands:
+                if isinstance(c, dict) and isinstance(c.get("token"), str):
+                    toks.add(str(c.get("token")).upper())
+        out[name.strip()] = toks
+        # Also allow node_id / display_name keys if present.
+        for k in ["node_id", "display_name"]:
+            alias = n.get(k)
+            if isinstance(alias, str) and alias.strip():
+                out[alias.strip()] = toks
+    return out
+
+
+def map_move_to_step(caps: dict[str, Any], allowed: dict[str, set[str]], action: dict[str, Any]) -> list[dict[str, Any]]:
+    target = str(caps.get("base_target", "base"))
+    fwd = str(caps.get("base_fwd_token", "FWD"))
+    turn = str(caps.get("base_turn_token", "TURN"))
+    strafe = str(caps.get("base_strafe_token", "STRAFE"))
+    speed = float(action.get("speed") or 0.55)
+
+    tokens = allowed.get(target, set())
+    token_ok = lambda tok: (not allowed) or (tok.upper() in tokens)
+
+    steps: list[dict[str, Any]] = []
+    typ = action.get("type")
+    if typ == "TURN":
+        ang = float(abs(action.get("angle_deg") or 90.0))
+        signed = -ang if action.get("direction") == "left" else ang
+        tok = turn if token_ok(turn) else ("MECANUM" if token_ok("MECANUM") else None)
+        if tok is None:
+            return []
+        args = [signed] if tok == turn else (["Q"] if signed < 0 else ["E"])
+        steps.append({"type": "RUN", "target": target, "token": tok, "args": args, "duration_ms": 360})
+        return steps
+
+    if typ != "MOVE":
+        return steps
+
+    direction = action.get("direction")
+    distance_m = float(action.get("distance_m") or 1.0)
+    duration = int(_clamp(round(distance_m * 1800.0), 250, 8000))
+    if direction == "forward":
+        if not token_ok(fwd):
+            return []
+        steps.append({"type": "RUN", "target": target, "token": fwd, "args": [speed], "duration_ms": duration})
+        return steps
+    if direction == "backward":
+        tok = "BWD" if token_ok("BWD") else ("MECANUM" if token_ok("MECANUM") else None)
+        if tok is None:
+            return []
+        args = [speed] if tok == "BWD" else ["B"]
+        steps.append({"type": "RUN", "target": target, "token": tok, "args": args, "duration_ms": duration})
+        return steps
+    if direction in ("left", "right"):
+        dir_token = "L" if direction == "left" else "R"
+        if token_ok(strafe):
+            steps.append({"type": "RUN", "target": target, "token": strafe, "args": [dir_token, speed], "duration_ms": duration})
+            return steps
+        if token_ok("MECANUM"):
+            steps.append({"type": "RUN", "target": target, "token": "MECANUM", "args": [dir_token], "duration_ms": duration})
+            return steps
+        # Fallback: approximate strafe with a turn.
+        if token_ok(turn):
+            steps.append({"type": "RUN", "target": target, "token": turn, "args": [-90 if direction == "left" else 90], "duration_ms": 360})
+            return steps
+        return []
+    return steps
+
+
+def normalize_state(input_state: Any) -> dict[str, Any]:
+    default_caps = {
+        "base_target": "base",
+        "arm_target": "arm",
+        "base_turn_token": "TURN",
+        "base_fwd_token": "FWD",
+        "base_strafe_token": "STRAFE",
+        "arm_grip_token": "GRIP",
+    }
+    if not isinstance(input_state, dict):
+        return {
+            "stage": "SEARCH",
+            "scan_dir": 1,
+            "scan_ticks": 0,
+            "capabilities": dict(default_caps),
+            "instruction_ctx": {"hash": ""},
+            "motion_ctx": {"consumed": False, "step_idx": 0, "total_steps": 0},
+            "target_lock_ctx": None,
+            "perf_ctx": {"recommended_interval_ms": 180},
+        }
+    caps_in = input_state.get("capabilities")
+    if not isinstance(caps_in, dict):
+        caps_in = {}
+    return {
+        "stage": str(input_state.get("stage") or "SEARCH").upper(),
+        "scan_dir": 1 if float(input_state.get("scan_dir") or 1) >= 0 else -1,
+        "scan_ticks": int(max(0, float(input_state.get("scan_ticks") or 0))),
+        "capabilities": {
+            "base_target": str(caps_in.get("base_target") or default_caps["base_target"]),
+            "arm_target": str(caps_in.get("arm_target") or default_caps["arm_target"]),
+            "base_turn_token": str(caps_in.get("base_turn_token") or default_caps["base_turn_token"]),
+            "base_fwd_token": str(caps_in.get("base_fwd_token") or default_caps["base_fwd_token"]),
+            "base_strafe_token": str(caps_in.get("base_strafe_token") or default_caps["base_strafe_token"]),
+            "arm_grip_token": str(caps_in.get("arm_grip_token") or default_caps["arm_grip_token"]),
+        },
+        "instruction_ctx": {
+            "hash": str((input_state.get("instruction_ctx") or {}).get("hash") or ""),
+        },
+        "motion_ctx": {
+            "consumed": bool((input_state.get("motion_ctx") or {}).get("consumed") or False),
+            "step_idx": int(max(0, float((input_state.get("motion_ctx") or {}).get("step_idx") or 0))),
+            "total_steps": int(max(0, float((input_state.get("motion_ctx") or {}).get("total_steps") or 0))),
+        },
+        "target_lock_ctx": None,
+        "perf_ctx": {"recommended_interval_ms": int(max(80, min(600, float((input_state.get("perf_ctx") or {}).get("recommended_interval_ms") or 180))))},
+    }
+
+
+def reset_for_instruction(state: dict[str, Any], new_hash: str) -> dict[str, Any]:
+    out = dict(state)
+    out["stage"] = "SEARCH"
+    out["scan_dir"] = 1
+    out["scan_ticks"] = 0
+    out["instruction_ctx"] = {"hash": new_hash}
+    out["motion_ctx"] = {"consumed": False, "step_idx": 0, "total_steps": 0}
+    return out
+
+
+def pick_target(objects: list[DetectedObject], target_spec: dict[str, Optional[str]]) -> Optional[DetectedObject]:
+    want_label = (target_spec.get("label") or "").strip().lower()
+    want_color = (target_spec.get("color") or "").strip().lower()
+    if not objects:
+        return None
+    if not want_label and not want_color:
+        # Nothing requested; pick best.
+        return max(objects, key=lambda o: o.confidence)
+
+    def matches(o: DetectedObject) -> bool:
+        label = o.label.lower()
+        attrs = [a.lower() for a in (o.attributes or [])]
+        if want_label and want_label in label:
+            return True
+        if want_color and (want_color in label or any(want_color in a for a in attrs)):
+            return True
+        return False
+
+    candidates = [o for o in objects if matches(o)]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda o: o.confidence)
+
+
+def build_plan_and_state(
+    state: dict[str, Any],
+    task_type: str,
+    actions: list[dict[str, Any]],
+    target_spec: dict[str, Optional[str]],
+    perception: dict[str, Any],
+    allowed: dict[str, set[str]],
+) -> tuple[list[dict[str, Any]], dict[str, Any], list[str], str]:
+    caps = state.get("capabilities")
+    if not isinstance(caps, dict):
+        caps = {}
+    notes: list[str] = []
+
+    if task_type == "stop":
+        return [{"type": "STOP"}], {**state, "stage": "DONE"}, ["Stop requested"], "STOP"
+
+    if task_type == "move-if-clear":
+        # If the target (color) is present "in path", stop; else emit a short forward step.
+        target = perception.get("selected_target") if isinstance(perception, dict) else None
+        in_path = False
+        if isinstance(target, dict):
+            area = float(perception.get("area") or 0.0)
+            off = float(perception.get("offset_x") or 0.0)
+            conf = float(perception.get("confidence") or 0.0)
+            in_path = conf >= 0.25 and area >= 0.02 and abs(off) <= 0.28
+        if in_path:
+            notes.append("Obstacle detected in path; stopping")
+            return [{"type": "STOP"}], {**state, "stage": "DONE"}, notes, "MOVE/IF_CLEAR"
+        notes.append("Path appears clear; stepping forward")
+        return (
+            [{"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_fwd_token", "FWD")), "args": [0.45], "duration_ms": 240}, {"type": "STOP"}],
+            {**state, "stage": "SEARCH"},
+            notes,
+            "MOVE/IF_CLEAR",
+        )
+
+    if task_type == "move-pattern":
+        # Emit the full macro once per instruction.
+        mc = state.get("motion_ctx")
+        if not isinstance(mc, dict):
+            mc = {"step_idx": 0, "total_steps": 0, "consumed": False}
+        if mc.get("consumed"):
+            return [{"type": "STOP"}], {**state, "stage": "MOTION_ONLY"}, ["motion macro already emitted for current instruction"], "MOVE/PATTERN"
+        steps: list[dict[str, Any]] = []
+        for act in actions:
+            steps.extend(map_move_to_step(caps, allowed, act))
+        if not steps:
+            steps = [{"type": "STOP"}]
+        else:
+            steps.append({"type": "STOP"})
+        next_state = dict(state)
+        next_state["stage"] = "MOTION_ONLY"
+        next_state["motion_ctx"] = {"consumed": True, "step_idx": len(steps), "total_steps": len(steps)}
+        notes.append(f"motion macro emitted {max(0, len(steps)-1)} steps ({len(steps)} total)")
+        return steps, next_state, notes, "MOVE/PATTERN"
+
+    if task_type == "pick-object":
+        # Very simple closed-loop behavior:
+        # - if target found: align by turning until centered, then approach until close, then close claw
+        # - else: small scan turn
+        stage = str(state.get("stage") or "SEARCH").upper()
+        target = perception.get("selected_target") if isinstance(perception, dict) else None
+        if stage == "DONE":
+            stage = "SEARCH"
+        if not isinstance(target, dict):
+            # scan
+            scan_dir = int(state.get("scan_dir") or 1)
+            scan_ticks = int(state.get("scan_ticks") or 0) + 1
+            if scan_ticks % 5 == 0:
+                scan_dir *= -1
+            next_state = dict(state)
+            next_state["scan_dir"] = scan_dir
+            next_state["scan_ticks"] = scan_ticks
+            next_state["stage"] = "SEARCH"
+            notes.append("No target found; scanning")
+            plan: list[dict[str, Any]] = [
+                {"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_turn_token", "TURN")), "args": [12 * scan_dir], "duration_ms": 220},
+                {"type": "STOP"},
+            ]
+            return plan, next_state, notes, "PICK/SEARCH"
+
+        off = float(perception.get("offset_x") or 0.0)
+        area = float(perception.get("area") or 0.0)
+        if abs(off) > 0.07:
+            turn_deg = _clamp(off * 55.0, -20.0, 20.0)
+            notes.append("Turning to center target")
+            next_state = dict(state)
+            next_state["stage"] = "ALIGN"
+            plan = [
+                {"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_turn_token", "TURN")), "args": [round(turn_deg, 2)], "duration_ms": 220},
+                {"type": "STOP"},
+            ]
+            return plan, next_state, notes, "PICK/ALIGN"
+
+        if area < 0.10:
+            notes.append("Approaching target")
+            next_state = dict(state)
+            next_state["stage"] = "APPROACH"
+            plan = [
+                {"type": "RUN", "target": str(caps.get("base_target", "base")), "token": str(caps.get("base_fwd_token", "FWD")), "args": [0.45], "duration_ms": 240},
+                {"type": "STOP"},
+            ]
+            return plan, next_state, notes, "PICK/APPROACH"
+
+        # close claw
+        notes.append("Close enough; closing claw")
+        next_state = dict(state)
+        next_state["stage"] = "DONE"
+        plan = [
+            {"type": "RUN", "target": str(caps.get("arm_target", "arm")), "token": str(caps.get("arm_grip_token", "GRIP")), "args": ["close"]},
+            {"type": "STOP"},
+        ]
+        return plan, next_state, notes, "PICK/GRAB"
+
+    return [{"type": "STOP"}], {**state, "stage": "DONE"}, ["Unknown task; stopping"], "UNKNOWN"
@@ -0,0 +1,68 @@
+import sys
+import unittest
+from pathlib import Path
+
+PI_DIR = Path(__file__).resolve().parents[1] / "firmware-code" / "profiles" / "rc_car_pi_arduino" / "raspberry_pi"
+sys.path.insert(0, str(PI_DIR))
+
+try:
+    import mecanum_daemon_node as node  # noqa: E402
+except ImportError:  # pyserial is only installed on the Pi
+    node = None
+
+
+class _FakeSerial:
+    def __init__(self):
+        self.writes = []
+
+    def write_primitive(self, data):
+        self.writes.append(data)
+
+
+class _FakeWatchdog:
+    def bump(self, token):
+        pass
+
+
+@unittest.skipIf(node is None, "pyserial not installed")
+class MecanumLineParsingTests(unittest.TestCase):
+    def _handle(self, line):
+        state = node.ClientState(conn=None)
+        serial_dev = _FakeSerial()
+        resp = node.handle_line(line, state, "MANIFEST {}", serial_dev, _FakeWatchdog())
+        return resp, state, serial_dev
+
+    def test_parse_run_accepts_any_whitespace(self):
+        self.assertEqual(node.parse_run("FWD 0.5"), ("FWD", ["0.5"]))
+        self.assertEqual(node.parse_run("FWD\t0.5"), ("FWD", ["0.5"]))
+        self.assertEqual(node.parse_run("STRAFE\tL \t 0.4"), ("STRAFE", ["L", "0.4"]))
+        self.assertEqual(node.parse_run(""), (None, []))
+
+    def test_tab_separated_lines(self):
+        resp, state, serial_dev = self._handle("RUN\tFWD\t0.5")
+        self.assertEqual(resp, "OK")
+        self.assertEqual(serial_dev.writes, [b"F"])
+        self.assertEqual(state.last_token, "FWD")
+
+        resp, state, _ = self._handle("SUB\tTELEMETRY")
+        self.assertEqual(resp, "OK")
+        self.assertTrue(state.telemetry_enabled)
+
+    def test_turn_zero_in_any_spelling_is_a_no_op(self):
+        for arg in ("0", "0.00", "-0", "0e0"):
+            resp, state, serial_dev = self._handle(f"RUN TURN {arg}")
+            self.assertEqual(resp, "OK", arg)
+            self.assertEqual(serial_dev.writes, [], arg)
+            self.assertEqual(state.last_token, "TURN")
+
+    def test_fwd_bwd_zero_still_drive(self):
+        # Speed is ignored by the firmware, so a zero speed drives like any other; only STOP stops.
+        for token, primitive in (("FWD", b"F"), ("BWD", b"B")):
+            for arg in ("0", "0.00"):
+                resp, _, serial_dev = self._handle(f"RUN {token} {arg}")
+                self.assertEqual(resp, "OK")
+                self.assertEqual(serial_dev.writes, [primitive], (token, arg))
+
+
+if __name__ == "__main__":
+    unittest.main()
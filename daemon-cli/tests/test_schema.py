@@ -1,14 +1,25 @@
+import json
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
 from daemon_cli.generators.manifest import build_manifest
 from daemon_cli.models import ArgSpec, CommandSpec, SafetySpec
-from daemon_cli.schema import validate_manifest_schema
+from daemon_cli.schema import (
+    SchemaValidationError,
+    validate_manifest_schema,
+    validate_manifests_batch,
+)
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schema" / "daemon.schema.v0_1.json"
+SCHEMA_DOC = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
 
 
 class SchemaTests(unittest.TestCase):
-    def test_manifest_matches_schema(self):
-        commands = [
+    @classmethod
+    def setUpClass(cls):
+        cls.commands_left = [
             CommandSpec(
                 token="L",
                 function_name="move_left",
@@ -19,12 +30,7 @@ class SchemaTests(unittest.TestCase):
                 examples=["turn left 100"],
             )
         ]
-        manifest = build_manifest(Path("demo"), commands)
-        schema_path = Path(__file__).resolve().parent.parent / "schema" / "daemon.schema.v0_1.json"
-        validate_manifest_schema(manifest, schema_path)
-
-    def test_manufacturer_field_optional_but_supported(self):
-        commands = [
+        cls.commands_fwd = [
             CommandSpec(
                 token="FWD",
                 function_name="move_forward",
@@ -35,14 +41,41 @@ class SchemaTests(unittest.TestCase):
                 examples=["forward 0.5"],
             )
         ]
-        schema_path = Path(__file__).resolve().parent.parent / "schema" / "daemon.schema.v0_1.json"
 
-        manifest_without_manufacturer = build_manifest(Path("demo"), commands)
-        validate_manifest_schema(manifest_without_manufacturer, schema_path)
+    def test_generated_manifests_match_schema(self):
+        def with_manufacturer(manifest):
+            # Swap only the device block so the shared base manifest is left untouched.
+            return dict(manifest, device=dict(manifest["device"], manufacturer="Demo Manufacturer"))
+
+        # One build per command set, and one validator lookup for the whole batch.
+        built = {
+            "left": build_manifest(Path("demo"), self.commands_left),
+            "forward": build_manifest(Path("demo"), self.commands_fwd),
+        }
+        cases = [
+            ("left", None),
+            ("forward", None),  # manufacturer is optional
+            ("forward", with_manufacturer),  # ...but supported
+        ]
+        manifests = [built[name] if mutate is None else mutate(built[name]) for name, mutate in cases]
+        results = validate_manifests_batch(manifests, SCHEMA_PATH)
+        for (name, mutate), manifest, error in zip(cases, manifests, results):
+            with self.subTest(commands=name, manufacturer=mutate is not None):
+                self.assertIsNone(error)
+                # The pre-parsed schema dict must give the same verdict as the schema file.
+                validate_manifest_schema(manifest, SCHEMA_DOC)
+
+    def test_edited_schema_file_is_recompiled(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            schema_path = Path(temp_dir) / "schema.json"
+            schema_path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+            validate_manifest_schema({"a": 1}, schema_path)
 
-        manifest_with_manufacturer = build_manifest(Path("demo"), commands)
-        manifest_with_manufacturer["device"]["manufacturer"] = "Demo Manufacturer"
-        validate_manifest_schema(manifest_with_manufacturer, schema_path)
+            schema_path.write_text(json.dumps({"type": "object", "required": ["b"]}), encoding="utf-8")
+            stat = schema_path.stat()
+            os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            with self.assertRaisesRegex(SchemaValidationError, "Schema validation failed at root"):
+                validate_manifest_schema({"a": 1}, schema_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+import io
+import sys
+import unittest
+from pathlib import Path
+
+PI_DIR = Path(__file__).resolve().parents[1] / "firmware-code" / "profiles" / "rc_car_pi_arduino" / "raspberry_pi"
+sys.path.insert(0, str(PI_DIR))
+
+import vision_bridge  # noqa: E402
+from daemon_cli.main import SAMPLE_CONTEXTS  # noqa: E402
+
+
+class VisionBridgeTests(unittest.TestCase):
+    def setUp(self):
+        vision_bridge.flush()
+
+    def test_records_round_trip_through_decode(self):
+        port = io.BytesIO()
+        vision_bridge.emit_detection(port, "cube", 0.75, 0.25)
+        vision_bridge.emit_detection(port, "person", 0.5, -0.5)
+        # Nothing is written by a background thread; the caller flushes.
+        self.assertEqual(port.getvalue(), b"")
+        vision_bridge.flush()
+
+        detections, rest = vision_bridge.decode_detections(port.getvalue())
+        self.assertEqual(rest, b"")
+        self.assertEqual([d["label"] for d in detections], ["cube", "person"])
+        self.assertEqual([d["confidence"] for d in detections], [0.75, 0.5])
+        self.assertEqual([d["centroid_x"] for d in detections], [0.25, -0.5])
+
+    def test_unknown_label_and_unpackable_values_fall_back_to_json(self):
+        port = io.BytesIO()
+        vision_bridge.emit_detection(port, "ring", 0.5, 0.5)
+        vision_bridge.emit_detection(port, "cone", 0.25, 0.5)
+        vision_bridge.emit_detection(port, "cube", None, 0.5)
+
+        data = port.getvalue()
+        # The queued record is flushed ahead of the first JSON line to keep ordering.
+        self.assertEqual(data[0], vision_bridge.DETECTION_MAGIC)
+        detections, rest = vision_bridge.decode_detections(data)
+        self.assertEqual(rest, b"")
+        self.assertEqual([d["label"] for d in detections], ["ring", "cone", "cube"])
+        self.assertIsNone(detections[2]["confidence"])
+
+    def test_decode_keeps_incomplete_tail(self):
+        port = io.BytesIO()
+        vision_bridge.emit_detection(port, "cube", 0.5, 0.5)
+        vision_bridge.flush()
+        data = port.getvalue() + b'{"event": "vision.detec'
+
+        detections, rest = vision_bridge.decode_detections(data[:10])
+        self.assertEqual((detections, rest), ([], data[:10]))
+        detections, rest = vision_bridge.decode_detections(data)
+        self.assertEqual(len(detections), 1)
+        self.assertEqual(rest, b'{"event": "vision.detec')
+
+    def test_scaffold_template_matches_profile(self):
+        # `daemon` scaffolds this profile from SAMPLE_CONTEXTS; it must ship the same bridge and protocol doc.
+        sample = SAMPLE_CONTEXTS["rc_car_pi_arduino"]
+        for rel in ("raspberry_pi/vision_bridge.py", "protocol/serial_protocol.md"):
+            with self.subTest(rel=rel):
+                self.assertEqual(sample[rel], (PI_DIR.parent / rel).read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,28 +2,100 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import collections
+import http.client
 import http.server
+import itertools
 import json
+import os
 import queue
+import random
+import secrets
+import selectors
 import socket
+import sys
 import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
-import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+@dataclass(slots=True)
+class ArgSpec:
+    """One manifest command arg, parsed once so validate_plan reads attributes instead of dict keys."""
+
+    type: str  # lower-cased
+    enum: list[Any] | None = None  # None when the manifest gives no (or an empty) enum
+    minimum: Any = None
+    maximum: Any = None
+    # Set forms of `enum` for O(1) membership; enum_values is None if an item is unhashable.
+    enum_values: frozenset[Any] | None = None
+    enum_strings: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_manifest(cls, raw: dict[str, Any]) -> ArgSpec:
+        allowed = raw.get("enum")
+        spec = cls(
+            type=str(raw.get("type", "")).lower(),
+            enum=allowed if isinstance(allowed, list) and allowed else None,
+            minimum=raw.get("min"),
+            maximum=raw.get("max"),
+        )
+        if spec.enum is not None:
+            try:
+                spec.enum_values = frozenset(spec.enum)
+            except TypeError:
+                pass
+            spec.enum_strings = frozenset(str(item) for item in spec.enum)
+        return spec
+
+    def allows(self, value: Any) -> bool:
+        """Enum membership: the value itself, or its str() form (plans may send "90" for 90)."""
+        if self.enum is None:
+            return True
+        if self.enum_values is None:
+            hit = value in self.enum
+        else:
+            try:
+                hit = value in self.enum_values
+            except TypeError:  # unhashable plan value; it can't equal a hashable enum item
+                hit = False
+        return hit or str(value) in self.enum_strings
+
+
+@dataclass(slots=True)
+class CommandSpec:
+    token: str  # upper-cased
+    args: tuple[ArgSpec, ...]
+
+    @classmethod
+    def from_manifest(cls, raw: dict[str, Any]) -> CommandSpec:
+        return cls(
+            token=str(raw.get("token", "")).upper(),
+            args=tuple(ArgSpec.from_manifest(arg) for arg in raw.get("args", [])),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class NodeInfo:
     alias: str
     host: str
     port: int
     sock: socket.socket | None = None
-    reader_thread: threading.Thread | None = None
-    rx_queue: queue.Queue[str] = field(default_factory=queue.Queue)
-    write_lock: threading.Lock = field(default_factory=threading.Lock)
+    # Responses from the reader thread; rx_event is set after each append. deque append/popleft are atomic.
+    rx_deque: collections.deque[str] = field(default_factory=collections.deque)
+    rx_event: threading.Event = field(default_factory=threading.Event)
     request_lock: threading.Lock = field(default_factory=threading.Lock)
     running: bool = False
     manifest: dict[str, Any] = field(default_factory=dict)
@@ -32,23 +104,336 @@ class NodeInfo:
     telemetry_snapshot: dict[str, str] = field(default_factory=dict)
     telemetry_subscribed: bool = False
     read_buffer: bytearray = field(default_factory=bytearray)
+    # Start of the unconsumed bytes in read_buffer; consumed lines are dropped in bulk, not per line.
+    read_pos: int = 0
+    # Timeout currently applied to sock, so _readline_direct only calls settimeout when it changes.
+    sock_timeout: float | None = None
     reconnect_lock: threading.Lock = field(default_factory=threading.Lock)
     last_reconnect_attempt_s: float = 0.0
+    # Upper-cased token -> parsed command spec, rebuilt whenever `manifest` is replaced.
+    command_specs: dict[str, CommandSpec] = field(default_factory=dict)
+    command_specs_source: dict[str, Any] | None = None
+    # Manifest-derived part of this node's /status entry, rebuilt whenever `manifest` is replaced.
+    summary_cache: dict[str, Any] = field(default_factory=dict)
+    summary_source: dict[str, Any] | None = None
+    # Smoothed STOP round trip, used to send a timed step's STOP so it lands on the deadline.
+    stop_rtt_s: float = 0.0
+
 
+@dataclass
+class ResolvedStep:
+    """A plan step that validate_plan has already checked and bound to its node."""
 
-def _now_iso() -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()) + f".{int((time.time() % 1) * 1000):03d}Z"
+    kind: str  # "RUN" or "STOP"
+    node: NodeInfo | None = None
+    target: str | None = None
+    token: str = ""
+    args: list[Any] = field(default_factory=list)
+    wire: str = ""
+    duration_ms: float | None = None
+    # Adjacent RUN steps marked "parallel": true run concurrently (each on a different node).
+    parallel: bool = False
 
 
-def _log_event(event: str, correlation_id: str | None = None, **fields: Any) -> None:
+# Correlation ids: a per-process random prefix plus a counter. Unique for the process lifetime without
+# drawing from the OS RNG on every request.
+_CID_PREFIX = secrets.token_hex(4)
+_cid_counter = itertools.count()
+
+
+def _new_correlation_id(kind: str) -> str:
+    return f"{kind}-{_CID_PREFIX}{next(_cid_counter):08x}"
+
+
+def _now_iso(now: float | None = None) -> str:
+    now = time.time() if now is None else now
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int((now % 1) * 1000):03d}Z"
+
+
+_TELEMETRY_PREFIX = b"TELEMETRY "
+# Telemetry keys come from a small fixed vocabulary per device; decode each one once and reuse the str.
+_TELEMETRY_KEYS: dict[bytes, str] = {}
+_TELEMETRY_KEYS_MAX = 1024
+# Compact read_buffer once this many consumed bytes have piled up at its front.
+_READ_COMPACT_AT = 64 * 1024
+# One recv per readable event drains a whole telemetry burst instead of 4 KiB of it.
+_RECV_SIZE = 64 * 1024
+# A timed step's STOP is sent up to half a STOP round trip early, but never more than this: a node that was slow
+# once (e.g. recovering its serial link) must not cut later moves short.
+_STOP_LEAD_MAX_S = 0.05
+# Linux only. The kernel clears quick-ack mode again on its own, so it is re-armed after every recv.
+_TCP_QUICKACK: int | None = getattr(socket, "TCP_QUICKACK", None)
+
+
+def _rearm_quickack(sock: Any) -> None:
+    if _TCP_QUICKACK is not None:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        except OSError:
+            pass
+
+
+def _pop_line(node: NodeInfo) -> bytearray | None:
+    """Return the next complete line (without the newline) from node.read_buffer, or None."""
+    buf = node.read_buffer
+    pos = node.read_pos
+    newline = buf.find(b"\n", pos)
+    if newline < 0:
+        if pos:
+            if pos == len(buf):
+                buf.clear()
+            elif pos > _READ_COMPACT_AT:
+                del buf[:pos]
+            else:
+                return None
+            node.read_pos = 0
+        return None
+    node.read_pos = newline + 1
+    return buf[pos:newline]
+
+
+# (host, port) -> (getaddrinfo results in preferred order, expiry on the monotonic clock).
+_ADDR_TTL_S = 30.0
+_addr_cache: dict[tuple[str, int], tuple[list[Any], float]] = {}
+_addr_cache_lock = threading.Lock()
+
+
+def _cached_addrinfo(host: str, port: int) -> list[Any] | None:
+    with _addr_cache_lock:
+        entry = _addr_cache.get((host, port))
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del _addr_cache[(host, port)]
+            return None
+        return entry[0]
+
+
+def _store_addrinfo(host: str, port: int, infos: list[Any]) -> None:
+    with _addr_cache_lock:
+        _addr_cache[(host, port)] = (infos, time.monotonic() + _ADDR_TTL_S)
+
+
+def _invalidate_addrinfo(host: str, port: int) -> None:
+    with _addr_cache_lock:
+        _addr_cache.pop((host, port), None)
+
+
+def _dial(host: str, port: int, timeout: float) -> socket.socket:
+    """
+    Create a TCP connection with robust address selection.
+
+    mDNS hosts (e.g. *.local) often resolve to both IPv6 link-local and IPv4.
+    On many setups, the IPv6 link-local address is not reachable without a scope id,
+    and naive connection attempts can hang or fail. We prefer IPv4, then fall back.
+    Resolved addresses are cached for _ADDR_TTL_S so reconnects skip the (slow) mDNS lookup.
+    """
+    last_exc: Exception | None = None
+    infos = _cached_addrinfo(host, port)
+    cached = infos is not None
+    if infos is None:
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as exc:
+            # Fall back to create_connection (will re-raise if broken).
+            last_exc = exc
+            infos = []
+        # Prefer IPv4 first, then others.
+        infos = sorted(infos, key=lambda it: 0 if it[0] == socket.AF_INET else 1)
+
+    for info in infos:
+        family, socktype, proto, _canon, sockaddr = info
+        try:
+            s = socket.socket(family, socktype, proto)
+            s.settimeout(timeout)
+            s.connect(sockaddr)
+            # Try the address that worked first next time.
+            _store_addrinfo(host, port, [info] + [it for it in infos if it is not info])
+            return s
+        except OSError as exc:
+            last_exc = exc
+            try:
+                s.close()
+            except Exception:
+                pass
+            continue
+
+    if cached:
+        # The host may have moved (DHCP, interface change); forget it so the next attempt re-resolves.
+        _invalidate_addrinfo(host, port)
+
+    # Final fallback (handles weird platforms where getaddrinfo didn't help).
+    try:
+        return socket.create_connection((host, port), timeout=timeout)
+    except OSError as exc:
+        last_exc = exc
+
+    raise last_exc if last_exc is not None else RuntimeError("connect failed")
+
+
+@lru_cache(maxsize=256)
+def _wire(line: str) -> bytes:
+    # Plans repeat the same few lines (STOP, RUN FWD 0.6, ...); encode each once and reuse the bytes.
+    return line.encode("utf-8") + b"\n"
+
+
+def _json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(raw: bytes | str) -> Any:
+    # Both parse bytes directly, so the body is never decoded to a str first.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# DAEMON_LOG=0 disables event logging; 1 drops the verbose parts (per-request transport.tx/rx, full plan
+# bodies); 2 (default) logs everything.
+try:
+    _LOG_LEVEL = int(os.environ.get("DAEMON_LOG", "2"))
+except ValueError:
+    _LOG_LEVEL = 2
+_LOG_ENABLED = _LOG_LEVEL > 0
+_LOG_VERBOSE = _LOG_LEVEL > 1
+
+# Log events are queued and written by one background thread, so request paths don't pay for JSON
+# encoding or a flushed stdout write on every transport.tx/rx.
+_log_q: queue.SimpleQueue[tuple[float, str, str | None, dict[str, Any]] | None] = queue.SimpleQueue()
+_log_thread: threading.Thread | None = None
+_log_thread_lock = threading.Lock()
+
+
+def _format_event(item: tuple[float, str, str | None, dict[str, Any]]) -> str:
+    ts, event, correlation_id, fields = item
     payload: dict[str, Any] = {
-        "ts": _now_iso(),
+        "ts": _now_iso(ts),
         "event": event,
     }
     if correlation_id:
         payload["correlation_id"] = correlation_id
     payload.update(fields)
-    print(json.dumps(payload), flush=True)
+    try:
+        if orjson is not None:
+            return orjson.dumps(payload).decode("utf-8")
+        return json.dumps(payload)
+    except TypeError:
+        return json.dumps(payload, default=str)
+
+
+def _format_event_safe(item: tuple[float, str, str | None, dict[str, Any]]) -> str:
+    # The writer thread must survive any payload (circular references, bad __str__, ...): one unloggable
+    # event becomes a log.error line instead of killing the thread and silently growing the queue forever.
+    try:
+        return _format_event(item)
+    except Exception as exc:
+        fallback: dict[str, Any] = {"ts": _now_iso(item[0]), "event": "log.error", "dropped_event": str(item[1])}
+        if item[2]:
+            fallback["correlation_id"] = item[2]
+        fallback["error"] = f"{type(exc).__name__}: {exc}"
+        return json.dumps(fallback, default=repr)
+
+
+def _log_writer() -> None:
+    while True:
+        item = _log_q.get()
+        lines: list[str] = []
+        stop = False
+        # Drain whatever else is queued so a burst costs one write + flush.
+        while True:
+            if item is None:
+                stop = True
+            else:
+                lines.append(_format_event_safe(item))
+            try:
+                item = _log_q.get_nowait()
+            except queue.Empty:
+                break
+        if lines:
+            try:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            except (OSError, ValueError):
+                pass
+        if stop:
+            return
+
+
+def _flush_log() -> None:
+    thread = _log_thread
+    if thread is not None and thread.is_alive():
+        _log_q.put(None)
+        thread.join(timeout=2.0)
+
+
+def _log_event(event: str, correlation_id: str | None = None, **fields: Any) -> None:
+    global _log_thread
+    if not _LOG_ENABLED:
+        return
+    if _log_thread is None:
+        with _log_thread_lock:
+            if _log_thread is None:
+                _log_thread = threading.Thread(target=_log_writer, name="orchestrator-log", daemon=True)
+                _log_thread.start()
+                atexit.register(_flush_log)
+    # **fields is already a fresh dict; copy container values too, since they are encoded later on the writer
+    # thread and a caller mutating them in the meantime would otherwise log their later state.
+    for key, value in fields.items():
+        if type(value) is dict or type(value) is list:
+            fields[key] = value.copy()
+    _log_q.put((time.time(), event, correlation_id, fields))
+
+
+def _is_int_like(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return value.is_integer()
+    if isinstance(value, str):
+        try:
+            int(value)
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+# Each check raises on a type mismatch and returns the value to range-check against min/max, if any.
+def _check_int(value: Any, context: str) -> float | None:
+    if not _is_int_like(value):
+        raise RuntimeError(f"{context}: expected int")
+    return float(int(value))
+
+
+def _check_float(value: Any, context: str) -> float | None:
+    if isinstance(value, bool):
+        raise RuntimeError(f"{context}: expected float")
+    try:
+        return float(value)
+    except (TypeError, ValueError) as exc:
+        raise RuntimeError(f"{context}: expected float") from exc
+
+
+_BOOL_STRINGS = frozenset({"true", "false", "1", "0"})
+
+
+def _check_bool(value: Any, context: str) -> float | None:
+    if isinstance(value, bool) or (isinstance(value, str) and value.lower() in _BOOL_STRINGS):
+        return None
+    raise RuntimeError(f"{context}: expected bool")
+
+
+def _check_string(value: Any, context: str) -> float | None:
+    if not isinstance(value, str):
+        raise RuntimeError(f"{context}: expected string")
+    return None
+
+
+_ARG_CHECKS = {"int": _check_int, "float": _check_float, "bool": _check_bool, "string": _check_string}
 
 
 class Orchestrator:
@@ -61,24 +446,61 @@ class Orchestrator:
         # Nodes (especially Pi->Arduino bridges) may briefly block while recovering USB/serial.
         # Keep this generous so a single slow RUN doesn't fail the whole plan.
         step_timeout_s: float = 4.0,
+        # Printing every TELEMETRY line dominates the reader thread at high rates; allow turning it off.
+        echo_telemetry: bool = True,
     ):
         self.nodes = nodes
         self.enable_telemetry = telemetry
         self.timeout_s = timeout_s
         self.step_timeout_s = step_timeout_s
+        self.echo_telemetry = echo_telemetry
+        # Fixed for the orchestrator's lifetime, so _request doesn't re-check the mode on every call.
+        self._await_response = self._await_queued if telemetry else self._readline_direct
+        self.reconnect_max_attempts = 3
+        self._selector = selectors.DefaultSelector()
+        self._rx_thread: threading.Thread | None = None
+        self._rx_lock = threading.Lock()
+        # Receive scratch space for the rx thread, reused across reads instead of a new bytes per recv.
+        self._rx_chunk = memoryview(bytearray(_RECV_SIZE))
+        self.reconnect_base_ms = 150
         self.catalog_qualified: dict[str, NodeInfo] = {}
         self.catalog_unqualified: dict[str, NodeInfo] = {}
+        # alias/node_name/node_id -> node, and upper-cased token -> number of nodes exposing it.
+        self._target_index: dict[str, NodeInfo] = {}
+        # Lower-cased alias/node_name -> node, for namespaced tokens like "base.FWD".
+        self._namespace_index: dict[str, NodeInfo] = {}
+        self._token_owner_count: dict[str, int] = {}
+        # merged_manifest()/telemetry_snapshot() results are shared between callers until invalidated;
+        # treat them as read-only.
+        self._manifest_cache: dict[str, Any] | None = None
+        self._manifest_dirty = True
+        # Bumped on every manifest/name change; the HTTP bridge keys its cached /status body on it.
+        self._manifest_gen = 0
+        self._telemetry_counter = itertools.count(1)
+        self._telemetry_gen = 0
+        self._telemetry_cache: tuple[int, dict[str, Any]] | None = None
+        # Echoed TELEMETRY lines, written to stdout once per readable event. Only the rx thread touches it.
+        self._telemetry_echo: list[str] = []
 
     def connect_all(self) -> None:
         errors: list[dict[str, str]] = []
-        for node in self.nodes:
-            try:
-                self._connect_node(node)
-            except Exception as exc:
+        if not self.nodes:
+            self._build_catalogs()
+            return
+        # Each connect can spend up to timeout_s on mDNS + HELLO; dial all nodes at once so startup
+        # costs the slowest node rather than the sum. Catalogs are built only after every attempt finishes.
+        with ThreadPoolExecutor(max_workers=len(self.nodes), thread_name_prefix="connect") as pool:
+            futures = {pool.submit(self._connect_node, node): node for node in self.nodes}
+            for future in as_completed(futures):
+                node = futures[future]
+                exc = future.exception()
+                if exc is None:
+                    continue
                 # Degraded mode: keep orchestrator running even if some nodes are offline.
                 # The HTTP bridge + desktop app can still come up and show the status.
                 errors.append({"node": node.alias, "error": str(exc)})
                 node.running = False
+                self._unwatch(node)
                 if node.sock is not None:
                     try:
                         node.sock.close()
@@ -88,6 +510,7 @@ class Orchestrator:
                 node.manifest = {}
                 node.node_name = ""
                 node.node_id = ""
+                self._manifest_changed()
                 _log_event("node.connect.error", node=node.alias, error=str(exc))
         self._build_catalogs()
         if errors:
@@ -112,10 +535,12 @@ class Orchestrator:
                 if node.sock is not None and node.running:
                     continue
                 try:
-                    self._reconnect_node(node)
+                    # Already rate-limited per node; a single attempt keeps validate_plan from stalling on offline nodes.
+                    self._reconnect_node(node, attempts=1)
                     any_change = True
                 except Exception as exc:
                     node.running = False
+                    self._unwatch(node)
                     if node.sock is not None:
                         try:
                             node.sock.close()
@@ -125,13 +550,14 @@ class Orchestrator:
                     node.manifest = {}
                     node.node_name = ""
                     node.node_id = ""
+                    self._manifest_changed()
                     _log_event("node.reconnect.error", node=node.alias, error=str(exc))
 
         if any_change:
             self._build_catalogs()
 
     def close_all(self) -> None:
-        for node in self.nodes:
+        def close_node(node: NodeInfo) -> None:
             if self.enable_telemetry and node.telemetry_subscribed and node.running:
                 try:
                     self._request(node, "UNSUB TELEMETRY", timeout=0.5)
@@ -139,6 +565,7 @@ class Orchestrator:
                     pass
                 node.telemetry_subscribed = False
             node.running = False
+            self._unwatch(node)
             if node.sock is not None:
                 try:
                     node.sock.shutdown(socket.SHUT_RDWR)
@@ -149,99 +576,132 @@ class Orchestrator:
                 except OSError:
                     pass
 
-    def _reader_loop(self, node: NodeInfo) -> None:
+        if not self.nodes:
+            return
+        # UNSUB waits up to 0.5s per node; tear down in parallel so shutdown costs one round trip, not N.
+        with ThreadPoolExecutor(max_workers=len(self.nodes), thread_name_prefix="close") as pool:
+            list(pool.map(close_node, self.nodes))
+
+    def _watch(self, node: NodeInfo) -> None:
+        # One selector thread serves every node's telemetry/response stream instead of a thread per node.
         assert node.sock is not None
-        sock = node.sock
-        while node.running:
-            try:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                node.read_buffer.extend(chunk)
-            except TimeoutError:
+        self._selector.register(node.sock, selectors.EVENT_READ, node)
+        with self._rx_lock:
+            if self._rx_thread is None:
+                self._rx_thread = threading.Thread(target=self._rx_loop, name="orchestrator-rx", daemon=True)
+                self._rx_thread.start()
+
+    def _unwatch(self, node: NodeInfo) -> None:
+        if node.sock is None:
+            return
+        try:
+            self._selector.unregister(node.sock)
+        except (KeyError, ValueError):
+            pass
+
+    def _rx_loop(self) -> None:
+        while True:
+            if not self._selector.get_map():
+                # Nothing registered (and some platforms reject select() on an empty set).
+                time.sleep(0.25)
                 continue
+            try:
+                events = self._selector.select(0.25)
             except OSError:
-                break
-
-            while True:
-                newline = node.read_buffer.find(b"\n")
-                if newline < 0:
-                    break
-                raw = bytes(node.read_buffer[:newline])
-                del node.read_buffer[: newline + 1]
-                line = raw.decode("utf-8", errors="replace").strip()
-                if not line:
-                    continue
-
-                if line.startswith("TELEMETRY "):
-                    payload = line[len("TELEMETRY ") :].strip()
-                    for pair in payload.split():
-                        if "=" in pair:
-                            k, v = pair.split("=", 1)
-                            node.telemetry_snapshot[k] = v
-                    if self.enable_telemetry:
-                        print(f"[{node.alias}] {line}")
-                    continue
-
-                node.rx_queue.put(line)
-
-        node.running = False
-
-    def _connect_socket(self, host: str, port: int) -> socket.socket:
-        """
-        Create a TCP connection with robust address selection.
+                # A socket was closed under us; its owner unregisters it.
+                time.sleep(0.01)
+                continue
+            for key, _mask in events:
+                self._on_readable(key.data, key.fileobj)
 
-        mDNS hosts (e.g. *.local) often resolve to both IPv6 link-local and IPv4.
-        On many setups, the IPv6 link-local address is not reachable without a scope id,
-        and naive connection attempts can hang or fail. We prefer IPv4, then fall back.
-        """
-        last_exc: Exception | None = None
+    def _on_readable(self, node: NodeInfo, sock: Any) -> None:
         try:
-            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
-        except OSError as exc:
-            # Fall back to create_connection (will re-raise if broken).
-            last_exc = exc
-            infos = []
-
-        # Prefer IPv4 first, then others.
-        infos_sorted = sorted(infos, key=lambda it: 0 if it[0] == socket.AF_INET else 1)
-        for family, socktype, proto, _canon, sockaddr in infos_sorted:
+            received = sock.recv_into(self._rx_chunk)
+        except (BlockingIOError, TimeoutError):
+            return
+        except OSError:
+            received = 0
+        if not received:
             try:
-                s = socket.socket(family, socktype, proto)
-                s.settimeout(self.timeout_s)
-                s.connect(sockaddr)
-                return s
-            except OSError as exc:
-                last_exc = exc
-                try:
-                    s.close()
-                except Exception:
-                    pass
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+            # Only mark the node down if this is still its live socket (not one replaced by a reconnect).
+            if node.sock is sock:
+                node.running = False
+            return
+        _rearm_quickack(sock)
+        node.read_buffer += self._rx_chunk[:received]
+
+        while True:
+            raw = _pop_line(node)
+            if raw is None:
+                break
+            line = self._handle_line(node, raw)
+            if line is None:
                 continue
+            node.rx_deque.append(line)
+            node.rx_event.set()
 
-        # Final fallback (handles weird platforms where getaddrinfo didn't help).
-        try:
-            return socket.create_connection((host, port), timeout=self.timeout_s)
-        except OSError as exc:
-            last_exc = exc
+        if self._telemetry_echo:
+            try:
+                sys.stdout.write("".join(self._telemetry_echo))
+                sys.stdout.flush()
+            except (OSError, ValueError):
+                pass
+            self._telemetry_echo.clear()
+
+    def _handle_line(self, node: NodeInfo, raw: bytearray) -> str | None:
+        """Apply a TELEMETRY line and return None, or return any other non-blank line decoded."""
+        if raw.startswith(_TELEMETRY_PREFIX):
+            self._apply_telemetry(node, raw)
+            return None
+        return raw.decode("utf-8", errors="replace").strip() or None
+
+    def _apply_telemetry(self, node: NodeInfo, raw: bytearray) -> None:
+        # Split on bytes and decode only the key/value pieces; this runs for every telemetry line.
+        snapshot = node.telemetry_snapshot
+        keys = _TELEMETRY_KEYS
+        for pair in bytes(raw[len(_TELEMETRY_PREFIX) :]).split():
+            k, sep, v = pair.partition(b"=")
+            if sep:
+                key = keys.get(k)
+                if key is None:
+                    key = k.decode("utf-8", errors="replace")
+                    if len(keys) < _TELEMETRY_KEYS_MAX:
+                        keys[k] = key
+                snapshot[key] = v.decode("utf-8", errors="replace")
+        self._telemetry_gen = next(self._telemetry_counter)
+        if self.enable_telemetry and self.echo_telemetry:
+            self._telemetry_echo.append(f"[{node.alias}] {raw.decode('utf-8', errors='replace').strip()}\n")
 
-        raise last_exc if last_exc is not None else RuntimeError("connect failed")
+    def _connect_socket(self, host: str, port: int) -> socket.socket:
+        return _dial(host, port, self.timeout_s)
 
     def _connect_node(self, node: NodeInfo) -> None:
         node.sock = self._connect_socket(node.host, node.port)
+        node.sock_timeout = self.timeout_s
+        # Requests are single short lines; don't let Nagle / delayed ACKs hold them back.
+        try:
+            node.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        _rearm_quickack(node.sock)
         node.running = True
         if self.enable_telemetry:
-            node.reader_thread = threading.Thread(target=self._reader_loop, args=(node,), daemon=True)
-            node.reader_thread.start()
+            self._watch(node)
 
         hello_line = self._request(node, "HELLO")
         if not hello_line.startswith("MANIFEST "):
             raise RuntimeError(f"{node.alias}: expected MANIFEST from HELLO, got: {hello_line}")
 
-        manifest = json.loads(hello_line[len("MANIFEST ") :])
+        manifest = _json_loads(hello_line[len("MANIFEST ") :])
         node.manifest = manifest
         node.node_name = str(manifest.get("device", {}).get("name", node.alias))
         node.node_id = str(manifest.get("device", {}).get("node_id", node.alias))
+        self._manifest_changed()
+        # Snapshot keys use node_name, which may have just changed.
+        self._telemetry_gen = next(self._telemetry_counter)
 
         if self.enable_telemetry:
             ack = self._request(node, "SUB TELEMETRY")
@@ -254,70 +714,97 @@ class Orchestrator:
             f"{','.join(cmd.get('token', '') for cmd in manifest.get('commands', []))}"
         )
 
-    def _reconnect_node(self, node: NodeInfo) -> None:
+    def _reconnect_node(self, node: NodeInfo, attempts: int | None = None) -> None:
         """
         Best-effort reconnect for flaky links.
 
         The desktop app/orchestrator can run for long periods while Pi ethernet/USB is flaky.
         When a node connection drops, we prefer to reconnect and retry the request once rather
-        than failing the whole plan immediately.
+        than failing the whole plan immediately. A node mid USB/serial reset usually refuses for
+        a moment, so failed attempts are retried with exponential backoff plus jitter.
         """
-        node.running = False
-        if node.sock is not None:
-            try:
-                node.sock.shutdown(socket.SHUT_RDWR)
-            except OSError:
-                pass
+        attempts = self.reconnect_max_attempts if attempts is None else attempts
+        for attempt in range(attempts):
+            node.running = False
+            self._unwatch(node)
+            if node.sock is not None:
+                try:
+                    node.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                try:
+                    node.sock.close()
+                except OSError:
+                    pass
+            node.sock = None
+            node.rx_deque = collections.deque()
+            node.rx_event = threading.Event()
+            node.read_buffer = bytearray()
+            node.read_pos = 0
+            node.telemetry_subscribed = False
             try:
-                node.sock.close()
-            except OSError:
-                pass
-        node.sock = None
-        node.rx_queue = queue.Queue()
-        node.read_buffer = bytearray()
-        node.telemetry_subscribed = False
-        self._connect_node(node)
-
-    def _readline_direct(self, node: NodeInfo, timeout: float) -> str:
+                self._connect_node(node)
+                # The node's name, id or commands may have changed; keep the lookup indexes in sync.
+                self._build_catalogs()
+                return
+            except (OSError, RuntimeError):
+                if attempt + 1 >= attempts:
+                    raise
+                delay_ms = self.reconnect_base_ms * (2**attempt) + random.uniform(0, 50)
+                _log_event("node.reconnect.retry", node=node.alias, attempt=attempt + 1, delay_ms=round(delay_ms))
+                time.sleep(delay_ms / 1000.0)
+
+    def _readline_direct(self, node: NodeInfo, timeout: float, line: str) -> str:
         assert node.sock is not None
         sock = node.sock
-        previous_timeout = sock.gettimeout()
         try:
-            sock.settimeout(timeout)
+            # Callers hold request_lock, so nothing else changes the timeout between requests.
+            if node.sock_timeout != timeout:
+                sock.settimeout(timeout)
+                node.sock_timeout = timeout
             while True:
-                newline = node.read_buffer.find(b"\n")
-                if newline >= 0:
-                    raw = bytes(node.read_buffer[:newline])
-                    del node.read_buffer[: newline + 1]
-                    line = raw.decode("utf-8", errors="replace").strip()
-                    if not line:
-                        continue
-                    if line.startswith("TELEMETRY "):
-                        payload = line[len("TELEMETRY ") :].strip()
-                        for pair in payload.split():
-                            if "=" in pair:
-                                k, v = pair.split("=", 1)
-                                node.telemetry_snapshot[k] = v
-                        if self.enable_telemetry:
-                            print(f"[{node.alias}] {line}")
-                        continue
-                    return line
+                raw = _pop_line(node)
+                if raw is not None:
+                    response = self._handle_line(node, raw)
+                    if response is not None:
+                        return response
+                    continue
 
-                chunk = sock.recv(4096)
+                chunk = sock.recv(_RECV_SIZE)
                 if not chunk:
                     raise RuntimeError(f"{node.alias}: connection closed while waiting for response")
+                _rearm_quickack(sock)
                 node.read_buffer.extend(chunk)
         except TimeoutError as exc:
-            raise RuntimeError(f"{node.alias}: timeout waiting for response") from exc
+            raise RuntimeError(f"{node.alias}: timeout waiting for response to '{line}'") from exc
         except OSError as exc:
             raise RuntimeError(f"{node.alias}: socket error while waiting for response: {exc}") from exc
-        finally:
+
+    def _await_queued(self, node: NodeInfo, timeout: float, line: str) -> str:
+        response = self._pop_response(node, timeout)
+        if response is None:
+            raise RuntimeError(f"{node.alias}: timeout waiting for response to '{line}'")
+        return response
+
+    def _pop_response(self, node: NodeInfo, timeout: float) -> str | None:
+        deadline = time.monotonic() + timeout
+        while True:
             try:
-                sock.settimeout(previous_timeout)
-            except OSError:
+                return node.rx_deque.popleft()
+            except IndexError:
                 pass
+            # Clear before re-checking so an append between the two can't be missed.
+            node.rx_event.clear()
+            if node.rx_deque:
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not node.rx_event.wait(remaining):
+                try:
+                    return node.rx_deque.popleft()
+                except IndexError:
+                    return None
 
-    def _request(self, node: NodeInfo, line: str, timeout: float | None = None, correlation_id: str | None = None) -> str:
+    def _ensure_connected(self, node: NodeInfo) -> None:
         if node.sock is None or not node.running:
             with node.reconnect_lock:
                 if node.sock is None or not node.running:
@@ -326,44 +813,71 @@ class Orchestrator:
                     except Exception as exc:
                         raise RuntimeError(f"{node.alias}: not connected") from exc
 
-        wait = self.timeout_s if timeout is None else timeout
-        _log_event("transport.tx", correlation_id, node=node.alias, line=line, timeout_s=wait)
-        with node.request_lock:
+    def _send(self, node: NodeInfo, data: bytes, what: str) -> None:
+        # Caller holds request_lock.
+        try:
+            node.sock.sendall(data)
+        except OSError as exc:
+            # If the peer closed (Broken pipe / reset), reconnect and retry once.
             try:
-                with node.write_lock:
-                    node.sock.sendall((line + "\n").encode("utf-8"))
-            except OSError as exc:
-                # If the peer closed (Broken pipe / reset), reconnect and retry once.
-                try:
-                    with node.reconnect_lock:
-                        self._reconnect_node(node)
-                        assert node.sock is not None
-                    with node.write_lock:
-                        node.sock.sendall((line + "\n").encode("utf-8"))
-                except Exception:
-                    raise RuntimeError(f"{node.alias}: socket error sending '{line}': {exc}") from exc
+                with node.reconnect_lock:
+                    self._reconnect_node(node)
+                    assert node.sock is not None
+                node.sock.sendall(data)
+            except Exception:
+                raise RuntimeError(f"{node.alias}: socket error sending '{what}': {exc}") from exc
 
-            if self.enable_telemetry:
-                try:
-                    response = node.rx_queue.get(timeout=wait)
-                except queue.Empty as exc:
-                    raise RuntimeError(f"{node.alias}: timeout waiting for response to '{line}'") from exc
-            else:
-                response = self._readline_direct(node, wait)
-        _log_event("transport.rx", correlation_id, node=node.alias, line=line, response=response)
+    def _request(self, node: NodeInfo, line: str, timeout: float | None = None, correlation_id: str | None = None) -> str:
+        self._ensure_connected(node)
+        wait = self.timeout_s if timeout is None else timeout
+        if _LOG_VERBOSE:
+            _log_event("transport.tx", correlation_id, node=node.alias, line=line, timeout_s=wait)
+        data = _wire(line)
+        with node.request_lock:
+            self._send(node, data, line)
+            response = self._await_response(node, wait, line)
+        if _LOG_VERBOSE:
+            _log_event("transport.rx", correlation_id, node=node.alias, line=line, response=response)
         return response
 
+    def _request_batch(
+        self, node: NodeInfo, lines: list[str], timeout: float | None = None, correlation_id: str | None = None
+    ) -> list[str]:
+        """Pipeline lines to one node in a single write and return their responses in order."""
+        self._ensure_connected(node)
+        wait = self.timeout_s if timeout is None else timeout
+        if _LOG_VERBOSE:
+            _log_event("transport.tx", correlation_id, node=node.alias, lines=lines, timeout_s=wait)
+        data = b"".join(map(_wire, lines))
+        with node.request_lock:
+            self._send(node, data, " | ".join(lines))
+            # Every line gets exactly one reply, so drain them all even after an ERR to keep the stream in step.
+            responses = [self._await_response(node, wait, line) for line in lines]
+        if _LOG_VERBOSE:
+            _log_event("transport.rx", correlation_id, node=node.alias, lines=lines, responses=responses)
+        return responses
+
     def _build_catalogs(self) -> None:
         self.catalog_qualified = {}
         self.catalog_unqualified = {}
+        target_index: dict[str, NodeInfo] = {}
+        namespace_index: dict[str, NodeInfo] = {}
+        owner_count: dict[str, int] = {}
         first_owner: dict[str, NodeInfo] = {}
         duplicates: set[str] = set()
 
         for node in self.nodes:
-            for command in node.manifest.get("commands", []):
-                token = str(command.get("token", "")).upper()
+            # Earlier nodes win, matching the old first-match scan over self.nodes.
+            for key in (node.alias, node.node_name, node.node_id):
+                target_index.setdefault(key, node)
+            for key in (node.alias.lower(), node.node_name.lower()):
+                namespace_index.setdefault(key, node)
+            # Distinct tokens per node: a token a manifest lists twice still has one owner, so it stays
+            # resolvable unqualified; only a token on two different nodes is ambiguous.
+            for token in self._command_specs(node):
                 if not token:
                     continue
+                owner_count[token] = owner_count.get(token, 0) + 1
                 self.catalog_qualified[f"{node.alias}.{token}"] = node
                 if token in first_owner:
                     duplicates.add(token)
@@ -373,11 +887,23 @@ class Orchestrator:
         for token, owner in first_owner.items():
             if token not in duplicates:
                 self.catalog_unqualified[token] = owner
+        self._target_index = target_index
+        self._namespace_index = namespace_index
+        self._token_owner_count = owner_count
+        self._manifest_changed()
+
+    def _manifest_changed(self) -> None:
+        self._manifest_dirty = True
+        self._manifest_gen += 1
 
     def merged_manifest(self, allow_reconnect: bool = True) -> dict[str, Any]:
         # /status should be fast and should not block on reconnect attempts.
         if allow_reconnect:
             self.maybe_reconnect_disconnected()
+        # Manifests only change on (re)connect, which marks the cache dirty.
+        if not self._manifest_dirty and self._manifest_cache is not None:
+            return self._manifest_cache
+        self._manifest_dirty = False
         nodes: list[dict[str, Any]] = []
         for node in self.nodes:
             services_in = node.manifest.get("services") if isinstance(node.manifest.get("services"), dict) else {}
@@ -413,97 +939,75 @@ class Orchestrator:
                 }
             )
 
-        return {
+        self._manifest_cache = {
             "daemon_version": "0.1",
             "nodes": nodes,
         }
+        return self._manifest_cache
 
     def telemetry_snapshot(self) -> dict[str, Any]:
+        gen = self._telemetry_gen
+        cached = self._telemetry_cache
+        if cached is not None and cached[0] == gen:
+            return cached[1]
         snapshot: dict[str, Any] = {}
         for node in self.nodes:
             key = node.node_name or node.alias
             snapshot[key] = dict(node.telemetry_snapshot)
+        self._telemetry_cache = (gen, snapshot)
         return snapshot
 
     def _node_from_target(self, target: str) -> NodeInfo | None:
-        for node in self.nodes:
-            if target in {node.alias, node.node_name, node.node_id}:
-                return node
-        return None
-
-    def _command_spec(self, node: NodeInfo, token: str) -> dict[str, Any] | None:
-        token_u = token.upper()
-        for command in node.manifest.get("commands", []):
-            if str(command.get("token", "")).upper() == token_u:
-                return command
-        return None
-
-    def _is_token_ambiguous(self, token: str) -> bool:
-        token_u = token.upper()
-        matches = [node for key, node in self.catalog_qualified.items() if key.endswith(f".{token_u}")]
-        return len(matches) > 1
-
-    def _validate_arg_value(self, arg_value: Any, arg_spec: dict[str, Any], context: str) -> None:
-        arg_type = str(arg_spec.get("type", "")).lower()
-
-        def is_int_like(value: Any) -> bool:
-            if isinstance(value, bool):
-                return False
-            if isinstance(value, int):
-                return True
-            if isinstance(value, float):
-                return value.is_integer()
-            if isinstance(value, str):
-                try:
-                    int(value)
-                    return True
-                except ValueError:
-                    return False
-            return False
+        return self._target_index.get(target)
 
-        if arg_type == "int":
-            if not is_int_like(arg_value):
-                raise RuntimeError(f"{context}: expected int")
-            numeric_value = float(int(arg_value))
-        elif arg_type == "float":
-            if isinstance(arg_value, bool):
-                raise RuntimeError(f"{context}: expected float")
-            try:
-                numeric_value = float(arg_value)
-            except (TypeError, ValueError) as exc:
-                raise RuntimeError(f"{context}: expected float") from exc
-        elif arg_type == "bool":
-            if isinstance(arg_value, bool):
-                numeric_value = None
-            elif isinstance(arg_value, str) and arg_value.lower() in {"true", "false", "1", "0"}:
-                numeric_value = None
-            else:
-                raise RuntimeError(f"{context}: expected bool")
-        elif arg_type == "string":
-            if not isinstance(arg_value, str):
-                raise RuntimeError(f"{context}: expected string")
-            numeric_value = None
-        else:
-            raise RuntimeError(f"{context}: unsupported arg type '{arg_type}'")
-
-        allowed = arg_spec.get("enum")
-        if isinstance(allowed, list) and allowed:
-            if arg_value not in allowed and str(arg_value) not in [str(item) for item in allowed]:
-                raise RuntimeError(f"{context}: value '{arg_value}' not in enum {allowed}")
+    @staticmethod
+    def _command_specs(node: NodeInfo) -> dict[str, CommandSpec]:
+        # Keyed on the manifest object itself, so (re)connects and resets invalidate it without bookkeeping.
+        if node.command_specs_source is not node.manifest:
+            specs: dict[str, CommandSpec] = {}
+            for command in node.manifest.get("commands", []):
+                spec = CommandSpec.from_manifest(command)
+                # First spec wins, matching the catalog's view of duplicate tokens.
+                specs.setdefault(spec.token, spec)
+            node.command_specs = specs
+            node.command_specs_source = node.manifest
+        return node.command_specs
+
+    @staticmethod
+    def _manifest_summary(node: NodeInfo) -> dict[str, Any]:
+        if node.summary_source is not node.manifest:
+            services = node.manifest.get("services")
+            node.summary_cache = {
+                "commands": [str(command.get("token", "")) for command in node.manifest.get("commands", [])],
+                "services": services if isinstance(services, dict) else {},
+            }
+            node.summary_source = node.manifest
+        return node.summary_cache
+
+    def _validate_arg_value(self, arg_value: Any, arg_spec: ArgSpec, context: str) -> None:
+        check = _ARG_CHECKS.get(arg_spec.type)
+        if check is None:
+            raise RuntimeError(f"{context}: unsupported arg type '{arg_spec.type}'")
+        numeric_value = check(arg_value, context)
+
+        if not arg_spec.allows(arg_value):
+            raise RuntimeError(f"{context}: value '{arg_value}' not in enum {arg_spec.enum}")
 
         if numeric_value is not None:
-            min_value = arg_spec.get("min")
-            max_value = arg_spec.get("max")
+            min_value = arg_spec.minimum
+            max_value = arg_spec.maximum
             if min_value is not None and numeric_value < float(min_value):
                 raise RuntimeError(f"{context}: value {numeric_value} < min {min_value}")
             if max_value is not None and numeric_value > float(max_value):
                 raise RuntimeError(f"{context}: value {numeric_value} > max {max_value}")
 
-    def validate_plan(self, plan: list[dict[str, Any]], correlation_id: str | None = None) -> None:
+    def validate_plan(self, plan: list[dict[str, Any]], correlation_id: str | None = None) -> list[ResolvedStep]:
+        """Validate a plan and return its steps pre-resolved for execute_plan."""
         if not isinstance(plan, list):
             raise RuntimeError("plan must be a list")
         self.maybe_reconnect_disconnected()
         _log_event("orchestrator.validate_plan.start", correlation_id, plan_len=len(plan))
+        resolved: list[ResolvedStep] = []
 
         for index, step in enumerate(plan):
             if not isinstance(step, dict):
@@ -514,6 +1018,7 @@ class Orchestrator:
                 raise RuntimeError(f"step[{index}] has invalid type '{step.get('type')}'")
 
             if step_type == "STOP":
+                resolved.append(ResolvedStep(kind="STOP"))
                 continue
 
             target = step.get("target")
@@ -524,17 +1029,19 @@ class Orchestrator:
             if not isinstance(token, str) or not token.strip():
                 raise RuntimeError(f"step[{index}] RUN requires non-empty string token")
 
-            if target is None and self._is_token_ambiguous(token):
+            # Upper-cased once here; the catalogs and command specs are all keyed on the upper-case form.
+            token_u = token.upper()
+            if target is None and self._token_owner_count.get(token_u, 0) > 1:
                 raise RuntimeError(
-                    f"step[{index}] token '{token.upper()}' is ambiguous across nodes; explicit target is required"
+                    f"step[{index}] token '{token_u}' is ambiguous across nodes; explicit target is required"
                 )
 
             try:
-                node = self.resolve_node(target, token)
+                node = self._resolve_node(target, token_u)
             except RuntimeError as exc:
                 raise RuntimeError(f"step[{index}] {exc}") from exc
 
-            command_spec = self._command_spec(node, token)
+            command_spec = self._command_specs(node).get(token_u)
             if command_spec is None:
                 target_name = target if target is not None else node.alias
                 raise RuntimeError(f"step[{index}] token '{token}' not found on node '{target_name}'")
@@ -543,7 +1050,7 @@ class Orchestrator:
             if not isinstance(args, list):
                 raise RuntimeError(f"step[{index}] args must be a list")
 
-            spec_args = command_spec.get("args", [])
+            spec_args = command_spec.args
             if len(args) != len(spec_args):
                 raise RuntimeError(
                     f"step[{index}] token '{token}' expects {len(spec_args)} args, got {len(args)}"
@@ -567,103 +1074,216 @@ class Orchestrator:
                 if duration < 0:
                     raise RuntimeError(f"step[{index}] duration_ms must be >= 0")
                 step["duration_ms"] = duration
+
+            parallel = step.get("parallel", False)
+            if not isinstance(parallel, bool):
+                raise RuntimeError(f"step[{index}] parallel must be a boolean")
+            if parallel and resolved and resolved[-1].parallel:
+                # Walk back over the current group; a node can only run one step at a time.
+                group_start = len(resolved) - 1
+                while group_start > 0 and resolved[group_start - 1].parallel:
+                    group_start -= 1
+                if any(prev.node is node for prev in resolved[group_start:]):
+                    raise RuntimeError(f"step[{index}] parallel steps must target different nodes")
+
+            run = self._resolve_run(node, target, token_u, args, step.get("duration_ms"))
+            run.parallel = parallel
+            resolved.append(run)
         _log_event("orchestrator.validate_plan.ok", correlation_id, plan_len=len(plan))
+        return resolved
 
     def resolve_node(self, target: str | None, token: str) -> NodeInfo:
-        token_u = token.upper()
+        return self._resolve_node(target, token.upper())
 
+    def _resolve_node(self, target: str | None, token_u: str) -> NodeInfo:
         if target:
-            for node in self.nodes:
-                if target in {node.alias, node.node_name, node.node_id}:
-                    return node
+            node = self._node_from_target(target)
+            if node is not None:
+                return node
             raise RuntimeError(f"Unknown target '{target}'")
 
         if "." in token_u:
             prefix, bare = token_u.split(".", 1)
-            for node in self.nodes:
-                if prefix.lower() in {node.alias.lower(), node.node_name.lower()}:
-                    return self.resolve_node(node.alias, bare)
-            raise RuntimeError(f"Unknown namespaced token '{token}'")
+            node = self._namespace_index.get(prefix.lower())
+            if node is not None:
+                return self._resolve_node(node.alias, bare)
+            raise RuntimeError(f"Unknown namespaced token '{token_u}'")
 
         owner = self.catalog_unqualified.get(token_u)
         if owner:
             return owner
 
-        matches = [node for key, node in self.catalog_qualified.items() if key.endswith(f".{token_u}")]
-        if len(matches) == 1:
-            return matches[0]
-        if len(matches) > 1:
+        if self._token_owner_count.get(token_u, 0) > 1:
             raise RuntimeError(f"Ambiguous token '{token_u}', use namespaced token or target")
         raise RuntimeError(f"Token '{token_u}' not found")
 
-    def run_step(self, step: dict[str, Any], correlation_id: str | None = None) -> None:
-        step_type = str(step.get("type", "")).upper()
-        if step_type == "STOP":
+    @staticmethod
+    def _resolve_run(
+        node: NodeInfo, target: str | None, token_u: str, args: list[Any], duration_ms: Any
+    ) -> ResolvedStep:
+        return ResolvedStep(
+            kind="RUN",
+            node=node,
+            target=target,
+            token=token_u,
+            args=args,
+            wire=" ".join(["RUN", token_u, *map(str, args)]),
+            duration_ms=None if duration_ms is None else float(duration_ms),
+        )
+
+    def run_step(self, step: dict[str, Any] | ResolvedStep, correlation_id: str | None = None) -> None:
+        if not isinstance(step, ResolvedStep):
+            step_type = str(step.get("type", "")).upper()
+            if step_type == "STOP":
+                step = ResolvedStep(kind="STOP")
+            elif step_type != "RUN":
+                raise RuntimeError(f"Unsupported step type: {step_type}")
+            else:
+                token = str(step.get("token", ""))
+                target = step.get("target")
+                step = self._resolve_run(
+                    self.resolve_node(target, token), target, token.upper(), step.get("args", []), step.get("duration_ms")
+                )
+
+        if step.kind == "STOP":
             _log_event("orchestrator.run_step.stop", correlation_id)
             self.emergency_stop(correlation_id=correlation_id)
             return
 
-        if step_type != "RUN":
-            raise RuntimeError(f"Unsupported step type: {step_type}")
-
-        token = str(step.get("token", "")).upper()
-        target = step.get("target")
-        args = step.get("args", [])
-        duration_ms = step.get("duration_ms")
-
-        node = self.resolve_node(target, token)
+        node = step.node
+        assert node is not None
         _log_event(
             "orchestrator.run_step.start",
             correlation_id,
-            target=target,
+            target=step.target,
             resolved_node=node.alias,
-            token=token,
-            args=args,
-            duration_ms=duration_ms,
+            token=step.token,
+            args=step.args,
+            duration_ms=step.duration_ms,
         )
 
-        wire = ["RUN", token] + [str(arg) for arg in args]
-        response = self._request(node, " ".join(wire), timeout=self.step_timeout_s, correlation_id=correlation_id)
+        run_sent = time.monotonic()
+        response = self._request(node, step.wire, timeout=self.step_timeout_s, correlation_id=correlation_id)
         if response != "OK":
             raise RuntimeError(f"{node.alias}: RUN failed -> {response}")
 
-        if duration_ms is not None:
-            delay = max(0.0, float(duration_ms) / 1000.0)
-            time.sleep(delay)
+        if step.duration_ms is not None:
+            # The duration counts from when RUN went out, not from its OK, so the reply's return trip isn't
+            # added on top; STOP is sent half a (capped) STOP round trip before that deadline.
+            deadline = run_sent + step.duration_ms / 1000.0 - min(node.stop_rtt_s / 2.0, _STOP_LEAD_MAX_S)
+            while (remaining := deadline - time.monotonic()) > 0:
+                time.sleep(remaining)
+            sent = time.monotonic()
             stop_resp = self._request(node, "STOP", timeout=self.step_timeout_s, correlation_id=correlation_id)
+            rtt = time.monotonic() - sent
+            node.stop_rtt_s = rtt if not node.stop_rtt_s else 0.8 * node.stop_rtt_s + 0.2 * rtt
             if stop_resp != "OK":
                 raise RuntimeError(f"{node.alias}: STOP after duration failed -> {stop_resp}")
-        _log_event("orchestrator.run_step.ok", correlation_id, token=token, node=node.alias)
+        _log_event("orchestrator.run_step.ok", correlation_id, token=step.token, node=node.alias)
 
-    def execute_plan(self, plan: list[dict[str, Any]], correlation_id: str | None = None) -> None:
+    def execute_plan(
+        self,
+        plan: list[dict[str, Any]] | list[ResolvedStep],
+        correlation_id: str | None = None,
+        pipeline: bool = False,
+    ) -> None:
+        """
+        Run a plan; pass validate_plan's result to skip re-resolving each step.
+
+        With pipeline=True, back-to-back RUNs without a duration on one node go out in one write. The node
+        has then already received (and will run) the steps after a failing one before the panic STOP
+        arrives, so only opt in for plans whose steps are safe to run regardless of an earlier ERR.
+        """
         _log_event("orchestrator.execute_plan.start", correlation_id, plan_len=len(plan))
-        for index, step in enumerate(plan):
+        index = 0
+        while index < len(plan):
+            end = index + 1
+            batch = False
+            if isinstance(plan[index], ResolvedStep) and plan[index].parallel:
+                while end < len(plan) and isinstance(plan[end], ResolvedStep) and plan[end].parallel:
+                    end += 1
+            elif pipeline and _pipelinable(plan[index]):
+                # Back-to-back RUNs without a duration on one node go out in one write: one round trip, not N.
+                while end < len(plan) and _pipelinable(plan[end]) and plan[end].node is plan[index].node:
+                    end += 1
+                batch = end - index > 1
+            failed_at = index
             try:
-                self.run_step(step, correlation_id=correlation_id)
+                if batch:
+                    steps = plan[index:end]
+                    node = steps[0].node
+                    for step in steps:
+                        _log_event(
+                            "orchestrator.run_step.start",
+                            correlation_id,
+                            target=step.target,
+                            resolved_node=node.alias,
+                            token=step.token,
+                            args=step.args,
+                            duration_ms=None,
+                        )
+                    responses = self._request_batch(
+                        node, [step.wire for step in steps], timeout=self.step_timeout_s, correlation_id=correlation_id
+                    )
+                    for offset, (step, response) in enumerate(zip(steps, responses)):
+                        if response != "OK":
+                            failed_at = index + offset
+                            raise RuntimeError(f"{node.alias}: RUN failed -> {response}")
+                        _log_event("orchestrator.run_step.ok", correlation_id, token=step.token, node=node.alias)
+                elif end - index > 1:
+                    # Steps in a parallel group target different nodes, so their sockets don't contend.
+                    with ThreadPoolExecutor(max_workers=end - index, thread_name_prefix="plan-step") as pool:
+                        futures = [
+                            pool.submit(self.run_step, plan[i], correlation_id=correlation_id) for i in range(index, end)
+                        ]
+                    for offset, future in enumerate(futures):
+                        step_exc = future.exception()
+                        if step_exc is not None:
+                            failed_at = index + offset
+                            raise step_exc
+                else:
+                    self.run_step(plan[index], correlation_id=correlation_id)
             except Exception as exc:
                 try:
                     self.emergency_stop(correlation_id=correlation_id)
                 except Exception as stop_exc:
-                    raise RuntimeError(f"step[{index}] failed: {exc}; panic STOP failed: {stop_exc}") from exc
-                raise RuntimeError(f"step[{index}] failed: {exc}; panic STOP sent") from exc
+                    raise RuntimeError(f"step[{failed_at}] failed: {exc}; panic STOP failed: {stop_exc}") from exc
+                raise RuntimeError(f"step[{failed_at}] failed: {exc}; panic STOP sent") from exc
+            index = end
         _log_event("orchestrator.execute_plan.ok", correlation_id, plan_len=len(plan))
 
     def emergency_stop(self, correlation_id: str | None = None) -> None:
         _log_event("orchestrator.emergency_stop.start", correlation_id)
-        for node in self.nodes:
+
+        def stop_node(node: NodeInfo) -> None:
             try:
                 if node.sock is None:
                     print(f"stop warning [{node.alias}]: socket not connected")
-                    continue
+                    return
                 # STOP can block briefly if a node is recovering USB/serial; keep this > typical reset delay.
                 response = self._request(node, "STOP", timeout=2.5, correlation_id=correlation_id)
                 if response != "OK":
                     print(f"stop warning [{node.alias}]: {response}")
             except Exception as exc:
                 print(f"stop warning [{node.alias}]: {exc}")
+
+        if self.nodes:
+            # Fan STOP out to every node at once so one wedged node can't delay the others. The outer
+            # bound returns control to the caller even if a node never answers; its worker is left to finish.
+            pool = ThreadPoolExecutor(max_workers=len(self.nodes), thread_name_prefix="estop")
+            futures = {pool.submit(stop_node, node): node for node in self.nodes}
+            pool.shutdown(wait=False)
+            _done, pending = wait(futures, timeout=3.0)
+            for future in pending:
+                print(f"stop warning [{futures[future].alias}]: no STOP reply within 3.0s")
         _log_event("orchestrator.emergency_stop.ok", correlation_id)
 
 
+def _pipelinable(step: Any) -> bool:
+    # A duration needs its own timed STOP, so only instantaneous RUNs can share a write.
+    return isinstance(step, ResolvedStep) and step.kind == "RUN" and step.duration_ms is None and not step.parallel
+
+
 def parse_node_arg(raw: str) -> NodeInfo:
     if "=" not in raw or ":" not in raw:
         raise argparse.ArgumentTypeError("--node must be in format alias=host:port")
@@ -678,6 +1298,58 @@ def parse_node_arg(raw: str) -> NodeInfo:
     return NodeInfo(alias=alias, host=host, port=port)
 
 
+# Idle keep-alive connections to the planner / pi brain, keyed by (scheme, host, port). Reusing one skips
+# the mDNS lookup and TCP handshake that urlopen paid on every request.
+_HTTP_IDLE: dict[tuple[str, str, int | None], list[http.client.HTTPConnection]] = {}
+_HTTP_IDLE_LOCK = threading.Lock()
+_HTTP_MAX_IDLE = 4
+
+
+def _pooled_post(url: str, body: bytes, headers: dict[str, str], timeout: float) -> tuple[int, bytes]:
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in {"http", "https"} or not parts.hostname:
+        raise urllib.error.URLError(f"unsupported url: {url}")
+    key = (parts.scheme, parts.hostname, parts.port)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    for attempt in range(2):
+        with _HTTP_IDLE_LOCK:
+            idle = _HTTP_IDLE.get(key)
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conn_cls(parts.hostname, parts.port, timeout=timeout)
+        try:
+            if conn.sock is None and parts.scheme == "http":
+                # Dial through the shared address cache so new connections skip the (mDNS) lookup too;
+                # the Host header still carries the hostname.
+                conn.sock = _dial(parts.hostname, parts.port or 80, timeout)
+                conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.request("POST", path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            # A pooled socket may have been closed by the server while idle; retry once on a fresh one.
+            if reused and attempt == 0 and not isinstance(exc, TimeoutError):
+                continue
+            raise urllib.error.URLError(exc) from exc
+
+        if response.will_close:
+            conn.close()
+        else:
+            with _HTTP_IDLE_LOCK:
+                idle = _HTTP_IDLE.setdefault(key, [])
+                if len(idle) < _HTTP_MAX_IDLE:
+                    idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+        return response.status, data
+    raise AssertionError("unreachable")
+
+
 def call_remote_planner(
     planner_url: str,
     instruction: str,
@@ -685,30 +1357,27 @@ def call_remote_planner(
     telemetry_snapshot: dict,
     correlation_id: str | None = None,
 ) -> dict:
-    payload = json.dumps(
+    payload = _json(
         {
             "instruction": instruction,
             "system_manifest": system_manifest,
             "telemetry_snapshot": telemetry_snapshot,
             "correlation_id": correlation_id,
         }
-    ).encode("utf-8")
+    )
 
-    request = urllib.request.Request(
+    status, body = _pooled_post(
         planner_url,
-        data=payload,
-        headers={
+        payload,
+        {
             "Content-Type": "application/json",
             **({"X-Correlation-Id": correlation_id} if correlation_id else {}),
         },
-        method="POST",
+        timeout=5,
     )
-
-    with urllib.request.urlopen(request, timeout=5) as response:
-        if response.status != 200:
-            raise RuntimeError(f"Planner returned HTTP {response.status}")
-        body = response.read().decode("utf-8")
-    parsed = json.loads(body)
+    if status != 200:
+        raise RuntimeError(f"Planner returned HTTP {status}")
+    parsed = _json_loads(body)
     if not isinstance(parsed, dict) or "plan" not in parsed or not isinstance(parsed["plan"], list):
         raise RuntimeError("Planner response missing plan[]")
     return parsed
@@ -802,77 +1471,155 @@ def make_plan(
     return local
 
 
+# Reason phrases as bytes, filled in on first use of each status code.
+_REASONS: dict[int, bytes] = {}
+
+
+# Fixed response bodies, serialized once.
+_NOT_FOUND_BODY = _json({"ok": False, "error": "not_found"})
+# Request bodies above this size are read into a preallocated buffer (see _read_json_body).
+_SMALL_BODY = 64 * 1024
+
+
+class _BridgeServer(http.server.ThreadingHTTPServer):
+    # socketserver listens with a backlog of 5; bursts of planner/UI requests overflow that and show up as
+    # connection resets. The kernel still caps this at net.core.somaxconn.
+    request_queue_size = 2048
+
+
 def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
     # Prevent concurrent plans from interleaving on the wire, but NEVER let /stop hang.
     # If a plan thread wedges while holding the lock, /execute_plan should fail fast with 409
     # and /stop should still send best-effort STOPs.
     execution_lock = threading.Lock()
     pi_brain_url = "http://vporto26.local:8090/vision_step"
+    # Serialized /status and /telemetry bodies, keyed on what they depend on. Dashboards poll these several
+    # times a second while nothing changes.
+    status_cache: list[tuple[Any, bytes]] = []
+    telemetry_cache: list[tuple[int, bytes]] = []
 
     class Handler(http.server.BaseHTTPRequestHandler):
+        # Keep-alive: a polling client (desktop app /status, /telemetry) reuses one connection and one
+        # handler thread instead of a new TCP connection + thread per request. Every response goes
+        # through _write_json, which always sets Content-Length.
+        protocol_version = "HTTP/1.1"
+        # An idle kept-alive connection would otherwise pin its handler thread forever; close it after 30 s
+        # without a request. Long /execute_plan runs are unaffected: this bounds socket reads/writes, not handling.
+        timeout = 30
+        # Responses are a single small write; send it immediately rather than coalescing.
+        disable_nagle_algorithm = True
+
+        def _discard_body(self) -> None:
+            # Unread request bytes would be parsed as the next request on a kept-alive connection.
+            content_length = int(self.headers.get("Content-Length", "0") or "0")
+            if content_length > 0:
+                self.rfile.read(content_length)
+
         def _write_json(self, status_code: int, payload: dict[str, Any]) -> None:
-            raw = json.dumps(payload).encode("utf-8")
-            self.send_response(status_code)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(raw)))
-            self.end_headers()
-            self.wfile.write(raw)
+            self._write_raw(status_code, _json(payload))
+
+        def _write_raw(self, status_code: int, raw: bytes) -> None:
+            # Same status line and headers send_response/send_header/end_headers would produce, built as bytes
+            # and sent together with the body in one write.
+            reason = _REASONS.get(status_code)
+            if reason is None:
+                reason = _REASONS[status_code] = self.responses.get(status_code, ("",))[0].encode("latin-1")
+            head = b"%s %d %s\r\nServer: %s\r\nDate: %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n" % (
+                self.protocol_version.encode("latin-1"),
+                status_code,
+                reason,
+                self.version_string().encode("latin-1"),
+                self.date_time_string().encode("latin-1"),
+                len(raw),
+            )
+            self.wfile.write(head + raw)
 
         def _read_json_body(self) -> dict[str, Any]:
+            return self._read_json_body_raw()[1]
+
+        def _read_json_body_raw(self) -> tuple[bytes | bytearray, dict[str, Any]]:
             content_length = int(self.headers.get("Content-Length", "0") or "0")
             if content_length <= 0:
                 raise RuntimeError("request body is required")
-            raw = self.rfile.read(content_length)
+            if content_length <= _SMALL_BODY:
+                raw: bytes | bytearray = self.rfile.read(content_length)
+            else:
+                # Large plans: fill one preallocated buffer instead of read() building and returning a new bytes.
+                raw = bytearray(content_length)
+                view = memoryview(raw)
+                filled = 0
+                while filled < content_length:
+                    n = self.rfile.readinto(view[filled:])
+                    if not n:
+                        break
+                    filled += n
+                view.release()
+                if filled < content_length:
+                    raise RuntimeError("request body truncated")
             try:
-                parsed = json.loads(raw.decode("utf-8"))
-            except json.JSONDecodeError as exc:
+                parsed = _json_loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
                 raise RuntimeError("request body must be valid JSON") from exc
             if not isinstance(parsed, dict):
                 raise RuntimeError("request body must be a JSON object")
-            return parsed
+            return raw, parsed
 
         def do_GET(self) -> None:  # noqa: N802
             if self.path == "/telemetry":
-                self._write_json(
-                    200,
-                    {
-                        "ok": True,
-                        "telemetry_snapshot": orchestrator.telemetry_snapshot(),
-                    },
-                )
+                gen = orchestrator._telemetry_gen
+                cached = telemetry_cache[0] if telemetry_cache else None
+                if cached is None or cached[0] != gen:
+                    cached = (
+                        gen,
+                        _json(
+                            {
+                                "ok": True,
+                                "telemetry_snapshot": orchestrator.telemetry_snapshot(),
+                            }
+                        ),
+                    )
+                    telemetry_cache[:] = [cached]
+                self._write_raw(200, cached[1])
                 return
 
             if self.path != "/status":
-                self._write_json(404, {"ok": False, "error": "not_found"})
+                self._write_raw(404, _NOT_FOUND_BODY)
                 return
 
-            nodes_summary: list[dict[str, Any]] = []
-            for node in orchestrator.nodes:
-                nodes_summary.append(
-                    {
-                        "alias": node.alias,
-                        "name": node.node_name or node.alias,
-                        "node_id": node.node_id or node.alias,
-                        "host": node.host,
-                        "port": node.port,
-                        "connected": node.sock is not None and node.running,
-                        "commands": [str(command.get("token", "")) for command in node.manifest.get("commands", [])],
-                        "services": node.manifest.get("services", {}) if isinstance(node.manifest.get("services"), dict) else {},
-                    }
-                )
+            # Besides the manifests, /status reports each node's live connection state.
+            key = (orchestrator._manifest_gen, tuple(node.sock is not None and node.running for node in orchestrator.nodes))
+            cached_status = status_cache[0] if status_cache else None
+            if cached_status is not None and cached_status[0] == key:
+                self._write_raw(200, cached_status[1])
+                return
 
-            self._write_json(
-                200,
+            nodes_summary = [
+                {
+                    "alias": node.alias,
+                    "name": node.node_name or node.alias,
+                    "node_id": node.node_id or node.alias,
+                    "host": node.host,
+                    "port": node.port,
+                    "connected": node.sock is not None and node.running,
+                    **orchestrator._manifest_summary(node),
+                }
+                for node in orchestrator.nodes
+            ]
+
+            raw = _json(
                 {
                     "ok": True,
                     "nodes": nodes_summary,
                     "system_manifest": orchestrator.merged_manifest(allow_reconnect=False),
-                },
+                }
             )
+            status_cache[:] = [(key, raw)]
+            self._write_raw(200, raw)
 
         def do_POST(self) -> None:  # noqa: N802
             if self.path == "/stop":
-                correlation_id = self.headers.get("X-Correlation-Id") or f"orch-{uuid.uuid4().hex[:12]}"
+                self._discard_body()
+                correlation_id = self.headers.get("X-Correlation-Id") or _new_correlation_id("orch")
                 _log_event("http.stop.request", correlation_id)
                 # Do NOT take execution_lock here. /stop must be able to interrupt even if
                 # a plan is currently running or a previous handler thread is wedged.
@@ -886,38 +1633,38 @@ def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
 
             if self.path == "/pi_vision_step":
                 try:
-                    body = self._read_json_body()
+                    raw, body = self._read_json_body_raw()
                     instruction = body.get("instruction")
                     if not isinstance(instruction, str) or not instruction.strip():
                         raise RuntimeError("instruction is required")
                     correlation_id = (
                         (body.get("correlation_id") if isinstance(body.get("correlation_id"), str) else None)
                         or self.headers.get("X-Correlation-Id")
-                        or f"orch-{uuid.uuid4().hex[:12]}"
+                        or _new_correlation_id("orch")
                     )
                     # If the client didn't include a system manifest, inject the orchestrator manifest.
+                    # Otherwise the body is forwarded exactly as received, without re-encoding it.
                     if not isinstance(body.get("system_manifest"), dict):
                         body["system_manifest"] = orchestrator.merged_manifest(allow_reconnect=False)
-
-                    raw = json.dumps(body).encode("utf-8")
-                    req = urllib.request.Request(
+                        raw = _json(body)
+                    _log_event("http.pi_vision_step.request", correlation_id, url=pi_brain_url)
+                    status, resp_raw = _pooled_post(
                         pi_brain_url,
-                        data=raw,
-                        method="POST",
-                        headers={
+                        raw,
+                        {
                             "Content-Type": "application/json",
                             "X-Correlation-Id": correlation_id,
                         },
+                        timeout=3.0,
                     )
-                    _log_event("http.pi_vision_step.request", correlation_id, url=pi_brain_url)
-                    with urllib.request.urlopen(req, timeout=3.0) as resp:
-                        resp_raw = resp.read()
-                        try:
-                            payload = json.loads(resp_raw.decode("utf-8"))
-                        except json.JSONDecodeError as exc:
-                            raise RuntimeError("pi brain returned invalid JSON") from exc
-                        if not isinstance(payload, dict):
-                            raise RuntimeError("pi brain returned non-object JSON")
+                    if status != 200:
+                        raise urllib.error.URLError(f"HTTP Error {status}")
+                    try:
+                        payload = _json_loads(resp_raw)
+                    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                        raise RuntimeError("pi brain returned invalid JSON") from exc
+                    if not isinstance(payload, dict):
+                        raise RuntimeError("pi brain returned non-object JSON")
                 except urllib.error.URLError as exc:
                     _log_event("http.pi_vision_step.error", correlation_id if "correlation_id" in locals() else None, error=str(exc))
                     self._write_json(
@@ -950,12 +1697,16 @@ def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
                     plan = body.get("plan")
                     if not isinstance(plan, list):
                         raise RuntimeError("plan must be a list")
+                    pipeline = body.get("pipeline") is True
                     correlation_id = (
                         (body.get("correlation_id") if isinstance(body.get("correlation_id"), str) else None)
                         or self.headers.get("X-Correlation-Id")
-                        or f"orch-{uuid.uuid4().hex[:12]}"
+                        or _new_correlation_id("orch")
                     )
-                    _log_event("http.execute_plan.request", correlation_id, plan_len=len(plan), plan=plan)
+                    if _LOG_VERBOSE:
+                        _log_event("http.execute_plan.request", correlation_id, plan_len=len(plan), plan=plan)
+                    else:
+                        _log_event("http.execute_plan.request", correlation_id, plan_len=len(plan))
 
                     # Fail fast if we're already executing a plan. Blocking here causes callers
                     # to time out and makes the system look "dead" even though /status works.
@@ -970,8 +1721,8 @@ def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
                         )
                         return
                     try:
-                        orchestrator.validate_plan(plan, correlation_id=correlation_id)
-                        orchestrator.execute_plan(plan, correlation_id=correlation_id)
+                        resolved = orchestrator.validate_plan(plan, correlation_id=correlation_id)
+                        orchestrator.execute_plan(resolved, correlation_id=correlation_id, pipeline=pipeline)
                     finally:
                         try:
                             execution_lock.release()
@@ -992,11 +1743,17 @@ def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
                 self._write_json(200, {"ok": True, "correlation_id": correlation_id})
                 return
 
-            self._write_json(404, {"ok": False, "error": "not_found"})
+            self._discard_body()
+            self._write_raw(404, _NOT_FOUND_BODY)
 
+        # Responses go out through _write_raw, so these only fire on stdlib error paths (send_error on a
+        # malformed request line); log_request would otherwise format the request line before discarding it.
         def log_message(self, format: str, *args: Any) -> None:
             return
 
+        def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+            return
+
     def _status_ok(h: str, p: int) -> bool:
         try:
             url = f"http://{h}:{p}/status"
@@ -1010,7 +1767,7 @@ def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
             return False
 
     try:
-        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        server = _BridgeServer((host, port), Handler)
     except OSError as exc:
         # Improve UX: if the requested port is already in use, fall back to an ephemeral port
         # instead of crashing (common when an old orchestrator instance is still running).
@@ -1020,7 +1777,7 @@ def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
                 print(f"info: orchestrator already listening on http://{host}:{port}; reusing existing instance")
                 return
             print(f"warning: http port {port} already in use; falling back to an ephemeral port")
-            server = http.server.ThreadingHTTPServer((host, 0), Handler)
+            server = _BridgeServer((host, 0), Handler)
         else:
             raise
 
@@ -1032,7 +1789,15 @@ def run_http_bridge(orchestrator: Orchestrator, host: str, port: int) -> None:
         server.server_close()
 
 
+_REPL_EXIT = frozenset({"exit", "quit"})
+
+
 def repl(orchestrator: Orchestrator, planner_url: str | None) -> None:
+    try:
+        # Importing readline gives input() line editing and in-session history (not available on Windows).
+        import readline  # noqa: F401
+    except ImportError:
+        pass
     print("orchestrator ready. Type instructions, 'stop' for emergency stop, 'exit' to quit.")
     while True:
         try:
@@ -1051,21 +1816,22 @@ def repl(orchestrator: Orchestrator, planner_url: str | None) -> None:
 
         if not line:
             continue
-        if line.lower() in {"exit", "quit"}:
+        low = line.lower()
+        if low in _REPL_EXIT:
             break
-        if line.lower() == "stop":
+        if low == "stop":
             orchestrator.emergency_stop()
             print("global stop sent")
             continue
 
-        correlation_id = f"repl-{uuid.uuid4().hex[:12]}"
+        correlation_id = _new_correlation_id("repl")
         planned = make_plan(line, orchestrator, planner_url, correlation_id=correlation_id)
         plan = planned.get("plan", [])
         print(json.dumps(planned, indent=2))
 
         try:
-            orchestrator.validate_plan(plan, correlation_id=correlation_id)
-            orchestrator.execute_plan(plan, correlation_id=correlation_id)
+            resolved = orchestrator.validate_plan(plan, correlation_id=correlation_id)
+            orchestrator.execute_plan(resolved, correlation_id=correlation_id)
             print("plan executed")
         except Exception as exc:
             print(f"execution error: {exc}")
@@ -1076,6 +1842,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--node", action="append", required=True, help="Node endpoint as alias=host:port")
     parser.add_argument("--planner-url", default=None, help="Remote planner URL (e.g. https://.../plan)")
     parser.add_argument("--telemetry", action="store_true", help="Subscribe to node telemetry and print it")
+    parser.add_argument(
+        "--quiet-telemetry", action="store_true", help="Keep telemetry snapshots updated but don't print each line"
+    )
     parser.add_argument("--instruction", default=None, help="One-shot instruction (non-interactive)")
     parser.add_argument("--step-timeout", type=float, default=4.0, help="Per-step RUN/STOP response timeout (seconds)")
     parser.add_argument("--timeout", type=float, default=7.0, help="Node connect/HELLO timeout (seconds)")
@@ -1090,18 +1859,24 @@ def main() -> None:
     if args.http_port is not None and args.instruction:
         raise RuntimeError("Use either --instruction one-shot mode or --http-port bridge mode, not both.")
 
-    orchestrator = Orchestrator(nodes=nodes, telemetry=args.telemetry, timeout_s=args.timeout, step_timeout_s=args.step_timeout)
+    orchestrator = Orchestrator(
+        nodes=nodes,
+        telemetry=args.telemetry,
+        timeout_s=args.timeout,
+        step_timeout_s=args.step_timeout,
+        echo_telemetry=not args.quiet_telemetry,
+    )
     try:
         orchestrator.connect_all()
         if args.http_port is not None:
             run_http_bridge(orchestrator, args.http_host, args.http_port)
         elif args.instruction:
-            correlation_id = f"cli-{uuid.uuid4().hex[:12]}"
+            correlation_id = _new_correlation_id("cli")
             planned = make_plan(args.instruction, orchestrator, args.planner_url, correlation_id=correlation_id)
             plan = planned.get("plan", [])
             print(json.dumps(planned, indent=2))
-            orchestrator.validate_plan(plan, correlation_id=correlation_id)
-            orchestrator.execute_plan(plan, correlation_id=correlation_id)
+            resolved = orchestrator.validate_plan(plan, correlation_id=correlation_id)
+            orchestrator.execute_plan(resolved, correlation_id=correlation_id)
             print("plan executed")
         else:
             repl(orchestrator, args.planner_url)
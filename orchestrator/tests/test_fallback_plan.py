@@ -1,3 +1,5 @@
+import socket
+import threading
 import unittest
 from pathlib import Path
 import sys
@@ -63,6 +65,23 @@ class TokenCollisionTests(unittest.TestCase):
         self.assertIs(orchestrator.resolve_node("base", "SET"), base)
         self.assertIs(orchestrator.resolve_node("arm", "SET"), arm)
 
+    def test_token_listed_twice_on_one_node_still_resolves(self):
+        base = NodeInfo(alias="base", host="127.0.0.1", port=7777)
+        arm = NodeInfo(alias="arm", host="127.0.0.1", port=7778)
+        base.manifest = {
+            "commands": [{"token": "FWD"}, {"token": "FWD"}],
+            "device": {"name": "base", "node_id": "base-1"},
+        }
+        arm.manifest = {"commands": [{"token": "HOME"}], "device": {"name": "arm", "node_id": "arm-1"}}
+        base.node_name = "base"
+        arm.node_name = "arm"
+
+        orchestrator = Orchestrator(nodes=[base, arm])
+        orchestrator._build_catalogs()
+
+        self.assertIs(orchestrator.resolve_node(None, "FWD"), base)
+        self.assertIs(orchestrator.resolve_node(None, "home"), arm)
+
     def test_validate_plan_requires_target_for_ambiguous_token(self):
         base = NodeInfo(alias="base", host="127.0.0.1", port=7777)
         drone = NodeInfo(alias="drone", host="127.0.0.1", port=7778)
@@ -161,5 +180,138 @@ class DeterminismTests(unittest.TestCase):
         self.assertTrue(all(step.get("target") == "base" for step in run_steps))
 
 
+class ParallelStepTests(unittest.TestCase):
+    def make_orchestrator(self) -> Orchestrator:
+        base = NodeInfo(alias="base", host="127.0.0.1", port=7777)
+        arm = NodeInfo(alias="arm", host="127.0.0.1", port=7778)
+        base.manifest = {"commands": [{"token": "FWD", "args": []}], "device": {"name": "base", "node_id": "base-1"}}
+        arm.manifest = {"commands": [{"token": "HOME", "args": []}], "device": {"name": "arm", "node_id": "arm-1"}}
+        base.node_name = "base"
+        arm.node_name = "arm"
+        orchestrator = Orchestrator(nodes=[base, arm])
+        orchestrator._build_catalogs()
+        # No live nodes here; keep validate_plan from trying to reconnect them.
+        orchestrator.maybe_reconnect_disconnected = lambda *args, **kwargs: None
+        return orchestrator
+
+    def test_parallel_steps_on_same_node_are_rejected(self):
+        orchestrator = self.make_orchestrator()
+        with self.assertRaisesRegex(RuntimeError, "parallel steps must target different nodes"):
+            orchestrator.validate_plan(
+                [
+                    {"type": "RUN", "target": "base", "token": "FWD", "args": [], "parallel": True},
+                    {"type": "RUN", "target": "base", "token": "FWD", "args": [], "parallel": True},
+                ]
+            )
+
+    def test_parallel_group_runs_concurrently(self):
+        orchestrator = self.make_orchestrator()
+        resolved = orchestrator.validate_plan(
+            [
+                {"type": "RUN", "target": "base", "token": "FWD", "args": [], "parallel": True},
+                {"type": "RUN", "target": "arm", "token": "HOME", "args": [], "parallel": True},
+            ]
+        )
+        # Both steps must be in flight at once for the barrier to release.
+        barrier = threading.Barrier(2, timeout=2.0)
+        ran: list[str] = []
+
+        def fake_run_step(step, correlation_id=None):
+            barrier.wait()
+            ran.append(step.token)
+
+        orchestrator.run_step = fake_run_step
+        orchestrator.execute_plan(resolved)
+        self.assertEqual(sorted(ran), ["FWD", "HOME"])
+
+
+class PipelinedStepTests(unittest.TestCase):
+    def make_orchestrator(self, tokens: list[str]) -> tuple[Orchestrator, NodeInfo, socket.socket]:
+        base = NodeInfo(alias="base", host="127.0.0.1", port=7777)
+        base.manifest = {
+            "commands": [{"token": token, "args": []} for token in tokens],
+            "device": {"name": "base", "node_id": "base-1"},
+        }
+        orchestrator = Orchestrator(nodes=[base], step_timeout_s=1.0)
+        orchestrator._build_catalogs()
+        orchestrator.maybe_reconnect_disconnected = lambda *args, **kwargs: None
+        local, peer = socket.socketpair()
+        self.addCleanup(local.close)
+        self.addCleanup(peer.close)
+        base.sock = local
+        base.running = True
+        return orchestrator, base, peer
+
+    def serve_lines(self, peer: socket.socket, received: list[bytes]) -> threading.Thread:
+        # Answers one line at a time, like a node: ERR for GRIP, OK for everything else; exits after STOP.
+        def fake_node():
+            peer.settimeout(2.0)
+            buf = b""
+            while True:
+                while b"\n" not in buf:
+                    chunk = peer.recv(4096)
+                    if not chunk:
+                        return
+                    buf += chunk
+                line, buf = buf.split(b"\n", 1)
+                received.append(line)
+                peer.sendall(b"ERR BAD_ARGS jammed\n" if line == b"RUN GRIP" else b"OK\n")
+                if line == b"STOP":
+                    return
+
+        node_thread = threading.Thread(target=fake_node, daemon=True)
+        node_thread.start()
+        return node_thread
+
+    def test_err_mid_plan_stops_before_later_steps_by_default(self):
+        orchestrator, _base, peer = self.make_orchestrator(["FWD", "GRIP", "HOME"])
+        resolved = orchestrator.validate_plan(
+            [{"type": "RUN", "token": token, "args": []} for token in ("FWD", "GRIP", "HOME")]
+        )
+        received: list[bytes] = []
+        node_thread = self.serve_lines(peer, received)
+        with self.assertRaisesRegex(RuntimeError, r"step\[1\] failed: .*ERR BAD_ARGS jammed; panic STOP sent"):
+            orchestrator.execute_plan(resolved)
+        node_thread.join(timeout=2.0)
+        # HOME never reaches the node.
+        self.assertEqual(received, [b"RUN FWD", b"RUN GRIP", b"STOP"])
+
+    def test_err_mid_pipelined_batch_reports_failing_step(self):
+        orchestrator, _base, peer = self.make_orchestrator(["FWD", "GRIP", "HOME"])
+        resolved = orchestrator.validate_plan(
+            [{"type": "RUN", "token": token, "args": []} for token in ("FWD", "GRIP", "HOME")]
+        )
+        received: list[bytes] = []
+        node_thread = self.serve_lines(peer, received)
+        with self.assertRaisesRegex(RuntimeError, r"step\[1\] failed: .*ERR BAD_ARGS jammed; panic STOP sent"):
+            orchestrator.execute_plan(resolved, pipeline=True)
+        node_thread.join(timeout=2.0)
+        # Opting in means HOME was already sent with the batch and runs before the panic STOP.
+        self.assertEqual(received, [b"RUN FWD", b"RUN GRIP", b"RUN HOME", b"STOP"])
+
+    def test_same_node_steps_without_duration_share_one_round_trip(self):
+        orchestrator, _base, peer = self.make_orchestrator(["FWD", "HOME"])
+        resolved = orchestrator.validate_plan(
+            [
+                {"type": "RUN", "token": "FWD", "args": []},
+                {"type": "RUN", "token": "HOME", "args": []},
+            ]
+        )
+        received = bytearray()
+
+        def fake_node():
+            # Only reply once both lines are in: a step-at-a-time sender would time out waiting for OK.
+            peer.settimeout(2.0)
+            while received.count(b"\n") < 2:
+                received.extend(peer.recv(4096))
+            peer.sendall(b"OK\nOK\n")
+
+        node_thread = threading.Thread(target=fake_node, daemon=True)
+        node_thread.start()
+        orchestrator.execute_plan(resolved, pipeline=True)
+        node_thread.join(timeout=2.0)
+        self.assertEqual(bytes(received), b"RUN FWD\nRUN HOME\n")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -45,22 +45,28 @@ class RoundtripResult:
 def recv_line(sock: socket.socket, timeout_s: float) -> str:
     sock.settimeout(timeout_s)
     buf = bytearray()
+    chunk = bytearray(65536)
+    # Skipped lines advance pos instead of being deleted from the front of buf (a memmove of the rest each time).
+    pos = 0
     while True:
-        nl = buf.find(b"\n")
+        nl = buf.find(b"\n", pos)
         if nl >= 0:
-            raw = bytes(buf[:nl])
-            del buf[: nl + 1]
+            raw = buf[pos:nl]
+            pos = nl + 1
+            # Telemetry lines may show up if the node already had telemetry enabled.
+            if raw.startswith(b"TELEMETRY "):
+                continue
             line = raw.decode("utf-8", "replace").strip()
             if not line:
                 continue
-            # Telemetry lines may show up if the node already had telemetry enabled.
-            if line.startswith("TELEMETRY "):
-                continue
             return line
-        chunk = sock.recv(4096)
-        if not chunk:
+        if pos > 65536:
+            del buf[:pos]
+            pos = 0
+        n = sock.recv_into(chunk)
+        if not n:
             raise RuntimeError("peer closed connection")
-        buf.extend(chunk)
+        buf += memoryview(chunk)[:n]
 
 
 def request_line(host: str, port: int, request: str, timeout_s: float) -> str: